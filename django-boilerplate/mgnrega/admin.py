@@ -13,7 +13,14 @@ Following prompt_rules.md ADMIN rules:
 """
 
 from django.contrib import admin
-from .models import District, Performance, APIStatus
+from .models import (
+    District,
+    Performance,
+    StatePeriodAggregate,
+    APIStatus,
+    SyncState,
+    FailedRecord
+)
 
 
 @admin.register(District)
@@ -21,7 +28,8 @@ class DistrictAdmin(admin.ModelAdmin):
     list_display = ('name', 'code', 'state', 'population', 'createdAt')
     list_filter = ('state',)
     search_fields = ('name', 'code', 'state')
-    readonly_fields = ('id', 'createdAt', 'updatedAt')
+    # latestYear/latestMonth are derived from Performance by syncs
+    readonly_fields = ('id', 'createdAt', 'updatedAt', 'latestYear', 'latestMonth')
     ordering = ('state', 'name')
     
     fieldsets = (
@@ -33,7 +41,7 @@ class DistrictAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('Metadata', {
-            'fields': ('id', 'createdAt', 'updatedAt'),
+            'fields': ('id', 'latestYear', 'latestMonth', 'createdAt', 'updatedAt'),
             'classes': ('collapse',)
         }),
     )
@@ -77,6 +85,82 @@ class PerformanceAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(StatePeriodAggregate)
+class StatePeriodAggregateAdmin(admin.ModelAdmin):
+    list_display = (
+        'state',
+        'year',
+        'month',
+        'districtCount',
+        'avgPersonDays',
+        'avgHouseholdsWorked',
+        'avgTotalWages',
+        'updatedAt'
+    )
+    list_filter = ('year', 'month', 'state')
+    search_fields = ('state',)
+    # Derived from Performance; rebuild with rebuild_state_aggregates
+    readonly_fields = (
+        'id',
+        'state',
+        'year',
+        'month',
+        'districtCount',
+        'avgPersonDays',
+        'avgHouseholdsWorked',
+        'avgTotalWages',
+        'avgMaterialExpenditure',
+        'distribution',
+        'createdAt',
+        'updatedAt'
+    )
+    ordering = ('state', '-year', '-month')
+    
+    fieldsets = (
+        (None, {
+            'fields': ('state', 'year', 'month', 'districtCount')
+        }),
+        ('State Averages', {
+            'fields': (
+                'avgPersonDays',
+                'avgHouseholdsWorked',
+                'avgTotalWages',
+                'avgMaterialExpenditure'
+            )
+        }),
+        ('Distribution', {
+            'fields': ('distribution',),
+            'classes': ('collapse',)
+        }),
+        ('Metadata', {
+            'fields': ('id', 'createdAt', 'updatedAt'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def has_add_permission(self, request):
+        return False
+
+
+class PartitionRunInline(admin.TabularInline):
+    model = APIStatus
+    fk_name = 'parent'
+    fields = (
+        'source',
+        'status',
+        'recordsProcessed',
+        'recordsFailed',
+        'message',
+        'updatedAt'
+    )
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+    show_change_link = True
+    verbose_name = 'Partition Run'
+    verbose_name_plural = 'Partition Runs'
+
+
 @admin.register(APIStatus)
 class APIStatusAdmin(admin.ModelAdmin):
     list_display = (
@@ -86,6 +170,8 @@ class APIStatusAdmin(admin.ModelAdmin):
         'recordsProcessed',
         'recordsFailed',
         'success_rate_display',
+        'wall_time_display',
+        'throughput_display',
         'createdAt'
     )
     list_filter = ('status', 'source')
@@ -93,20 +179,42 @@ class APIStatusAdmin(admin.ModelAdmin):
     readonly_fields = (
         'id',
         'createdAt',
-        'success_rate_display'
+        'success_rate_display',
+        'wall_time_display',
+        'throughput_display'
     )
     ordering = ('-createdAt',)
+    raw_id_fields = ('parent',)
+    inlines = (PartitionRunInline,)
     
     fieldsets = (
         (None, {
-            'fields': ('source', 'status', 'lastFetched')
+            'fields': ('source', 'status', 'lastFetched', 'parent')
         }),
         ('Results', {
             'fields': (
                 'recordsProcessed',
                 'recordsFailed',
                 'success_rate_display',
-                'message'
+                'message',
+                'errorSummary'
+            )
+        }),
+        ('Write Stats', {
+            'fields': (
+                'recordsCreated',
+                'recordsUpdated',
+                'recordsUnchanged',
+                'chunkStats',
+                'checkpoint'
+            ),
+            'classes': ('collapse',)
+        }),
+        ('Run Metrics', {
+            'fields': (
+                'wall_time_display',
+                'throughput_display',
+                'syncMetrics'
             )
         }),
         ('Metadata', {
@@ -119,3 +227,86 @@ class APIStatusAdmin(admin.ModelAdmin):
         """Display success rate as formatted percentage"""
         return f"{obj.success_rate:.2f}%"
     success_rate_display.short_description = 'Success Rate'
+    
+    def wall_time_display(self, obj):
+        """Display the run's wall time"""
+        seconds = (obj.syncMetrics or {}).get('wallSeconds')
+        if seconds is None:
+            return '-'
+        minutes, seconds = divmod(int(seconds), 60)
+        return f"{minutes}m {seconds:02d}s"
+    wall_time_display.short_description = 'Wall Time'
+    
+    def throughput_display(self, obj):
+        """Display the run's throughput in records per second"""
+        rate = (obj.syncMetrics or {}).get('recordsPerSecond')
+        if rate is None:
+            return '-'
+        return f"{rate:,.0f} rec/s"
+    throughput_display.short_description = 'Throughput'
+
+
+@admin.register(SyncState)
+class SyncStateAdmin(admin.ModelAdmin):
+    list_display = (
+        'source',
+        'lastYear',
+        'lastMonth',
+        'upstreamUpdated',
+        'lastSyncedAt'
+    )
+    search_fields = ('source',)
+    readonly_fields = ('id', 'createdAt', 'updatedAt')
+    ordering = ('source',)
+    
+    fieldsets = (
+        (None, {
+            'fields': ('source',)
+        }),
+        ('High-Water Mark', {
+            'fields': (
+                'lastYear',
+                'lastMonth',
+                'upstreamUpdated',
+                'lastSyncedAt'
+            )
+        }),
+        ('Metadata', {
+            'fields': ('id', 'createdAt', 'updatedAt'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
+@admin.register(FailedRecord)
+class FailedRecordAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'districtCode',
+        'stage',
+        'status',
+        'attempts',
+        'apiStatusId',
+        'createdAt'
+    )
+    list_filter = ('status', 'stage')
+    search_fields = ('districtCode',)
+    readonly_fields = ('id', 'createdAt', 'updatedAt', 'payloadHash')
+    raw_id_fields = ('apiStatusId',)
+    ordering = ('-createdAt',)
+    
+    fieldsets = (
+        (None, {
+            'fields': ('districtCode', 'stage', 'status', 'apiStatusId')
+        }),
+        ('Record', {
+            'fields': ('payload', 'errors')
+        }),
+        ('Reprocessing', {
+            'fields': ('attempts', 'resolvedAt')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'payloadHash', 'createdAt', 'updatedAt'),
+            'classes': ('collapse',)
+        }),
+    )
@@ -9,3 +9,7 @@ class MgnregaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'mgnrega'
     verbose_name = 'MGNREGA Performance Data'
+
+    def ready(self):
+        # District changes bump the read caches' data versions
+        from mgnrega import signals  # noqa: F401
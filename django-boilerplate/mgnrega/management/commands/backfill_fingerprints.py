@@ -0,0 +1,65 @@
+"""
+Management command to backfill Performance.fingerprint.
+
+Rows stored before the fingerprint column existed have none, so the
+first sync after the upgrade would see every one of them as changed and
+rewrite it. Run this once after migrating: it fills in the missing
+fingerprints from the stored metric fields, in batches, without
+touching updatedAt (so no state aggregates are rebuilt for it).
+
+Usage:
+    python manage.py backfill_fingerprints
+    python manage.py backfill_fingerprints --batch-size 20000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from mgnrega.models import Performance
+from utils.mgnrega_fetcher import MGNREGADataFetcher
+
+
+class Command(BaseCommand):
+    help = 'Fill in the fingerprint of Performance rows that have none'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows updated per transaction (default: 5000)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        missing = Performance.objects.filter(fingerprint__isnull=True).order_by('id')
+
+        filled = 0
+        last_id = 0
+        while True:
+            batch = list(
+                missing.filter(id__gt=last_id).values_list(
+                    'id', *MGNREGADataFetcher.METRIC_FIELDS
+                )[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            # bulk_update leaves updatedAt (auto_now) alone
+            rows = [
+                Performance(
+                    id=performance_id,
+                    fingerprint=Performance.compute_fingerprint(*metrics)
+                )
+                for performance_id, *metrics in batch
+            ]
+            with transaction.atomic():
+                Performance.objects.bulk_update(rows, ['fingerprint'])
+            filled += len(rows)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Backfilled {filled} fingerprints in '
+            f'{time.monotonic() - started:.1f}s'
+        ))
@@ -0,0 +1,336 @@
+"""
+Management command to benchmark MGNREGA ingestion end to end.
+
+Starts a local fake data.gov.in server (utils/mgnrega_fake_api.py) with
+synthetic records, runs MGNREGADataFetcher against it and reports
+records/s, time per stage, DB statements and peak memory. The first run
+inserts every record; later runs measure the unchanged-data path.
+
+Benchmark runs are tracked in APIStatus under the 'benchmark/mgnrega'
+source, so results can be compared run over run. The synthetic
+districts belong to their own states ('BENCH Bihar', ...), so runs
+never mix into the aggregates of real states; they and their
+performance rows are deleted afterwards unless --keep is given.
+
+Usage:
+    python manage.py benchmark_ingestion
+    python manage.py benchmark_ingestion --districts 100 --years 3 --runs 1
+    python manage.py benchmark_ingestion --latency 0.2 --error-rate 0.02
+    python manage.py benchmark_ingestion --backend orm --json
+    python manage.py benchmark_ingestion --min-records-per-second 2000 --max-db-statements 5000
+"""
+
+import json
+import tempfile
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from mgnrega.models import District, Performance, SyncState
+from utils.data_version import bump_data_version
+from utils.mgnrega_fake_api import FakeDataGovProcess
+from utils.mgnrega_fetcher import MGNREGADataFetcher
+from utils.state_aggregates import rebuild_state_aggregates
+from utils.synthetic_data import (
+    NATIONAL_DISTRICTS,
+    NATIONAL_YEARS,
+    synthetic_districts
+)
+
+BENCHMARK_SOURCE = 'benchmark/mgnrega'
+BENCHMARK_PREFIX = 'BENCH'
+
+
+class BenchmarkFetcher(MGNREGADataFetcher):
+    """Fetcher tracked under its own source, pointed at the fake server."""
+    SOURCE = BENCHMARK_SOURCE
+
+
+class Command(BaseCommand):
+    help = 'Benchmark MGNREGA ingestion against a local fake data.gov.in server'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--districts',
+            type=int,
+            default=NATIONAL_DISTRICTS,
+            help=f'Synthetic districts (default: {NATIONAL_DISTRICTS}, national scale)',
+        )
+        parser.add_argument(
+            '--years',
+            type=int,
+            default=NATIONAL_YEARS,
+            help=f'Years of monthly records per district (default: {NATIONAL_YEARS})',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=2,
+            help='Full syncs to run; runs after the first find every record unchanged (default: 2)',
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            help='Records requested per page (default: settings.MGNREGA_PAGE_SIZE)',
+        )
+        parser.add_argument(
+            '--max-page-size',
+            type=int,
+            default=1000,
+            help='Largest page the fake server returns (default: 1000)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Pages fetched in parallel (default: settings.MGNREGA_FETCH_CONCURRENCY)',
+        )
+        parser.add_argument(
+            '--backend',
+            choices=MGNREGADataFetcher.BACKENDS,
+            help='Write backend (default: settings.MGNREGA_WRITE_BACKEND)',
+        )
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.05,
+            help='Seconds of server latency per request (default: 0.05)',
+        )
+        parser.add_argument(
+            '--jitter',
+            type=float,
+            default=0.0,
+            help='Extra random seconds of latency per request',
+        )
+        parser.add_argument(
+            '--error-rate',
+            type=float,
+            default=0.0,
+            help='Share of requests the server answers with a 503 (0-1)',
+        )
+        parser.add_argument(
+            '--max-retries',
+            type=int,
+            default=10,
+            help='Resumes of a failed run before giving up (default: 10)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the synthetic data and injected errors',
+        )
+        parser.add_argument(
+            '--trace-memory',
+            action='store_true',
+            help='Also report peak Python heap via tracemalloc (slows the run down)',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Keep the synthetic districts and performance rows',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the run reports as JSON',
+        )
+        parser.add_argument(
+            '--min-records-per-second',
+            type=float,
+            help='Fail if any run is slower than this',
+        )
+        parser.add_argument(
+            '--max-db-statements',
+            type=int,
+            help='Fail if any run issues more DB statements than this',
+        )
+        parser.add_argument(
+            '--max-peak-rss-mb',
+            type=float,
+            help='Fail if peak RSS exceeds this many MB',
+        )
+
+    def handle(self, *args, **options):
+        districts = synthetic_districts(
+            options['districts'], options['seed'], BENCHMARK_PREFIX
+        )
+        District.objects.bulk_create(
+            [
+                District(**{
+                    **district,
+                    'state': f'{BENCHMARK_PREFIX} {district["state"]}'
+                })
+                for district in districts
+            ],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
+
+        server_options = {
+            'districts': options['districts'],
+            'years': options['years'],
+            'max_page_size': options['max_page_size'],
+            'latency': options['latency'],
+            'jitter': options['jitter'],
+            'error_rate': options['error_rate'],
+            'seed': options['seed'],
+            'prefix': BENCHMARK_PREFIX,
+        }
+        expected = options['districts'] * options['years'] * 12
+        if not options['json']:
+            self.stdout.write(
+                f'Benchmarking ingestion of {expected} synthetic records '
+                f'({options["districts"]} districts x {options["years"]} '
+                f'years), {options["runs"]} run(s)...\n'
+            )
+
+        reports = []
+        try:
+            with tempfile.TemporaryDirectory() as cache_dir, \
+                    override_settings(MGNREGA_PAGE_CACHE_DIR=cache_dir), \
+                    FakeDataGovProcess(**server_options) as url:
+                BenchmarkFetcher.API_BASE_URL = url
+                for run in range(1, options['runs'] + 1):
+                    report = self._run(run, options)
+                    reports.append(report)
+                    if not options['json']:
+                        self._print_report(report)
+        finally:
+            if not options['keep']:
+                self._cleanup()
+
+        if options['json']:
+            self.stdout.write(json.dumps(reports, indent=2))
+
+        breaches = [
+            breach for report in reports
+            for breach in self._check_thresholds(report, options)
+        ]
+        if breaches:
+            raise CommandError(
+                'Benchmark thresholds exceeded:\n  ' + '\n  '.join(breaches)
+            )
+
+    def _run(self, run, options):
+        """Run one full sync, resuming it after injected failures."""
+        fetcher_options = {
+            'page_size': options.get('page_size'),
+            'concurrency': options.get('concurrency'),
+            'backend': options.get('backend'),
+        }
+
+        if options['trace_memory']:
+            tracemalloc.start()
+        try:
+            fetcher = BenchmarkFetcher(full=True, **fetcher_options)
+            result = fetcher.fetch_and_sync()
+            resumes = 0
+            # Only failure results are retryable
+            while result.get('retryable') and resumes < options['max_retries']:
+                resumes += 1
+                result = BenchmarkFetcher(
+                    resume=True, **fetcher_options
+                ).fetch_and_sync()
+            heap_peak = None
+            if options['trace_memory']:
+                heap_peak = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+        finally:
+            if options['trace_memory']:
+                tracemalloc.stop()
+
+        if result.get('status') == 'failure':
+            raise CommandError(f'Benchmark run {run} failed: {result["message"]}')
+
+        metrics = result['metrics']
+        records = metrics['records']
+        return {
+            'run': run,
+            'processed': result['processed'],
+            'failed': result['failed'],
+            'created': result['created'],
+            'updated': result['updated'],
+            'unchanged': result['unchanged'],
+            'backend': fetcher.backend,
+            'pageSize': fetcher.page_size,
+            'dbStatementsPer1kRecords': (
+                round(metrics['dbStatements'] * 1000 / records, 1)
+                if records else None
+            ),
+            'peakHeapMb': heap_peak,
+            **metrics,
+        }
+
+    def _print_report(self, report):
+        self.stdout.write(self.style.SUCCESS(
+            f'Run {report["run"]} ({report["backend"]} writes, page size '
+            f'{report["pageSize"]}): {report["records"]} records in '
+            f'{report["wallSeconds"]:.1f}s = '
+            f'{report["recordsPerSecond"] or 0:,.0f} records/s'
+        ))
+        self.stdout.write(
+            f'  Created: {report["created"]}, Updated: {report["updated"]}, '
+            f'Unchanged: {report["unchanged"]}, Failed: {report["failed"]}'
+        )
+        self.stdout.write(
+            '  Stages: ' + ', '.join(
+                f'{stage} {seconds:.1f}s'
+                for stage, seconds in report['stages'].items()
+            )
+        )
+        self.stdout.write(
+            f'  DB statements: {report["dbStatements"]} '
+            f'({report["dbStatementsPer1kRecords"]} per 1k records)'
+        )
+        self.stdout.write(
+            f'  Downloaded: {report["bytesDownloaded"] / 1024 / 1024:.1f} MB '
+            f'in {report["pagesDownloaded"]} pages, '
+            f'{report["retries"]} retries'
+        )
+        memory = f'  Peak RSS: {report["peakRssMb"]} MB'
+        if report['peakHeapMb'] is not None:
+            memory += f', peak Python heap: {report["peakHeapMb"]} MB'
+        self.stdout.write(memory + '\n')
+
+    def _check_thresholds(self, report, options):
+        breaches = []
+        rate = report['recordsPerSecond'] or 0
+        min_rate = options.get('min_records_per_second')
+        if min_rate is not None and rate < min_rate:
+            breaches.append(
+                f'run {report["run"]}: {rate:,.0f} records/s < {min_rate:,.0f}'
+            )
+        max_statements = options.get('max_db_statements')
+        if max_statements is not None and report['dbStatements'] > max_statements:
+            breaches.append(
+                f'run {report["run"]}: {report["dbStatements"]} DB statements '
+                f'> {max_statements}'
+            )
+        max_rss = options.get('max_peak_rss_mb')
+        if max_rss is not None and (report['peakRssMb'] or 0) > max_rss:
+            breaches.append(
+                f'run {report["run"]}: peak RSS {report["peakRssMb"]} MB > '
+                f'{max_rss} MB'
+            )
+        return breaches
+
+    def _cleanup(self):
+        """
+        Delete the synthetic districts, their rows and sync state, then
+        rebuild the aggregates they fed (dropping the emptied ones) and
+        publish the change.
+        """
+        prefix = f'{BENCHMARK_PREFIX}-'
+        performances = Performance.objects.filter(
+            districtId__code__startswith=prefix
+        )
+        state_periods = set(
+            performances.values_list(
+                'districtId__state', 'year', 'month'
+            ).distinct()
+        )
+        performances.delete()
+        District.objects.filter(code__startswith=prefix).delete()
+        SyncState.objects.filter(source=BENCHMARK_SOURCE).delete()
+
+        rebuild_state_aggregates(state_periods)
+        bump_data_version({state for state, _, _ in state_periods})
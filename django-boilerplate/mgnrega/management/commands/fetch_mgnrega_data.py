@@ -4,11 +4,25 @@ Management command to fetch MGNREGA data manually.
 Usage:
     python manage.py fetch_mgnrega_data
     python manage.py fetch_mgnrega_data --create-sample-districts
+    python manage.py fetch_mgnrega_data --page-size 500 --offset 10000
+    python manage.py fetch_mgnrega_data --concurrency 8
+    python manage.py fetch_mgnrega_data --full
+    python manage.py fetch_mgnrega_data --from-file dump.ndjson.gz
+    python manage.py fetch_mgnrega_data --from-file dump.txt --format csv
+    python manage.py fetch_mgnrega_data --full --backend copy
+    python manage.py fetch_mgnrega_data --resume
+    python manage.py fetch_mgnrega_data --full --partition-by state
+    python manage.py fetch_mgnrega_data --wait
+    python manage.py fetch_mgnrega_data --districts-file districts.csv
 """
 
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from mgnrega.tasks import fetch_mgnrega_data_task
+from utils.district_sync import sync_district_master, sync_districts_file
 from utils.mgnrega_fetcher import MGNREGADataFetcher, create_sample_districts
+from utils.mgnrega_file_reader import FORMATS
+from utils.sync_lock import SyncLock
 
 
 class Command(BaseCommand):
@@ -25,6 +39,72 @@ class Command(BaseCommand):
             type=str,
             help='API key for data.gov.in (if required)',
         )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            help='Records per API page (default: settings.MGNREGA_PAGE_SIZE)',
+        )
+        parser.add_argument(
+            '--offset',
+            type=int,
+            default=0,
+            help='Record offset to start fetching from',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Pages fetched in parallel (default: settings.MGNREGA_FETCH_CONCURRENCY)',
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Force a complete resync instead of an incremental one',
+        )
+        parser.add_argument(
+            '--lookback-months',
+            type=int,
+            help='Months before the high-water mark to re-fetch '
+                 '(default: settings.MGNREGA_SYNC_LOOKBACK_MONTHS)',
+        )
+        parser.add_argument(
+            '--from-file',
+            type=str,
+            help='Ingest a local dump file (optionally gzipped) instead of calling the API',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='Format of --from-file (default: inferred from the extension)',
+        )
+        parser.add_argument(
+            '--backend',
+            choices=MGNREGADataFetcher.BACKENDS,
+            help='Write backend: batched ORM upserts, PostgreSQL COPY + merge, '
+                 'or auto (default: settings.MGNREGA_WRITE_BACKEND)',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue the last interrupted run from its checkpoint',
+        )
+        parser.add_argument(
+            '--partition-by',
+            choices=MGNREGADataFetcher.PARTITIONS,
+            help='Dispatch the sync to Celery workers as state or year '
+                 'partitions instead of running it here',
+        )
+        parser.add_argument(
+            '--wait',
+            action='store_true',
+            help='If another sync is running, wait for it to finish '
+                 'instead of exiting',
+        )
+        parser.add_argument(
+            '--districts-file',
+            type=str,
+            help='Sync districts from this master file before fetching '
+                 '(default: settings.MGNREGA_DISTRICT_MASTER)',
+        )
     
     def handle(self, *args, **options):
         self.stdout.write(
@@ -61,18 +141,83 @@ class Command(BaseCommand):
                 )
                 return
         
+        # Partitioned syncs run on the Celery workers
+        if options.get('partition_by'):
+            task = fetch_mgnrega_data_task.delay(
+                full=options['full'],
+                resume=options['resume'],
+                partition_by=options['partition_by'],
+                wait_for_lock=options['wait']
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'✓ Partitioned sync by {options["partition_by"]} '
+                    f'dispatched (task {task.id}). Track it in APIStatus.\n'
+                )
+            )
+            return
+        
         # Initialize fetcher
         api_key = options.get('api_key')
-        fetcher = MGNREGADataFetcher(api_key=api_key)
+        fetcher = MGNREGADataFetcher(
+            api_key=api_key,
+            page_size=options.get('page_size'),
+            start_offset=options['offset'],
+            concurrency=options.get('concurrency'),
+            full=options['full'],
+            lookback_months=options.get('lookback_months'),
+            backend=options.get('backend'),
+            resume=options['resume']
+        )
         
         self.stdout.write(
             f'Start time: {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'
         )
-        self.stdout.write('Fetching data from data.gov.in API...\n')
+        from_file = options.get('from_file')
+        if from_file:
+            self.stdout.write(f'Ingesting data from {from_file}...\n')
+        else:
+            self.stdout.write('Fetching data from data.gov.in API...\n')
+        
+        # Only one sync may write at a time
+        lock = SyncLock(owner='manage.py fetch_mgnrega_data')
+        if not lock.acquire():
+            holder = lock.holder() or {}
+            running = (
+                f'{holder.get("owner", "unknown")} on '
+                f'{holder.get("host", "?")} since '
+                f'{holder.get("acquiredAt", "?")}'
+            )
+            if not options['wait']:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f'\n⚠ Another sync is running ({running}). '
+                        f'Skipping; use --wait to queue behind it.\n'
+                    )
+                )
+                return
+            
+            self.stdout.write(f'Waiting for running sync ({running})...')
+            lock.acquire(blocking=True)
         
         try:
+            # Bring District up to date before records reference it
+            if options.get('districts_file'):
+                districts = sync_districts_file(options['districts_file'])
+            else:
+                districts = sync_district_master()
+            if districts:
+                self.stdout.write(
+                    f'Districts synced: {districts["created"]} created, '
+                    f'{districts["updated"]} updated, '
+                    f'{len(districts["removed"])} not in master\n'
+                )
+            
             # Fetch and sync data
-            result = fetcher.fetch_and_sync()
+            if from_file:
+                result = fetcher.ingest_file(from_file, options.get('format'))
+            else:
+                result = fetcher.fetch_and_sync()
             
             # Display results
             self.stdout.write('\n' + '='*60)
@@ -85,6 +230,13 @@ class Command(BaseCommand):
                         f'\n✗ Fetch failed: {result["message"]}\n'
                     )
                 )
+                if result.get('retryable'):
+                    self.stdout.write(
+                        self.style.WARNING(
+                            'Committed batches were kept. Re-run with '
+                            '--resume to continue from the checkpoint.\n'
+                        )
+                    )
                 return
             
             # Success or partial success
@@ -102,6 +254,11 @@ class Command(BaseCommand):
                     f'✓ Processed successfully: {processed}'
                 )
             )
+            self.stdout.write(
+                f'  Created: {result["created"]}, '
+                f'Updated: {result["updated"]}, '
+                f'Unchanged: {result["unchanged"]}'
+            )
             
             if failed > 0:
                 self.stdout.write(
@@ -110,7 +267,12 @@ class Command(BaseCommand):
                     )
                 )
                 
-                # Show sample errors
+                # Show error counts by type, then a random sample
+                if result.get('errorsByType'):
+                    self.stdout.write('\nErrors by type:')
+                    for kind, count in list(result['errorsByType'].items())[:10]:
+                        self.stdout.write(f"  {count:>8}  {kind}")
+                
                 if result.get('errors'):
                     self.stdout.write('\nSample validation errors:')
                     for i, error in enumerate(result['errors'][:5], 1):
@@ -118,6 +280,23 @@ class Command(BaseCommand):
                             f"  {i}. {error['errors']}"
                         )
             
+            metrics = result.get('metrics')
+            if metrics:
+                stages = ', '.join(
+                    f"{stage} {seconds:.1f}s"
+                    for stage, seconds in metrics['stages'].items()
+                )
+                self.stdout.write(
+                    f"\nTimings: {metrics['wallSeconds']:.1f}s wall, {stages}"
+                )
+                self.stdout.write(
+                    f"  {metrics['recordsPerSecond'] or 0:,.0f} records/s, "
+                    f"{metrics['bytesDownloaded'] / 1024 / 1024:.1f} MB "
+                    f"downloaded, {metrics['dbStatements']} DB statements, "
+                    f"peak RSS {metrics['peakRssMb']} MB, "
+                    f"{metrics['retries']} retries"
+                )
+            
             self.stdout.write(
                 f'\nEnd time: '
                 f'{timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'
@@ -145,3 +324,6 @@ class Command(BaseCommand):
                 )
             )
             raise
+        
+        finally:
+            lock.release()
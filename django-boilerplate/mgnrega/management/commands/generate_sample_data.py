@@ -0,0 +1,206 @@
+"""
+Management command to generate a synthetic MGNREGA dataset.
+
+Creates deterministic synthetic districts and monthly performance rows
+(utils/synthetic_data.py) for load testing: every state, seasonal
+patterns and outlier months. Rows are written in chunks with COPY +
+merge on PostgreSQL, or batched bulk upserts elsewhere, so re-running
+with the same seed updates rows in place instead of duplicating them.
+Rows are built like the sync builds them (MGNREGADataFetcher). The
+state-period aggregates of the written and cleared rows are rebuilt
+afterwards.
+
+Scales:
+    small     40 districts, last 3 years (~1.4k rows)
+    state     75 districts of one state, 2006 to date (~18k rows)
+    national  741 districts, 2006 to date (~180k rows)
+    stress    3705 districts, 2006 to date (~900k rows)
+
+Usage:
+    python manage.py generate_sample_data
+    python manage.py generate_sample_data --scale national
+    python manage.py generate_sample_data --scale stress --seed 7 --clear
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from mgnrega.models import District, Performance
+from utils.data_version import bump_data_version
+from utils.mgnrega_copy_loader import copy_merge_performance, copy_supported
+from utils.mgnrega_fetcher import MGNREGADataFetcher
+from utils.mgnrega_file_reader import iter_batches
+from utils.state_aggregates import (
+    rebuild_state_aggregates,
+    refresh_state_aggregates
+)
+from utils.synthetic_data import (
+    FIRST_YEAR,
+    SCALES,
+    iter_synthetic_records,
+    synthetic_districts,
+    synthetic_periods
+)
+
+
+class Command(BaseCommand):
+    help = 'Generate a deterministic synthetic MGNREGA dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            choices=tuple(SCALES),
+            default='small',
+            help='Dataset size preset (default: small)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed; the same seed always generates the same data',
+        )
+        parser.add_argument(
+            '--start-year',
+            type=int,
+            help=f'First year of data (default: preset, >= {FIRST_YEAR})',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='SYN',
+            help='District code prefix of the synthetic districts (default: SYN)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows written per transaction (default: 5000)',
+        )
+        parser.add_argument(
+            '--backend',
+            choices=MGNREGADataFetcher.BACKENDS,
+            default=MGNREGADataFetcher.BACKEND_AUTO,
+            help="'copy' (PostgreSQL COPY + merge), 'orm' (bulk upserts) or 'auto'",
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete previously generated districts with this prefix first',
+        )
+
+    def handle(self, *args, **options):
+        preset = SCALES[options['scale']]
+        prefix = options['prefix']
+        now = timezone.now()
+
+        start_year = options.get('start_year')
+        if start_year is None:
+            start_year = (
+                now.year - preset['years'] + 1
+                if preset['years'] else FIRST_YEAR
+            )
+        if not FIRST_YEAR <= start_year <= now.year:
+            raise CommandError(
+                f'--start-year must be between {FIRST_YEAR} and {now.year}'
+            )
+
+        backend = options['backend']
+        if backend == MGNREGADataFetcher.BACKEND_AUTO:
+            backend = (
+                MGNREGADataFetcher.BACKEND_COPY if copy_supported()
+                else MGNREGADataFetcher.BACKEND_ORM
+            )
+        elif backend == MGNREGADataFetcher.BACKEND_COPY and not copy_supported():
+            raise CommandError('The COPY backend requires PostgreSQL')
+
+        started = time.monotonic()
+
+        # State-periods losing rows, rebuilt with those written below
+        cleared = set()
+        if options['clear']:
+            generated = Performance.objects.filter(
+                districtId__code__startswith=f'{prefix}-'
+            )
+            cleared = set(
+                generated.values_list(
+                    'districtId__state', 'year', 'month'
+                ).distinct()
+            )
+            deleted, _ = generated.delete()
+            District.objects.filter(code__startswith=f'{prefix}-').delete()
+            self.stdout.write(f'Cleared {deleted} generated performance rows')
+
+        districts = synthetic_districts(
+            preset['districts'],
+            options['seed'],
+            prefix,
+            preset['states']
+        )
+        periods = synthetic_periods(
+            start_year,
+            now.year - start_year + 1,
+            until=(now.year, now.month)
+        )
+        total = len(districts) * len(periods)
+
+        self.stdout.write(
+            f'Generating {options["scale"]} dataset: {len(districts)} '
+            f'districts x {len(periods)} months = {total} rows '
+            f'({backend} writes, seed {options["seed"]})...'
+        )
+
+        District.objects.bulk_create(
+            [District(**district) for district in districts],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
+        fetcher = MGNREGADataFetcher(backend=backend)
+        fetcher.district_ids = dict(
+            District.objects.filter(
+                code__in=[district['code'] for district in districts]
+            ).values_list('code', 'id')
+        )
+
+        written = 0
+        next_report = total // 10
+        records = iter_synthetic_records(districts, periods, options['seed'])
+        for batch in iter_batches(records, options['batch_size']):
+            rows = [fetcher._build_performance(record) for record in batch]
+            with transaction.atomic():
+                if backend == MGNREGADataFetcher.BACKEND_COPY:
+                    copy_merge_performance(rows)
+                else:
+                    Performance.objects.bulk_create(
+                        rows,
+                        batch_size=options['batch_size'],
+                        update_conflicts=True,
+                        unique_fields=['districtId', 'year', 'month'],
+                        update_fields=[
+                            *MGNREGADataFetcher.METRIC_FIELDS,
+                            'fingerprint',
+                            'updatedAt'
+                        ]
+                    )
+            written += len(rows)
+
+            if written >= next_report and written < total:
+                self.stdout.write(f'  {written}/{total} rows')
+                next_report += total // 10
+
+        state_periods = refresh_state_aggregates(now)
+        if cleared - state_periods:
+            rebuild_state_aggregates(cleared - state_periods)
+        state_periods |= cleared
+        states = {state for state, _, _ in state_periods}
+        District.objects.filter(state__in=states).refresh_latest_periods()
+        bump_data_version(states)
+        self.stdout.write(f'Rebuilt {len(state_periods)} state-period aggregates')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✓ Wrote {written} rows for {len(districts)} districts in '
+                f'{elapsed:.1f}s ({written / elapsed:,.0f} rows/s)'
+            )
+        )
@@ -0,0 +1,88 @@
+"""
+Management command to rebuild the state-period aggregates.
+
+Syncs rebuild the aggregates of the state-periods they touch; use this
+after loading data some other way, deleting districts, or to backfill
+the table (see utils/state_aggregates.py). The latest period of each
+rebuilt state's districts (District.latestYear/latestMonth) is
+refreshed too.
+
+Usage:
+    python manage.py rebuild_state_aggregates
+    python manage.py rebuild_state_aggregates --state "Uttar Pradesh"
+    python manage.py rebuild_state_aggregates --since 2025-01-01
+"""
+
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime, parse_date
+from mgnrega.models import District, StatePeriodAggregate
+from utils.data_version import bump_data_version
+from utils.state_aggregates import (
+    all_state_periods,
+    rebuild_state_aggregates,
+    touched_state_periods
+)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed state-period aggregates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--state',
+            help='Only rebuild this state',
+        )
+        parser.add_argument(
+            '--since',
+            help='Only rebuild state-periods with rows written since this '
+                 'date or datetime (ISO 8601)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+
+        if options.get('since'):
+            since = parse_datetime(options['since'])
+            if since is None:
+                day = parse_date(options['since'])
+                if day is None:
+                    raise CommandError(f'Invalid --since: {options["since"]}')
+                since = datetime.combine(day, datetime.min.time())
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            state_periods = touched_state_periods(since)
+            if options.get('state'):
+                state_periods = {
+                    key for key in state_periods if key[0] == options['state']
+                }
+        else:
+            state_periods = all_state_periods(options.get('state'))
+
+            # Full rebuild: drop aggregates whose data is gone
+            stale = StatePeriodAggregate.objects.all()
+            if options.get('state'):
+                stale = stale.filter(state=options['state'])
+            stale_ids = [
+                aggregate_id
+                for aggregate_id, *key in stale.values_list(
+                    'id', 'state', 'year', 'month'
+                )
+                if tuple(key) not in state_periods
+            ]
+            if stale_ids:
+                StatePeriodAggregate.objects.filter(id__in=stale_ids).delete()
+                self.stdout.write(f'Deleted {len(stale_ids)} stale aggregates')
+
+        written = rebuild_state_aggregates(state_periods)
+        states = {state for state, _, _ in state_periods}
+        District.objects.filter(state__in=states).refresh_latest_periods()
+        bump_data_version(states)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Rebuilt {written} state-period aggregates in '
+            f'{time.monotonic() - started:.1f}s'
+        ))
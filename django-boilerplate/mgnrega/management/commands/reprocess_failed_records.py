@@ -0,0 +1,126 @@
+"""
+Management command to reprocess dead-lettered MGNREGA records.
+
+Re-validates records kept in the FailedRecord table and bulk upserts the
+ones that now pass, e.g. after missing districts were added or a
+validation rule was fixed. No data is re-fetched from upstream.
+
+Usage:
+    python manage.py reprocess_failed_records
+    python manage.py reprocess_failed_records --district-code JH-RAN
+    python manage.py reprocess_failed_records --run 42 --stage validation
+    python manage.py reprocess_failed_records --batch-size 200 --wait
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from mgnrega.models import FailedRecord
+from utils.mgnrega_fetcher import MGNREGADataFetcher
+from utils.sync_lock import SyncLock
+
+
+class Command(BaseCommand):
+    help = 'Re-validate and upsert records from the failed records table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Records re-validated and upserted per transaction',
+        )
+        parser.add_argument(
+            '--district-code',
+            type=str,
+            help='Only reprocess records of this district code',
+        )
+        parser.add_argument(
+            '--run',
+            type=int,
+            help='Only reprocess records last rejected by this APIStatus id',
+        )
+        parser.add_argument(
+            '--stage',
+            choices=FailedRecord.StageChoices.values,
+            help='Only reprocess records rejected at this stage',
+        )
+        parser.add_argument(
+            '--wait',
+            action='store_true',
+            help='If a sync is running, wait for it to finish instead of exiting',
+        )
+
+    def handle(self, *args, **options):
+        queryset = FailedRecord.objects.filter(
+            status=FailedRecord.StatusChoices.PENDING
+        )
+        if options.get('district_code'):
+            queryset = queryset.filter(districtCode=options['district_code'])
+        if options.get('run'):
+            queryset = queryset.filter(apiStatusId=options['run'])
+        if options.get('stage'):
+            queryset = queryset.filter(stage=options['stage'])
+
+        pending = queryset.count()
+        if not pending:
+            self.stdout.write(
+                self.style.SUCCESS('✓ No pending failed records to reprocess\n')
+            )
+            return
+
+        # Reprocessing writes Performance rows like a sync does
+        lock = SyncLock(owner='manage.py reprocess_failed_records')
+        if not lock.acquire(blocking=options['wait']):
+            holder = lock.holder() or {}
+            self.stdout.write(
+                self.style.WARNING(
+                    f'⚠ A sync is running ({holder.get("owner", "unknown")} '
+                    f'since {holder.get("acquiredAt", "?")}). Skipping; use '
+                    f'--wait to queue behind it.\n'
+                )
+            )
+            return
+
+        self.stdout.write(
+            f'Start time: {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'
+        )
+        self.stdout.write(f'Reprocessing {pending} failed records...\n')
+
+        try:
+            result = MGNREGADataFetcher().reprocess_failed_records(
+                queryset=queryset,
+                batch_size=options['batch_size']
+            )
+        finally:
+            lock.release()
+
+        if result.get('status') == 'failure':
+            self.stdout.write(
+                self.style.ERROR(
+                    f'\n✗ Reprocessing failed: {result["message"]}\n'
+                )
+            )
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Resolved: {result["processed"]}')
+        )
+        self.stdout.write(
+            f'  Created: {result["created"]}, '
+            f'Updated: {result["updated"]}, '
+            f'Unchanged: {result["unchanged"]}'
+        )
+
+        if result['failed'] > 0:
+            self.stdout.write(
+                self.style.WARNING(f'⚠ Still failing: {result["failed"]}')
+            )
+            if result.get('errors'):
+                self.stdout.write('\nSample errors:')
+                for i, error in enumerate(result['errors'][:5], 1):
+                    self.stdout.write(f"  {i}. {error['errors']}")
+
+        self.stdout.write(
+            f'\nEnd time: '
+            f'{timezone.now().strftime("%Y-%m-%d %H:%M:%S")}\n'
+        )
@@ -0,0 +1,93 @@
+"""
+Management command to sync District from an official district master.
+
+Streams a CSV, JSON or NDJSON master (optionally gzipped) and diffs it
+against District in one pass: new districts are bulk-created, changed
+ones bulk-updated, and districts missing from the master are reported
+but kept (see utils/district_sync.py).
+
+Recognised columns: code/district_code, name/district_name,
+state/state_name, population, lat/latitude, lon/lng/longitude.
+
+Usage:
+    python manage.py sync_districts districts.csv
+    python manage.py sync_districts districts.json.gz --dry-run
+    python manage.py sync_districts master.txt --format csv --show-removed 50
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from utils.district_sync import sync_districts_file
+from utils.mgnrega_file_reader import FORMATS
+
+
+class Command(BaseCommand):
+    help = 'Sync districts from a CSV/JSON district master file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='District master file (optionally gzipped)',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='Format of the master (default: inferred from the extension)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the differences without writing them',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Districts per bulk write (default: 1000)',
+        )
+        parser.add_argument(
+            '--show-removed',
+            type=int,
+            default=10,
+            help='Codes listed of districts missing from the master (default: 10)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            result = sync_districts_file(
+                options['path'],
+                options.get('format'),
+                dry_run=options['dry_run'],
+                batch_size=options['batch_size']
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Cannot read district master: {e}')
+
+        verb = 'Would sync' if options['dry_run'] else 'Synced'
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {verb} districts: {result["created"]} created, '
+            f'{result["updated"]} updated, {result["unchanged"]} unchanged'
+        ))
+
+        for code, fields in list(result['changed'].items())[:10]:
+            self.stdout.write(f'  ~ {code}: {", ".join(fields)}')
+        if len(result['changed']) > 10:
+            self.stdout.write(f'  ... {len(result["changed"]) - 10} more changed')
+
+        if result['invalid']:
+            self.stdout.write(self.style.WARNING(
+                f'⚠ Skipped {result["invalid"]} invalid records:'
+            ))
+            for error in result['errors'][:10]:
+                self.stdout.write(f'  record {error["record"]}: {error["error"]}')
+
+        removed = result['removed']
+        if removed:
+            self.stdout.write(self.style.WARNING(
+                f'⚠ {len(removed)} districts are not in the master '
+                f'(kept, with their performance data):'
+            ))
+            shown = removed[:options['show_removed']]
+            if shown:
+                self.stdout.write('  ' + ', '.join(shown))
+            if len(removed) > len(shown):
+                self.stdout.write(f'  ... {len(removed) - len(shown)} more')
@@ -10,10 +10,38 @@ Following prompt_rules.md:
 - Proper indexing for query performance
 """
 
+import hashlib
+import json
 from django.db import models
+from django.db.models import F, OuterRef, Q, Subquery, Window
+from django.db.models.functions import Lag, RowNumber
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+
+
+class DistrictQuerySet(models.QuerySet):
+    """Query helpers for District."""
+
+    def refresh_latest_periods(self):
+        """
+        Set latestYear/latestMonth of these districts to their newest
+        period with performance data, in one UPDATE.
+        
+        Summary requests without a period resolve to it (see
+        utils.data_version.district_latest_period); syncs call this for
+        the states they wrote.
+        
+        Returns:
+            Number of districts updated
+        """
+        newest = Performance.objects.filter(
+            districtId=OuterRef('pk')
+        ).order_by('-year', '-month')
+        return self.update(
+            latestYear=Subquery(newest.values('year')[:1]),
+            latestMonth=Subquery(newest.values('month')[:1])
+        )
 
 
 class District(models.Model):
@@ -84,6 +112,20 @@ class District(models.Model):
         validators=[MinValueValidator(Decimal('-180')), MaxValueValidator(Decimal('180'))],
         help_text="Longitude for geolocation mapping"
     )
+    latestYear = models.IntegerField(
+        verbose_name=_('Latest Year'),
+        null=True,
+        db_column='latest_year',
+        help_text="Year of the newest period with performance data (refreshed on sync)"
+    )
+    latestMonth = models.IntegerField(
+        verbose_name=_('Latest Month'),
+        null=True,
+        db_column='latest_month',
+        help_text="Month of the newest period with performance data (refreshed on sync)"
+    )
+
+    objects = DistrictQuerySet.as_manager()
 
     class Meta:
         db_table = 'district'
@@ -98,6 +140,90 @@ class District(models.Model):
     def __str__(self):
         return f"{self.name}, {self.state}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored state, to tell moves apart on save (signals.py)"""
+        instance = super().from_db(db, field_names, values)
+        if 'state' in field_names:
+            instance._stored_state = values[field_names.index('state')]
+        return instance
+
+
+class PerformanceQuerySet(models.QuerySet):
+    """Query helpers for Performance."""
+
+    def summary_row(self, district_id, year, month):
+        """
+        Fetch everything a district summary needs in one SQL statement.
+        
+        Reads the requested month and the month before it from the
+        district's series; LAG carries the previous month's metrics onto
+        the current row, and the state averages come from
+        StatePeriodAggregate through correlated lookups on its unique
+        key. The district is joined in.
+        
+        Args:
+            district_id: District primary key
+            year: Year
+            month: Month (1-12)
+        
+        Returns:
+            Dict of plain values (previous-month and state-average
+            fields are None when missing), or None when the district
+            has no data for the period
+        """
+        prev_year, prev_month = (year, month - 1) if month > 1 else (year - 1, 12)
+        series = [F('year').asc(), F('month').asc()]
+        
+        def previous(field):
+            return Window(Lag(field), order_by=series)
+        
+        def state_average(field):
+            return Subquery(
+                StatePeriodAggregate.objects.filter(
+                    state=OuterRef('districtId__state'),
+                    year=OuterRef('year'),
+                    month=OuterRef('month')
+                ).order_by().values(field)[:1]
+            )
+        
+        row = self.filter(
+            Q(year=year, month=month) | Q(year=prev_year, month=prev_month),
+            districtId_id=district_id
+        ).annotate(
+            prevPersonDays=previous('personDays'),
+            prevHouseholdsWorked=previous('householdsWorked'),
+            prevTotalWages=previous('totalWages'),
+            stateAvgPersonDays=state_average('avgPersonDays'),
+            stateAvgHouseholdsWorked=state_average('avgHouseholdsWorked'),
+            stateAvgTotalWages=state_average('avgTotalWages'),
+            latest=Window(RowNumber(), order_by=[F('year').desc(), F('month').desc()])
+        ).filter(
+            latest=1
+        ).values(
+            'districtId',
+            'districtId__name',
+            'districtId__state',
+            'districtId__code',
+            'year',
+            'month',
+            'personDays',
+            'householdsWorked',
+            'totalWages',
+            'materialExpenditure',
+            'prevPersonDays',
+            'prevHouseholdsWorked',
+            'prevTotalWages',
+            'stateAvgPersonDays',
+            'stateAvgHouseholdsWorked',
+            'stateAvgTotalWages'
+        ).first()
+        
+        # Only the previous month exists
+        if row is None or (row['year'], row['month']) != (year, month):
+            return None
+        return row
+
 
 class Performance(models.Model):
     """
@@ -175,6 +301,15 @@ class Performance(models.Model):
         validators=[MinValueValidator(Decimal('0.00'))],
         help_text="Total material expenditure (in INR)"
     )
+    fingerprint = models.CharField(
+        verbose_name=_('Fingerprint'),
+        max_length=32,
+        null=True,
+        db_column='fingerprint',
+        help_text="Content hash of the metric fields, used to skip unchanged rows on sync"
+    )
+
+    objects = PerformanceQuerySet.as_manager()
 
     class Meta:
         db_table = 'performance'
@@ -186,6 +321,7 @@ class Performance(models.Model):
         indexes = [
             models.Index(fields=['districtId', 'year', 'month'], name='idx_district_period'),
             models.Index(fields=['year', 'month'], name='idx_period'),
+            models.Index(fields=['updatedAt'], name='idx_performance_updated'),
         ]
 
     def __str__(self):
@@ -196,6 +332,129 @@ class Performance(models.Model):
         """Return formatted period string: YYYY-MM"""
         return f"{self.year}-{self.month:02d}"
 
+    @staticmethod
+    def compute_fingerprint(person_days, households_worked, total_wages, material_expenditure):
+        """
+        Return a stable content hash of the metric fields.
+        
+        Decimals are normalised to the column precision so a value read
+        back from the database hashes the same as the one written.
+        """
+        cents = Decimal('0.01')
+        canonical = '|'.join((
+            str(int(person_days)),
+            str(int(households_worked)),
+            str(Decimal(str(total_wages)).quantize(cents, rounding=ROUND_HALF_UP)),
+            str(Decimal(str(material_expenditure)).quantize(cents, rounding=ROUND_HALF_UP)),
+        ))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def save(self, *args, **kwargs):
+        """Keep the fingerprint in step with the metric fields"""
+        self.fingerprint = self.compute_fingerprint(
+            self.personDays,
+            self.householdsWorked,
+            self.totalWages,
+            self.materialExpenditure
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'fingerprint' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'fingerprint']
+        super().save(*args, **kwargs)
+
+
+class StatePeriodAggregate(models.Model):
+    """
+    Precomputed statistics of a state's districts for one month.
+    
+    Holds what summary status calculations compare a district against
+    (state averages) plus the distribution of every metric, so a summary
+    is one indexed lookup on (state, year, month) instead of an
+    aggregate over all of the state's districts. Rebuilt for the
+    state-periods a sync touched (see utils/state_aggregates.py).
+    """
+    id = models.AutoField(
+        verbose_name=_('Id'),
+        primary_key=True,
+        db_column='id'
+    )
+    createdAt = models.DateTimeField(
+        verbose_name=_('Create Date'),
+        auto_now_add=True,
+        db_column='created_at'
+    )
+    updatedAt = models.DateTimeField(
+        verbose_name=_('Update Date'),
+        auto_now=True,
+        db_column='updated_at'
+    )
+    state = models.CharField(
+        verbose_name=_('State'),
+        max_length=100,
+        db_column='state',
+        help_text="Indian state name"
+    )
+    year = models.IntegerField(
+        verbose_name=_('Year'),
+        db_column='year',
+        validators=[MinValueValidator(2006)],
+        help_text="Year (YYYY format, >= 2006)"
+    )
+    month = models.IntegerField(
+        verbose_name=_('Month'),
+        db_column='month',
+        validators=[MinValueValidator(1), MaxValueValidator(12)],
+        help_text="Month (1-12)"
+    )
+    districtCount = models.IntegerField(
+        verbose_name=_('District Count'),
+        default=0,
+        db_column='district_count',
+        validators=[MinValueValidator(0)],
+        help_text="Number of districts with performance data for the period"
+    )
+    avgPersonDays = models.FloatField(
+        verbose_name=_('Average Person Days'),
+        null=True,
+        db_column='avg_person_days',
+        help_text="State average of person-days for the period"
+    )
+    avgHouseholdsWorked = models.FloatField(
+        verbose_name=_('Average Households Worked'),
+        null=True,
+        db_column='avg_households_worked',
+        help_text="State average of households provided employment for the period"
+    )
+    avgTotalWages = models.FloatField(
+        verbose_name=_('Average Total Wages'),
+        null=True,
+        db_column='avg_total_wages',
+        help_text="State average of wages paid (in INR) for the period"
+    )
+    avgMaterialExpenditure = models.FloatField(
+        verbose_name=_('Average Material Expenditure'),
+        null=True,
+        db_column='avg_material_expenditure',
+        help_text="State average of material expenditure (in INR) for the period"
+    )
+    distribution = models.JSONField(
+        verbose_name=_('Distribution'),
+        null=True,
+        db_column='distribution',
+        help_text="Sum, min, max and percentiles of every metric over the state's districts"
+    )
+
+    class Meta:
+        db_table = 'state_period_aggregate'
+        verbose_name = _('State Period Aggregate')
+        verbose_name_plural = _('State Period Aggregates')
+        ordering = ['state', '-year', '-month']
+        managed = True
+        unique_together = [('state', 'year', 'month')]
+
+    def __str__(self):
+        return f"{self.state} - {self.year}-{self.month:02d}"
+
 
 class APIStatus(models.Model):
     """
@@ -266,6 +525,60 @@ class APIStatus(models.Model):
         validators=[MinValueValidator(0)],
         help_text="Number of records that failed validation"
     )
+    recordsCreated = models.IntegerField(
+        verbose_name=_('Records Created'),
+        default=0,
+        db_column='records_created',
+        validators=[MinValueValidator(0)],
+        help_text="Number of performance rows inserted"
+    )
+    recordsUpdated = models.IntegerField(
+        verbose_name=_('Records Updated'),
+        default=0,
+        db_column='records_updated',
+        validators=[MinValueValidator(0)],
+        help_text="Number of performance rows whose metrics changed"
+    )
+    recordsUnchanged = models.IntegerField(
+        verbose_name=_('Records Unchanged'),
+        default=0,
+        db_column='records_unchanged',
+        validators=[MinValueValidator(0)],
+        help_text="Number of valid records skipped because they matched the stored row"
+    )
+    chunkStats = models.JSONField(
+        verbose_name=_('Chunk Stats'),
+        default=list,
+        db_column='chunk_stats',
+        help_text="Per-chunk created/updated/unchanged counts of the bulk upsert"
+    )
+    checkpoint = models.JSONField(
+        verbose_name=_('Checkpoint'),
+        null=True,
+        db_column='checkpoint',
+        help_text="Position reached after the last committed batch, used to resume the run"
+    )
+    errorSummary = models.JSONField(
+        verbose_name=_('Error Summary'),
+        null=True,
+        db_column='error_summary',
+        help_text="Rejected record count per error type and a random sample of failures"
+    )
+    syncMetrics = models.JSONField(
+        verbose_name=_('Sync Metrics'),
+        null=True,
+        db_column='sync_metrics',
+        help_text="Wall time per stage, throughput, bytes downloaded, DB statements, peak memory and retries of the run"
+    )
+    parent = models.ForeignKey(
+        'self',
+        verbose_name=_('Parent Run'),
+        null=True,
+        on_delete=models.CASCADE,
+        related_name='children',
+        db_column='parent_id',
+        help_text="Partitioned sync run this partition run belongs to"
+    )
     createdAt = models.DateTimeField(
         verbose_name=_('Created At'),
         auto_now_add=True,
@@ -289,3 +602,188 @@ class APIStatus(models.Model):
         if total == 0:
             return 0.0
         return (self.recordsProcessed / total) * 100
+
+
+class SyncState(models.Model):
+    """
+    Incremental sync bookkeeping for an external data source.
+    
+    Holds the high-water mark (latest period synced) and the upstream
+    `updated` stamp so weekly runs only re-fetch recent periods.
+    """
+    id = models.AutoField(
+        verbose_name=_('Id'),
+        primary_key=True,
+        db_column='id'
+    )
+    createdAt = models.DateTimeField(
+        verbose_name=_('Create Date'),
+        auto_now_add=True,
+        db_column='created_at'
+    )
+    updatedAt = models.DateTimeField(
+        verbose_name=_('Update Date'),
+        auto_now=True,
+        db_column='updated_at'
+    )
+    source = models.CharField(
+        verbose_name=_('Source'),
+        max_length=100,
+        unique=True,
+        db_column='source',
+        help_text="API source identifier (e.g., 'data.gov.in/mgnrega')"
+    )
+    lastYear = models.IntegerField(
+        verbose_name=_('Last Year'),
+        null=True,
+        db_column='last_year',
+        help_text="Year of the latest period synced (high-water mark)"
+    )
+    lastMonth = models.IntegerField(
+        verbose_name=_('Last Month'),
+        null=True,
+        db_column='last_month',
+        validators=[MinValueValidator(1), MaxValueValidator(12)],
+        help_text="Month of the latest period synced (high-water mark)"
+    )
+    upstreamUpdated = models.CharField(
+        verbose_name=_('Upstream Updated'),
+        max_length=100,
+        null=True,
+        db_column='upstream_updated',
+        help_text="Upstream 'updated' stamp seen on the last sync"
+    )
+    lastSyncedAt = models.DateTimeField(
+        verbose_name=_('Last Synced At'),
+        null=True,
+        db_column='last_synced_at',
+        help_text="Timestamp of the last completed sync"
+    )
+
+    class Meta:
+        db_table = 'sync_state'
+        verbose_name = _('Sync State')
+        verbose_name_plural = _('Sync States')
+        ordering = ['source']
+        managed = True
+
+    def __str__(self):
+        if self.lastYear is None:
+            return f"{self.source} - never synced"
+        return f"{self.source} - {self.lastYear}-{self.lastMonth:02d}"
+
+
+class FailedRecord(models.Model):
+    """
+    Dead-letter store for records rejected during a sync.
+    
+    Keeps the raw payload and its errors so records can be reprocessed
+    (see the reprocess_failed_records command) once district codes or
+    validation rules are fixed, without re-fetching from upstream.
+    A payload rejected again by a later run updates its existing row.
+    """
+    
+    class StageChoices(models.TextChoices):
+        VALIDATION = 'validation', _('Validation')
+        WRITE = 'write', _('Write')
+    
+    class StatusChoices(models.TextChoices):
+        PENDING = 'pending', _('Pending')
+        RESOLVED = 'resolved', _('Resolved')
+
+    id = models.AutoField(
+        verbose_name=_('Id'),
+        primary_key=True,
+        db_column='id'
+    )
+    createdAt = models.DateTimeField(
+        verbose_name=_('Create Date'),
+        auto_now_add=True,
+        db_column='created_at'
+    )
+    updatedAt = models.DateTimeField(
+        verbose_name=_('Update Date'),
+        auto_now=True,
+        db_column='updated_at'
+    )
+    apiStatusId = models.ForeignKey(
+        APIStatus,
+        verbose_name=_('Sync Run'),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='failedRecords',
+        db_column='api_status_id',
+        help_text="Sync run that last rejected this record"
+    )
+    payload = models.JSONField(
+        verbose_name=_('Payload'),
+        db_column='payload',
+        help_text="Raw record as received from upstream"
+    )
+    payloadHash = models.CharField(
+        verbose_name=_('Payload Hash'),
+        max_length=32,
+        unique=True,
+        db_column='payload_hash',
+        help_text="Content hash of the payload, used to de-duplicate rejections"
+    )
+    districtCode = models.CharField(
+        verbose_name=_('District Code'),
+        max_length=20,
+        null=True,
+        db_index=True,
+        db_column='district_code',
+        help_text="District code from the payload, for filtering"
+    )
+    stage = models.CharField(
+        verbose_name=_('Stage'),
+        max_length=20,
+        choices=StageChoices.choices,
+        default=StageChoices.VALIDATION,
+        db_column='stage',
+        help_text="Pipeline stage that rejected the record"
+    )
+    errors = models.JSONField(
+        verbose_name=_('Errors'),
+        default=list,
+        db_column='errors',
+        help_text="Error messages from the last attempt"
+    )
+    status = models.CharField(
+        verbose_name=_('Status'),
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+        db_index=True,
+        db_column='status',
+        help_text="Whether the record has since been written successfully"
+    )
+    attempts = models.IntegerField(
+        verbose_name=_('Attempts'),
+        default=1,
+        db_column='attempts',
+        validators=[MinValueValidator(0)],
+        help_text="Number of times the record was processed"
+    )
+    resolvedAt = models.DateTimeField(
+        verbose_name=_('Resolved At'),
+        null=True,
+        db_column='resolved_at',
+        help_text="Timestamp the record was reprocessed successfully"
+    )
+
+    class Meta:
+        db_table = 'failed_record'
+        verbose_name = _('Failed Record')
+        verbose_name_plural = _('Failed Records')
+        ordering = ['-createdAt']
+        managed = True
+
+    def __str__(self):
+        return f"{self.districtCode or '?'} - {self.stage} - {self.status}"
+
+    @staticmethod
+    def compute_payload_hash(payload):
+        """Return a stable content hash of a raw payload"""
+        canonical = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
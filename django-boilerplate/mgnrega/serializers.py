@@ -10,9 +10,9 @@ Following Reference.md format:
 """
 
 from rest_framework import serializers
-from django.db.models import Avg
 from mgnrega.models import District, Performance, APIStatus
 from atomicloops.serializers import AtomicSerializer
+from utils.state_aggregates import get_state_averages
 
 
 class DistrictSerializer(serializers.ModelSerializer):
@@ -125,7 +125,8 @@ class PerformanceSummarySerializer(serializers.Serializer):
     """
     Serializer for district performance summary with status indicators.
     
-    Calculates color-coded status based on state averages:
+    Calculates color-coded status based on state averages (read from
+    StatePeriodAggregate):
     - Good (green): >= 80% of state average
     - Average (amber): 50-79% of state average
     - Poor (red): < 50% of state average
@@ -144,18 +145,22 @@ class PerformanceSummarySerializer(serializers.Serializer):
         """
         Custom representation with computed status fields.
         
-        instance should be a Performance object
+        instance should be a row from Performance.objects.summary_row()
         """
-        # Get state average for the same period
-        state_avg = Performance.objects.filter(
-            districtId__state=instance.districtId.state,
-            year=instance.year,
-            month=instance.month
-        ).aggregate(
-            avg_person_days=Avg('personDays'),
-            avg_households=Avg('householdsWorked'),
-            avg_wages=Avg('totalWages')
-        )
+        # State averages for the same period (precomputed per sync);
+        # built on first use when the row has none yet
+        if instance['stateAvgPersonDays'] is None:
+            averages = get_state_averages(
+                instance['districtId__state'],
+                instance['year'],
+                instance['month']
+            )
+            instance = {
+                **instance,
+                'stateAvgPersonDays': averages['personDays'],
+                'stateAvgHouseholdsWorked': averages['householdsWorked'],
+                'stateAvgTotalWages': averages['totalWages'],
+            }
         
         # Calculate status for each metric
         def calculate_status(value, avg_value):
@@ -173,16 +178,8 @@ class PerformanceSummarySerializer(serializers.Serializer):
             else:
                 return 'poor'
         
-        # Get previous month data for comparison
-        prev_month = instance.month - 1 if instance.month > 1 else 12
-        prev_year = instance.year if instance.month > 1 else instance.year - 1
-        
-        try:
-            prev_performance = Performance.objects.get(
-                districtId=instance.districtId,
-                year=prev_year,
-                month=prev_month
-            )
+        # Previous month data for comparison (None when missing)
+        if instance['prevPersonDays'] is not None:
             
             # Calculate percentage changes
             def calc_change(current, previous):
@@ -192,51 +189,51 @@ class PerformanceSummarySerializer(serializers.Serializer):
             
             comparison = {
                 'personDaysChange': calc_change(
-                    instance.personDays,
-                    prev_performance.personDays
+                    instance['personDays'],
+                    instance['prevPersonDays']
                 ),
                 'householdsChange': calc_change(
-                    instance.householdsWorked,
-                    prev_performance.householdsWorked
+                    instance['householdsWorked'],
+                    instance['prevHouseholdsWorked']
                 ),
                 'wagesChange': calc_change(
-                    float(instance.totalWages),
-                    float(prev_performance.totalWages)
+                    float(instance['totalWages']),
+                    float(instance['prevTotalWages'])
                 )
             }
-        except Performance.DoesNotExist:
+        else:
             comparison = None
         
         return {
             'district': {
-                'id': instance.districtId.id,
-                'name': instance.districtId.name,
-                'state': instance.districtId.state,
-                'code': instance.districtId.code
+                'id': instance['districtId'],
+                'name': instance['districtId__name'],
+                'state': instance['districtId__state'],
+                'code': instance['districtId__code']
             },
             'period': {
-                'year': instance.year,
-                'month': instance.month,
-                'display': instance.period_display
+                'year': instance['year'],
+                'month': instance['month'],
+                'display': f"{instance['year']}-{instance['month']:02d}"
             },
             'metrics': {
-                'personDays': instance.personDays,
-                'householdsWorked': instance.householdsWorked,
-                'totalWages': float(instance.totalWages),
-                'materialExpenditure': float(instance.materialExpenditure)
+                'personDays': instance['personDays'],
+                'householdsWorked': instance['householdsWorked'],
+                'totalWages': float(instance['totalWages']),
+                'materialExpenditure': float(instance['materialExpenditure'])
             },
             'status': {
                 'personDaysStatus': calculate_status(
-                    instance.personDays,
-                    state_avg['avg_person_days']
+                    instance['personDays'],
+                    instance['stateAvgPersonDays']
                 ),
                 'householdsStatus': calculate_status(
-                    instance.householdsWorked,
-                    state_avg['avg_households']
+                    instance['householdsWorked'],
+                    instance['stateAvgHouseholdsWorked']
                 ),
                 'wagesStatus': calculate_status(
-                    float(instance.totalWages),
-                    state_avg['avg_wages']
+                    float(instance['totalWages']),
+                    instance['stateAvgTotalWages']
                 )
             },
             'comparisonToPreviousMonth': comparison
@@ -281,6 +278,9 @@ class APIStatusSerializer(serializers.ModelSerializer):
             'message',
             'recordsProcessed',
             'recordsFailed',
+            'recordsCreated',
+            'recordsUpdated',
+            'recordsUnchanged',
             'successRate',
             'createdAt'
         )
@@ -0,0 +1,43 @@
+"""
+MGNREGA Signal Handlers
+-----------------------
+Publish District changes made one at a time (admin, shell) to the read
+caches, which are keyed on data versions (utils/data_version.py). A
+district moved to another state also has the state aggregates of its
+periods rebuilt for both states.
+
+Bulk writes (sync_districts, syncs, generate_sample_data) send no
+signals and bump the versions themselves.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mgnrega.models import District
+from utils.data_version import bump_data_version
+from utils.state_aggregates import moved_state_periods, rebuild_state_aggregates
+
+
+@receiver(post_save, sender=District)
+def publish_district_save(sender, instance, **kwargs):
+    """Bump the district's states; rebuild both states' aggregates on a move."""
+    # State loaded from the database (District.from_db), no extra query
+    previous_state = getattr(instance, '_stored_state', None)
+    instance._stored_state = instance.state
+    states = {instance.state, previous_state} - {None}
+
+    def publish():
+        if previous_state and previous_state != instance.state:
+            rebuild_state_aggregates(
+                moved_state_periods({instance.pk: previous_state})
+            )
+        bump_data_version(states)
+
+    transaction.on_commit(publish)
+
+
+@receiver(post_delete, sender=District)
+def publish_district_delete(sender, instance, **kwargs):
+    """Bump the global version and that of the district's state."""
+    transaction.on_commit(lambda: bump_data_version({instance.state}))
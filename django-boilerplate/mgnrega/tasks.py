@@ -3,52 +3,414 @@ Celery tasks for MGNREGA data sync.
 
 Tasks:
 - fetch_mgnrega_data: Periodic task to fetch data from API
+- sync_mgnrega_partition: Fetch one state/year partition of a
+  partitioned sync
+- finalize_mgnrega_sync: Chord callback aggregating partition runs into
+  their parent run
+- warm_mgnrega_cache: Precompute the read cache after a successful sync
 """
 
-from celery import shared_task
+from celery import chord, shared_task
 from celery.utils.log import get_task_logger
-from utils.mgnrega_fetcher import MGNREGADataFetcher
+from django.conf import settings
+from mgnrega.models import APIStatus
+from utils.cache_warming import warm_read_cache
+from utils.district_sync import sync_district_master
+from utils.mgnrega_fetcher import MGNREGADataFetcher, retry_backoff
+from utils.sync_lock import SyncLock
 
 logger = get_task_logger(__name__)
 
 
+def _retry_failed_run(task, result, lock=None):
+    """
+    Re-enqueue `task` to resume a failed run, if the failure is
+    retryable and attempts remain.
+    
+    This is the only retry layer of the sync: the fetcher fails fast on
+    a page error, and the task is re-enqueued with a jittered countdown
+    (retry_backoff) so the worker is released while waiting. The retry
+    resumes from the run's checkpoint instead of starting over.
+    
+    Args:
+        task: Bound task instance
+        result: Failure result returned by the fetcher
+        lock: Handed-over SyncLock (partitions), extended to outlive
+            the countdown
+    
+    Raises:
+        celery.exceptions.Retry when a retry was scheduled
+    """
+    max_retries = getattr(settings, 'MGNREGA_RETRY_MAX_ATTEMPTS', 5)
+    
+    if result.get('retryable') and task.request.retries < max_retries:
+        countdown = retry_backoff(
+            task.request.retries,
+            result.get('retry_after')
+        )
+        if lock is not None and not lock.extend(countdown + lock.ttl):
+            logger.error("Sync lock lost while scheduling a retry")
+        logger.warning(
+            f"Data fetch failed, resuming in {countdown:.0f}s: "
+            f"{result['message']}"
+        )
+        raise task.retry(
+            countdown=countdown,
+            max_retries=max_retries,
+            kwargs={**task.request.kwargs, 'resume': True}
+        )
+
+
 @shared_task(bind=True, queue='default')
-def fetch_mgnrega_data_task(self):
+def fetch_mgnrega_data_task(
+    self,
+    full=False,
+    resume=False,
+    partition_by=None,
+    wait_for_lock=False
+):
     """
     Celery task to fetch MGNREGA data from external API.
     
-    Runs weekly via Celery Beat.
-    Implements retry logic with exponential backoff.
+    Runs weekly via Celery Beat as an incremental sync (recent periods
+    only). Pass full=True to force a complete resync. Retries of a
+    failed run (and callers passing resume=True) continue it from its
+    last checkpoint; scheduled runs start afresh.
+    
+    With partition_by (or settings.MGNREGA_SYNC_PARTITION_BY) set, the
+    sync is instead split into state or year partitions, dispatched as a
+    chord of sync_mgnrega_partition tasks so several workers share the
+    load; finalize_mgnrega_sync aggregates them into a parent APIStatus.
+    
+    When settings.MGNREGA_DISTRICT_MASTER is set, District is synced
+    from that master first (utils.district_sync). A successful sync
+    that changed data is followed by warm_mgnrega_cache.
+    
+    Only one sync runs at a time (utils.sync_lock). If another sync
+    holds the lock, the task is skipped, or re-queued behind it with
+    wait_for_lock (always the case for retries). Failures are retried
+    by _retry_failed_run.
+    
+    Args:
+        full: Force a complete resync instead of an incremental one
+        resume: Continue the last interrupted run from its checkpoint
+        partition_by: 'state' or 'year' to fan out across workers
+        wait_for_lock: Queue behind a running sync instead of skipping
     
     Returns:
         Dict with processing results
     """
+    partition_by = partition_by or getattr(
+        settings, 'MGNREGA_SYNC_PARTITION_BY', None
+    )
+    
+    lock = SyncLock(owner=f"celery:{self.name}[{self.request.id}]")
+    if not lock.acquire():
+        return _sync_locked(
+            self,
+            lock,
+            wait_for_lock or self.request.retries > 0
+        )
+    
+    # A partitioned sync hands the lease over to its partitions
+    handed_over = False
     try:
-        logger.info("Starting scheduled MGNREGA data fetch")
+        # New or redistricted districts must exist before their records
+        sync_district_master()
         
-        fetcher = MGNREGADataFetcher()
-        result = fetcher.fetch_and_sync()
+        if partition_by:
+            dispatched = _dispatch_partitions(
+                full, resume, partition_by, lock
+            )
+            handed_over = True
+            return dispatched
         
         logger.info(
-            f"Data fetch completed: {result['processed']} processed, "
-            f"{result['failed']} failed"
+            f"Starting scheduled MGNREGA data fetch "
+            f"(attempt {self.request.retries + 1})"
         )
         
-        return {
-            'status': 'success',
-            'processed': result['processed'],
-            'failed': result['failed'],
-        }
+        # Retries always continue the interrupted run
+        fetcher = MGNREGADataFetcher(
+            full=full,
+            resume=resume or self.request.retries > 0
+        )
+        result = fetcher.fetch_and_sync()
         
     except Exception as e:
+        # The fetcher reports its own failures; this is e.g. the
+        # database being unreachable before the run could start
         logger.error(f"Error in data fetch task: {e}", exc_info=True)
-        
-        # Retry with exponential backoff
-        # Retry delays: 60s, 120s, 300s (5 min)
-        retry_countdown = 60 * (2 ** self.request.retries)
-        
         raise self.retry(
             exc=e,
-            countdown=retry_countdown,
-            max_retries=3
+            countdown=retry_backoff(self.request.retries),
+            max_retries=getattr(settings, 'MGNREGA_RETRY_MAX_ATTEMPTS', 5)
+        )
+    
+    finally:
+        if not handed_over:
+            lock.release()
+    
+    if result.get('status') == 'failure':
+        _retry_failed_run(self, result)
+        
+        logger.error(f"Data fetch failed: {result['message']}")
+        return {
+            'status': 'failure',
+            'message': result['message'],
+        }
+    
+    logger.info(
+        f"Data fetch completed: {result['processed']} processed, "
+        f"{result['failed']} failed"
+    )
+    
+    _warm_changed_states(result)
+    
+    return {
+        'status': 'success',
+        'processed': result['processed'],
+        'failed': result['failed'],
+    }
+
+
+def _sync_locked(task, lock, wait):
+    """
+    Handle a sync invocation that found another sync running.
+    
+    Args:
+        task: Bound task instance
+        lock: The SyncLock that could not be acquired
+        wait: Re-queue the task behind the running sync instead of
+            skipping it
+    
+    Returns:
+        Dict with 'skipped' or 'queued' status
+    """
+    holder = lock.holder() or {}
+    running = (
+        f"{holder.get('owner', 'unknown')} on {holder.get('host', '?')} "
+        f"since {holder.get('acquiredAt', '?')}"
+    )
+    
+    if not wait:
+        logger.info(f"Sync skipped, another sync is running: {running}")
+        return {
+            'status': 'skipped',
+            'message': f"Another sync is running ({running})",
+        }
+    
+    # Re-enqueue instead of blocking the worker while waiting; the
+    # re-queued task (e.g. a retry) must keep waiting, not skip
+    countdown = getattr(settings, 'MGNREGA_SYNC_LOCK_POLL_INTERVAL', 60)
+    task.apply_async(
+        args=task.request.args,
+        kwargs={**task.request.kwargs, 'wait_for_lock': True},
+        countdown=countdown
+    )
+    logger.info(
+        f"Sync queued behind running sync ({running}), "
+        f"checking again in {countdown}s"
+    )
+    return {
+        'status': 'queued',
+        'message': f"Waiting for running sync ({running})",
+    }
+
+
+def _dispatch_partitions(full, resume, partition_by, lock):
+    """
+    Plan a partitioned sync and dispatch it as a chord.
+    
+    The sync lock's lease is handed over to the partitions, which
+    heartbeat it while they run and extend it over their retry
+    countdowns; the chord callback releases it. At hand-over, the lease
+    is extended by the retry ceiling (MGNREGA_RETRY_MAX_DELAY) so it
+    also outlives partitions waiting in the queue.
+    
+    Args:
+        full: Force a complete resync instead of an incremental one
+        resume: Let each partition continue its own interrupted run
+        partition_by: 'state' or 'year'
+        lock: Acquired SyncLock
+    
+    Returns:
+        Dict with the parent run id and partition count
+    """
+    fetcher = MGNREGADataFetcher(full=full)
+    parent, partitions = fetcher.plan_partitions(partition_by)
+    
+    header = [
+        sync_mgnrega_partition_task.s(
+            parent_id=parent.id,
+            partition=partition['key'],
+            streams=partition['streams'],
+            full=fetcher.full,
+            resume=resume,
+            lease=lock.lease
+        )
+        for partition in partitions
+    ]
+    finalize = finalize_mgnrega_sync_task.s(
+        parent_id=parent.id,
+        lease=lock.lease
+    )
+    
+    lock.stop_heartbeat()
+    lock.extend(getattr(settings, 'MGNREGA_RETRY_MAX_DELAY', 900) + lock.ttl)
+    
+    if header:
+        chord(header)(finalize)
+    else:
+        finalize.delay([])
+    
+    logger.info(
+        f"Dispatched partitioned sync {parent.id}: "
+        f"{len(partitions)} {partition_by} partition(s)"
+    )
+    
+    return {
+        'status': 'dispatched',
+        'parent': parent.id,
+        'partitions': len(partitions),
+    }
+
+
+@shared_task(bind=True, queue='default')
+def sync_mgnrega_partition_task(
+    self,
+    parent_id,
+    partition,
+    streams,
+    full=False,
+    resume=False,
+    lease=None
+):
+    """
+    Fetch, validate and upsert one partition of a partitioned sync.
+    
+    Each partition is an independent run under its own APIStatus source
+    (e.g. 'data.gov.in/mgnrega:state=Bihar'), checkpointed and retried
+    like a regular sync. A partition that gives up returns its failure
+    instead of raising, so the chord callback still runs.
+    
+    Args:
+        parent_id: Parent APIStatus id
+        partition: Partition key
+        streams: API filter dicts of this partition
+        full: Whether the parent run is a full sync
+        resume: Continue the partition's last interrupted run
+        lease: Sync lock lease of the partitioned sync, kept alive
+            while this partition runs or waits for its retry
+    
+    Returns:
+        Partition result dict
+    """
+    lock = SyncLock(owner=f"partition {partition}", lease=lease)
+    if lease:
+        lock.extend()
+        lock.start_heartbeat()
+    
+    try:
+        fetcher = MGNREGADataFetcher(
+            full=full,
+            resume=resume or self.request.retries > 0,
+            streams=streams,
+            partition=partition,
+            parent=APIStatus.objects.get(pk=parent_id)
         )
+        result = fetcher.fetch_and_sync()
+    finally:
+        lock.stop_heartbeat()
+    
+    if result.get('status') == 'failure':
+        _retry_failed_run(self, result, lock if lease else None)
+        logger.error(f"Partition {partition} failed: {result['message']}")
+    else:
+        logger.info(
+            f"Partition {partition} completed: {result['processed']} "
+            f"processed, {result['failed']} failed"
+        )
+    
+    return result
+
+
+@shared_task(queue='default')
+def finalize_mgnrega_sync_task(results, parent_id, lease=None):
+    """
+    Chord callback of a partitioned sync: aggregate the partition runs
+    into the parent APIStatus, advance the high-water mark, release
+    the sync lock and, unless every partition failed, warm the cache.
+    
+    Args:
+        results: Results of the partition tasks
+        parent_id: Parent APIStatus id
+        lease: Sync lock lease of the partitioned sync
+    
+    Returns:
+        Dict with aggregated results
+    """
+    try:
+        result = MGNREGADataFetcher().finalize_partitions(parent_id, results)
+    finally:
+        if lease:
+            SyncLock(owner='finalize', lease=lease).release()
+    
+    logger.info(
+        f"Partitioned sync {parent_id} finished ({result['status']}): "
+        f"{result['processed']} processed, {result['failed']} failed"
+    )
+    
+    if result['status'] != 'failure':
+        _warm_changed_states(result)
+    
+    return {
+        'status': result['status'],
+        'processed': result['processed'],
+        'failed': result['failed'],
+    }
+
+
+def _warm_changed_states(result):
+    """
+    Chain warm_mgnrega_cache for the states a sync bumped, if any.
+    
+    A run that changed nothing (all rows unchanged, or upstream not
+    modified) bumped no data versions, so every cached key is still
+    valid and there is nothing to warm.
+    
+    Args:
+        result: Sync result with 'states'
+    """
+    if result.get('states'):
+        warm_mgnrega_cache_task.delay(states=result['states'])
+    else:
+        logger.info("No data changed; cache warming skipped")
+
+
+@shared_task(queue='default')
+def warm_mgnrega_cache_task(concurrency=None, states=None):
+    """
+    Precompute every district's latest summary and default history
+    window into the read cache, so the first visitors after a data
+    release are served from the cache (utils.cache_warming).
+    
+    Chained after each successful sync that changed data, once its data
+    versions are bumped, for the states it changed.
+    
+    Args:
+        concurrency: Worker threads (default:
+            settings.MGNREGA_CACHE_WARM_CONCURRENCY)
+        states: Only warm the districts of these states (default: all)
+    
+    Returns:
+        Dict with districts, aggregates built, keys warmed and seconds
+    """
+    result = warm_read_cache(concurrency, states)
+    
+    logger.info(
+        f"Cache warmed: {result['warmed']} keys for {result['districts']} "
+        f"districts in {result['seconds']}s"
+    )
+    
+    return {'status': 'success', **result}
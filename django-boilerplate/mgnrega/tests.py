@@ -0,0 +1,666 @@
+"""
+Tests for the MGNREGA sync pipeline and read endpoints.
+
+Run with:
+    python manage.py test mgnrega
+"""
+
+import json
+from datetime import timedelta
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from mgnrega.models import (
+    APIStatus,
+    District,
+    FailedRecord,
+    Performance,
+    StatePeriodAggregate,
+    SyncState
+)
+from celery.exceptions import Retry
+from mgnrega.tasks import (
+    _dispatch_partitions,
+    fetch_mgnrega_data_task,
+    sync_mgnrega_partition_task,
+    warm_mgnrega_cache_task
+)
+from mgnrega.views import DistrictViewSet
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from utils import data_version
+from utils.data_version import bump_data_version, versioned_key
+from utils.district_sync import sync_districts
+from utils.error_report import ErrorReport
+from utils.mgnrega_fetcher import MGNREGADataFetcher
+from utils.read_cache import LOCK_PREFIX, cached_response
+from utils.state_aggregates import all_state_periods, rebuild_state_aggregates
+
+
+def make_record(district_code, year=2024, month=1, **overrides):
+    """Raw API record with valid defaults."""
+    return {
+        'district_code': district_code,
+        'year': year,
+        'month': month,
+        'person_days': 1000,
+        'households_worked': 100,
+        'total_wages': '25000.50',
+        'material_expenditure': '5000.00',
+        **overrides
+    }
+
+
+class FakeAPI:
+    """
+    Stand-in for MGNREGADataFetcher._get serving `records`, returning at
+    most `max_limit` records per page like an API clamping `limit`, and
+    failing the page at offset `fail_at`: with HTTP `fail_status`, or a
+    dropped connection.
+    """
+
+    def __init__(
+        self, records, max_limit=None, report_total=True, fail_at=None, fail_status=None
+    ):
+        self.records = records
+        self.max_limit = max_limit
+        self.report_total = report_total
+        self.fail_at = fail_at
+        self.fail_status = fail_status
+        self.offsets = []
+
+    def __call__(self, url, headers, params):
+        offset, limit = int(params['offset']), int(params['limit'])
+        if offset == self.fail_at:
+            if self.fail_status is None:
+                raise requests.ConnectionError('Connection reset')
+            response = requests.Response()
+            response.status_code = self.fail_status
+            response.raise_for_status()
+        if self.max_limit:
+            limit = min(limit, self.max_limit)
+        self.offsets.append(offset)
+        body = {'records': self.records[offset:offset + limit]}
+        if self.report_total:
+            body['total'] = len(self.records)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        return response
+
+
+def make_fetcher(**kwargs):
+    """Fetcher with a running APIStatus, ready for _process_data."""
+    fetcher = MGNREGADataFetcher(backend='orm', **kwargs)
+    fetcher.api_status = APIStatus.objects.create(
+        source='test',
+        status=APIStatus.StatusChoices.IN_PROGRESS
+    )
+    fetcher.district_ids = fetcher._load_district_ids()
+    return fetcher
+
+
+class ValidationTests(TestCase):
+    """Per-record validation of raw API records."""
+
+    @classmethod
+    def setUpTestData(cls):
+        District.objects.create(code='D1', name='One', state='Bihar')
+
+    def setUp(self):
+        self.fetcher = make_fetcher()
+
+    def test_valid_record(self):
+        self.assertEqual(self.fetcher._validate_record(make_record('D1')), (True, []))
+
+    def test_integral_strings_are_accepted(self):
+        valid, errors = self.fetcher._validate_record(
+            make_record('D1', person_days='12', households_worked='3.0')
+        )
+        self.assertTrue(valid, errors)
+
+    def test_fractional_counts_are_rejected(self):
+        valid, errors = self.fetcher._validate_record(
+            make_record('D1', person_days='12.5')
+        )
+        self.assertFalse(valid)
+        self.assertEqual(errors, ['person_days must be a whole number: 12.5'])
+
+    def test_non_finite_values_are_rejected(self):
+        valid, errors = self.fetcher._validate_record(
+            make_record('D1', total_wages='nan')
+        )
+        self.assertFalse(valid)
+        self.assertEqual(errors, ['Invalid total_wages format: nan'])
+
+    def test_messages(self):
+        self.fetcher.district_ids = {}
+        _, errors = self.fetcher._validate_record(
+            make_record('XX', year=2001, month=13)
+        )
+        self.assertEqual(errors, [
+            'Invalid year 2001 (must be >= 2006)',
+            'Invalid month 13 (must be 1-12)',
+            'District code XX not found in database',
+        ])
+
+        _, errors = self.fetcher._validate_record({'district_code': 'D1'})
+        self.assertEqual(errors[0], 'Missing required field: year')
+
+    def test_errors_are_counted_by_type(self):
+        report = ErrorReport()
+        for code, month in (('XX', 13), ('YY', 14)):
+            _, errors = self.fetcher._validate_record(
+                make_record(code, month=month)
+            )
+            report.add(None, errors)
+        report.add_many(3, 'Chunk write failed: deadlock')
+
+        self.assertEqual(report.by_type, {
+            'Invalid month': 2,
+            'District code not found in database': 2,
+            'Chunk write failed': 3,
+        })
+        self.assertEqual(report.total, 5)
+
+
+class BulkUpsertTests(TestCase):
+    """Chunked bulk upsert with fingerprint-based change detection."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for code in ('D1', 'D2', 'D3'):
+            District.objects.create(code=code, name=code, state='Bihar')
+
+    def test_bad_record_does_not_fail_its_chunk(self):
+        records = [make_record(code, month=month) for code in ('D1', 'D2') for month in range(1, 13)]
+        records.insert(5, make_record('D3', person_days='12.5'))
+
+        result = make_fetcher()._process_data(records)
+
+        self.assertEqual(result['processed'], 24)
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(Performance.objects.count(), 24)
+        failed = FailedRecord.objects.get()
+        self.assertEqual(failed.stage, FailedRecord.StageChoices.VALIDATION)
+        self.assertEqual(failed.districtCode, 'D3')
+
+    def test_created_updated_unchanged_counts(self):
+        records = [make_record(code) for code in ('D1', 'D2', 'D3')]
+        first = make_fetcher()._process_data(records)
+        self.assertEqual(
+            (first['created'], first['updated'], first['unchanged']), (3, 0, 0)
+        )
+
+        records[0]['person_days'] = 2000
+        second = make_fetcher()._process_data(records)
+        self.assertEqual(
+            (second['created'], second['updated'], second['unchanged']), (0, 1, 2)
+        )
+        self.assertEqual(
+            Performance.objects.get(districtId__code='D1').personDays, 2000
+        )
+
+    def test_save_with_update_fields_stores_fingerprint(self):
+        make_fetcher()._process_data([make_record('D1')])
+        performance = Performance.objects.get()
+        performance.personDays = 2000
+        performance.save(update_fields=['personDays'])
+
+        result = make_fetcher()._process_data([make_record('D1', person_days=2000)])
+        self.assertEqual(result['unchanged'], 1)
+
+    def test_backfilled_rows_count_as_unchanged(self):
+        records = [make_record(code) for code in ('D1', 'D2', 'D3')]
+        make_fetcher()._process_data(records)
+        Performance.objects.update(fingerprint=None)
+        before = dict(Performance.objects.values_list('id', 'updatedAt'))
+
+        call_command('backfill_fingerprints', '--batch-size', '2', stdout=mock.Mock())
+
+        self.assertFalse(Performance.objects.filter(fingerprint__isnull=True).exists())
+        self.assertEqual(dict(Performance.objects.values_list('id', 'updatedAt')), before)
+        result = make_fetcher()._process_data(records)
+        self.assertEqual((result['updated'], result['unchanged']), (0, 3))
+
+    def test_unchanged_rows_keep_updated_at(self):
+        records = [make_record('D1')]
+        make_fetcher()._process_data(records)
+        before = Performance.objects.get().updatedAt
+
+        make_fetcher()._process_data(records)
+
+        self.assertEqual(Performance.objects.get().updatedAt, before)
+
+
+@override_settings(MGNREGA_PAGE_CACHE_DIR=None)
+class PaginationTests(TestCase):
+    """Paging through the API resource."""
+
+    @classmethod
+    def setUpTestData(cls):
+        District.objects.create(code='D1', name='One', state='Bihar')
+        cls.records = [
+            make_record('D1', year=2006 + index // 12, month=index % 12 + 1)
+            for index in range(250)
+        ]
+
+    def fetch_all(self, api, page_size=100, concurrency=3):
+        fetcher = MGNREGADataFetcher(page_size=page_size, concurrency=concurrency)
+        with mock.patch.object(fetcher, '_get', side_effect=api):
+            pages = list(fetcher._iter_pages({}))
+        return fetcher, [record for page in pages for record in page]
+
+    def test_reads_every_page(self):
+        api = FakeAPI(self.records)
+        fetcher, records = self.fetch_all(api)
+        self.assertEqual(records, self.records)
+        self.assertEqual(fetcher.offset, 250)
+
+    def test_clamped_limit(self):
+        api = FakeAPI(self.records, max_limit=40)
+        fetcher, records = self.fetch_all(api)
+        self.assertEqual(records, self.records)
+        self.assertEqual(fetcher.offset, 250)
+
+    def test_clamped_limit_without_total(self):
+        api = FakeAPI(self.records, max_limit=40, report_total=False)
+        fetcher, records = self.fetch_all(api, concurrency=1)
+        self.assertEqual(records, self.records)
+        # Without a total, only an empty page ends the stream
+        self.assertEqual(api.offsets[-1], 250)
+
+    def test_sync_with_clamped_limit_ingests_everything(self):
+        api = FakeAPI(self.records, max_limit=40)
+        fetcher = MGNREGADataFetcher(page_size=100, full=True, backend='orm')
+        with mock.patch.object(fetcher, '_get', side_effect=api):
+            result = fetcher.fetch_and_sync()
+        self.assertEqual(fetcher.api_status.status, APIStatus.StatusChoices.SUCCESS)
+        self.assertEqual(result['processed'], 250)
+        self.assertEqual(Performance.objects.count(), 250)
+
+    def sync(self, api, full=True, **kwargs):
+        fetcher = MGNREGADataFetcher(
+            page_size=100, concurrency=1, full=full, backend='orm', **kwargs
+        )
+        with mock.patch.object(fetcher, '_get', side_effect=api):
+            result = fetcher.fetch_and_sync()
+        return fetcher, result
+
+    def test_resume_continues_from_checkpoint(self):
+        fetcher, result = self.sync(FakeAPI(self.records, fail_at=200))
+        self.assertEqual(result['status'], 'failure')
+        self.assertTrue(result['retryable'])
+        self.assertEqual((result['processed'], result['created']), (200, 200))
+        self.assertEqual(fetcher.api_status.checkpoint['offset'], 200)
+        self.assertEqual(Performance.objects.count(), 200)
+
+        api = FakeAPI(self.records)
+        resumed, result = self.sync(api, resume=True)
+
+        # Same run, reopened; only the pages after the checkpoint are read
+        self.assertEqual(resumed.api_status.pk, fetcher.api_status.pk)
+        self.assertEqual(resumed.api_status.status, APIStatus.StatusChoices.SUCCESS)
+        self.assertEqual(api.offsets[0], 200)
+        self.assertEqual(result['processed'], 250)
+        self.assertEqual(Performance.objects.count(), 250)
+
+    def assert_starts_over(self, failed):
+        api = FakeAPI(self.records)
+        fetcher, result = self.sync(api, resume=True)
+
+        self.assertNotEqual(fetcher.api_status.pk, failed.api_status.pk)
+        self.assertEqual(api.offsets[0], 0)
+        self.assertEqual(result['processed'], 250)
+
+    def test_permanent_failure_is_not_resumed(self):
+        failed, result = self.sync(FakeAPI(self.records, fail_at=200, fail_status=404))
+        self.assertFalse(result['retryable'])
+        self.assert_starts_over(failed)
+
+    @override_settings(MGNREGA_RESUME_MAX_AGE=3600)
+    def test_old_failure_is_not_resumed(self):
+        failed, _ = self.sync(FakeAPI(self.records, fail_at=200))
+        APIStatus.objects.filter(pk=failed.api_status.pk).update(
+            updatedAt=timezone.now() - timedelta(hours=2)
+        )
+        self.assert_starts_over(failed)
+
+    def test_incremental_checkpoint_does_not_downgrade_full_run(self):
+        now = timezone.now()
+        SyncState.objects.create(
+            source=MGNREGADataFetcher.SOURCE, lastYear=now.year, lastMonth=now.month
+        )
+        failed, _ = self.sync(FakeAPI(self.records, fail_at=200), full=False)
+        self.assertFalse(failed.api_status.checkpoint['full'])
+        self.assert_starts_over(failed)
+
+    def test_failed_chunk_does_not_advance_high_water_mark(self):
+        fetcher = MGNREGADataFetcher(page_size=100, full=True, backend='orm')
+        fetcher.CHUNK_SIZE = 50
+        write_rows = fetcher._write_rows_orm
+
+        def write_until_2023(rows):
+            if any(year >= 2023 for _, year, _ in rows):
+                raise RuntimeError('Deadlock detected')
+            return write_rows(rows)
+
+        with mock.patch.object(fetcher, '_get', side_effect=FakeAPI(self.records)), \
+                mock.patch.object(fetcher, '_write_rows_orm', side_effect=write_until_2023):
+            result = fetcher.fetch_and_sync()
+
+        # The run completes with the last chunk dead-lettered...
+        self.assertEqual(fetcher.api_status.status, APIStatus.StatusChoices.PARTIAL)
+        self.assertEqual((result['processed'], result['failed']), (200, 50))
+        # ...and the next incremental run starts from the last stored period
+        state = SyncState.objects.get(source=MGNREGADataFetcher.SOURCE)
+        self.assertEqual((state.lastYear, state.lastMonth), (2022, 8))
+
+    def test_resume_without_interrupted_run_starts_over(self):
+        self.sync(FakeAPI(self.records))
+
+        api = FakeAPI(self.records)
+        fetcher, result = self.sync(api, resume=True)
+
+        self.assertEqual(api.offsets[0], 0)
+        self.assertEqual(APIStatus.objects.count(), 2)
+        self.assertEqual(result['unchanged'], 250)
+
+    def test_only_changed_states_are_published(self):
+        _, result = self.sync(FakeAPI(self.records))
+        self.assertEqual(result['states'], ['Bihar'])
+
+        _, result = self.sync(FakeAPI(self.records))
+        self.assertEqual(result['states'], [])
+
+
+@mock.patch('mgnrega.tasks.SyncLock')
+class SyncLockTaskTests(TestCase):
+    """A sync finding another sync running."""
+
+    def setUp(self):
+        patcher = mock.patch.object(fetch_mgnrega_data_task, 'apply_async')
+        self.apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def locked(self, SyncLock):
+        SyncLock.return_value.acquire.return_value = False
+        SyncLock.return_value.holder.return_value = {'owner': 'other'}
+
+    def test_skipped_without_wait(self, SyncLock):
+        self.locked(SyncLock)
+        result = fetch_mgnrega_data_task.apply().get()
+        self.assertEqual(result['status'], 'skipped')
+        self.apply_async.assert_not_called()
+
+    def test_requeued_with_wait(self, SyncLock):
+        self.locked(SyncLock)
+        result = fetch_mgnrega_data_task.apply(
+            kwargs={'full': True, 'wait_for_lock': True}
+        ).get()
+        self.assertEqual(result['status'], 'queued')
+        kwargs = self.apply_async.call_args.kwargs['kwargs']
+        self.assertEqual(kwargs, {'full': True, 'wait_for_lock': True})
+
+    def test_requeued_retry_keeps_waiting(self, SyncLock):
+        self.locked(SyncLock)
+        result = fetch_mgnrega_data_task.apply(
+            kwargs={'resume': True}, retries=1
+        ).get()
+        self.assertEqual(result['status'], 'queued')
+        # Otherwise the re-queued retry would be skipped and dropped
+        kwargs = self.apply_async.call_args.kwargs['kwargs']
+        self.assertTrue(kwargs['wait_for_lock'])
+
+
+@mock.patch('mgnrega.tasks.MGNREGADataFetcher')
+@mock.patch('mgnrega.tasks.SyncLock')
+class FetchTaskTests(TestCase):
+    """fetch_mgnrega_data_task runs."""
+
+    def run_task(self, SyncLock, Fetcher, result=None, **options):
+        SyncLock.return_value.acquire.return_value = True
+        Fetcher.return_value.fetch_and_sync.return_value = result or {
+            'status': 'failure', 'message': 'Not found', 'retryable': False
+        }
+        fetch_mgnrega_data_task.apply(**options).get()
+        return Fetcher.call_args.kwargs
+
+    def test_warms_changed_states_only(self, SyncLock, Fetcher):
+        result = {'processed': 3, 'failed': 0, 'states': []}
+        with mock.patch.object(warm_mgnrega_cache_task, 'delay') as warm:
+            self.run_task(SyncLock, Fetcher, result)
+            warm.assert_not_called()
+
+            self.run_task(SyncLock, Fetcher, {**result, 'states': ['Bihar']})
+            warm.assert_called_once_with(states=['Bihar'])
+
+    def test_scheduled_run_starts_afresh(self, SyncLock, Fetcher):
+        self.assertEqual(
+            self.run_task(SyncLock, Fetcher), {'full': False, 'resume': False}
+        )
+
+    def test_retry_resumes(self, SyncLock, Fetcher):
+        kwargs = self.run_task(SyncLock, Fetcher, retries=1)
+        self.assertTrue(kwargs['resume'])
+
+
+@override_settings(MGNREGA_RETRY_MAX_DELAY=900)
+@mock.patch('mgnrega.tasks.MGNREGADataFetcher')
+class PartitionLeaseTests(TestCase):
+    """The sync lease handed over to partitions outlives their waits."""
+
+    def make_lock(self):
+        lock = mock.Mock(ttl=300, lease='lease')
+        lock.extend.return_value = True
+        return lock
+
+    @mock.patch('mgnrega.tasks.chord')
+    def test_handover_covers_the_retry_ceiling(self, chord, Fetcher):
+        Fetcher.return_value.plan_partitions.return_value = (
+            mock.Mock(id=1), [{'key': 'state=Bihar', 'streams': [{}]}]
+        )
+        lock = self.make_lock()
+
+        _dispatch_partitions(False, False, 'state', lock)
+
+        lock.extend.assert_called_once_with(1200)
+        chord.assert_called_once()
+
+    @mock.patch('mgnrega.tasks.retry_backoff', return_value=600)
+    @mock.patch('mgnrega.tasks.SyncLock')
+    def test_partition_extends_lease_over_retry_countdown(
+        self, SyncLock, retry_backoff, Fetcher
+    ):
+        lock = SyncLock.return_value = self.make_lock()
+        Fetcher.return_value.fetch_and_sync.return_value = {
+            'status': 'failure', 'message': 'Timeout', 'retryable': True
+        }
+        parent = APIStatus.objects.create(source='test')
+
+        with mock.patch.object(
+            sync_mgnrega_partition_task, 'retry', side_effect=Retry()
+        ) as retry:
+            sync_mgnrega_partition_task.apply(kwargs={
+                'parent_id': parent.id,
+                'partition': 'state=Bihar',
+                'streams': [{}],
+                'lease': 'lease',
+            })
+
+        self.assertEqual(retry.call_args.kwargs['countdown'], 600)
+        lock.extend.assert_called_with(900)
+
+
+class GenerateSampleDataTests(TestCase):
+    """generate_sample_data keeps the derived data consistent."""
+
+    def generate(self, *args):
+        call_command(
+            'generate_sample_data', '--scale', 'small', '--backend', 'orm',
+            *args, stdout=mock.Mock()
+        )
+
+    def test_clear_drops_aggregates_of_removed_periods(self):
+        year = timezone.now().year
+        self.generate('--start-year', str(year - 1))
+        self.assertTrue(
+            StatePeriodAggregate.objects.filter(year=year - 1).exists()
+        )
+
+        self.generate('--start-year', str(year), '--clear')
+
+        self.assertFalse(Performance.objects.filter(year=year - 1).exists())
+        self.assertFalse(
+            StatePeriodAggregate.objects.filter(year=year - 1).exists()
+        )
+        self.assertEqual(
+            set(StatePeriodAggregate.objects.values_list('state', 'year', 'month')),
+            set(Performance.objects.values_list(
+                'districtId__state', 'year', 'month'
+            ).distinct())
+        )
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReadCacheTests(TestCase):
+    """cached_response on any cache backend."""
+
+    def setUp(self):
+        cache.clear()
+        self.compute = mock.Mock(return_value=Response({'total': 1}))
+
+    def test_computes_once_and_releases_its_lock(self):
+        for _ in range(2):
+            self.assertEqual(cached_response('key', self.compute).data, {'total': 1})
+
+        self.compute.assert_called_once()
+        self.assertIsNone(cache.get(LOCK_PREFIX + 'key'))
+
+    def test_unavailable_lock_still_serves(self):
+        with mock.patch.object(cache, 'add', side_effect=ConnectionError):
+            response = cached_response('key', self.compute)
+
+        self.assertEqual(response.data, {'total': 1})
+        self.compute.assert_called_once()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheVersionTests(TestCase):
+    """Read caches keyed on data versions."""
+
+    def setUp(self):
+        cache.clear()
+        # Per-process district map; reloaded by each test
+        data_version._district_states_loaded = None
+
+    def test_bump_changes_keys_of_bumped_states_only(self):
+        bihar = versioned_key('summary', 1, state='Bihar')
+        kerala = versioned_key('summary', 2, state='Kerala')
+        districts = versioned_key('districts', 'all')
+
+        bump_data_version(['Bihar'])
+
+        self.assertNotEqual(versioned_key('summary', 1, state='Bihar'), bihar)
+        self.assertEqual(versioned_key('summary', 2, state='Kerala'), kerala)
+        self.assertNotEqual(versioned_key('districts', 'all'), districts)
+
+    def list_districts(self):
+        view = DistrictViewSet.as_view({'get': 'list'})
+        response = view(APIRequestFactory().get('/api/districts/'))
+        return sorted(district['code'] for district in response.data['results'])
+
+    def test_district_list_sees_single_district_changes(self):
+        District.objects.create(code='D1', name='One', state='Bihar')
+        self.assertEqual(self.list_districts(), ['D1'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            district = District.objects.create(code='D2', name='Two', state='Bihar')
+        self.assertEqual(self.list_districts(), ['D1', 'D2'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            district.delete()
+        self.assertEqual(self.list_districts(), ['D1'])
+
+    def test_cached_list_is_served_until_a_bump(self):
+        District.objects.create(code='D1', name='One', state='Bihar')
+        self.assertEqual(self.list_districts(), ['D1'])
+
+        # Bulk writes send no signals: the cached list stands...
+        District.objects.bulk_create([District(code='D2', name='Two', state='Bihar')])
+        self.assertEqual(self.list_districts(), ['D1'])
+
+        # ...until the writer publishes them
+        bump_data_version(['Bihar'])
+        self.assertEqual(self.list_districts(), ['D1', 'D2'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DistrictMoveTests(TestCase):
+    """A district moved to another state moves its share of the aggregates."""
+
+    def setUp(self):
+        for code, state in (('D1', 'Bihar'), ('D2', 'Bihar'), ('D3', 'Kerala')):
+            District.objects.create(code=code, name=code, state=state)
+        make_fetcher()._process_data([
+            make_record(code, month=month, person_days=days)
+            for code, days in (('D1', 1000), ('D2', 3000), ('D3', 5000))
+            for month in (1, 2)
+        ])
+        rebuild_state_aggregates(all_state_periods())
+
+    def assert_aggregates(self, expected):
+        """expected: state -> (district count, average person days)."""
+        for month in (1, 2):
+            self.assertEqual(
+                {
+                    aggregate.state: (aggregate.districtCount, aggregate.avgPersonDays)
+                    for aggregate in StatePeriodAggregate.objects.filter(month=month)
+                },
+                expected
+            )
+
+    def test_district_master_move(self):
+        self.assert_aggregates({'Bihar': (2, 2000), 'Kerala': (1, 5000)})
+
+        result = sync_districts([
+            {'code': 'D1', 'name': 'D1', 'state': 'Bihar'},
+            {'code': 'D2', 'name': 'D2', 'state': 'Kerala'},
+            {'code': 'D3', 'name': 'D3', 'state': 'Kerala'},
+        ])
+
+        self.assertEqual(result['changed'], {'D2': ['state']})
+        self.assert_aggregates({'Bihar': (1, 1000), 'Kerala': (2, 4000)})
+
+    def test_move_emptying_a_state(self):
+        sync_districts([
+            {'code': code, 'name': code, 'state': 'Kerala'}
+            for code in ('D1', 'D2', 'D3')
+        ])
+
+        self.assert_aggregates({'Kerala': (3, 3000)})
+
+    def test_single_district_move(self):
+        district = District.objects.get(code='D3')
+        district.state = 'Bihar'
+        with self.captureOnCommitCallbacks(execute=True):
+            district.save()
+
+        self.assert_aggregates({'Bihar': (3, 3000)})
+
+    def test_save_reads_no_previous_state(self):
+        district = District.objects.get(code='D3')
+        district.name = 'Three'
+        # Only the UPDATE: the stored state came with the instance
+        with self.assertNumQueries(1):
+            district.save()
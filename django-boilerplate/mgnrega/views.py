@@ -18,10 +18,12 @@ Following Reference.md format:
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.core.cache import cache
+from django.http import Http404
 from django.db.models import Avg, Q
 from django.utils import timezone
 
@@ -37,13 +39,24 @@ from mgnrega.serializers import (
 )
 from mgnrega.filters import DistrictFilter, PerformanceFilter
 from atomicloops.viewsets import AtomicViewSet
+from utils.data_version import (
+    district_latest_period,
+    district_state,
+    latest_key,
+    negative_cache_ttl,
+    query_fingerprint,
+    versioned_key
+)
+from utils.read_cache import cached_response
+from utils.sync_lock import sync_lock_status
 
 
 class HealthCheckView(APIView):
     """
     Health check endpoint for monitoring.
     
-    Returns system status including database, redis, and last data fetch.
+    Returns system status including database, redis, last data fetch
+    (with its timing and throughput metrics) and the data sync lock.
     Public endpoint (no authentication required).
     """
     
@@ -77,12 +90,21 @@ class HealthCheckView(APIView):
             if last_status:
                 last_fetch_time = last_status.lastFetched
                 last_fetch_status = last_status.status
+                last_fetch_metrics = last_status.syncMetrics
             else:
                 last_fetch_time = None
                 last_fetch_status = 'never'
+                last_fetch_metrics = None
         except Exception:
             last_fetch_time = None
             last_fetch_status = 'error'
+            last_fetch_metrics = None
+        
+        # Is a data sync running right now?
+        try:
+            sync_lock = sync_lock_status()
+        except Exception:
+            sync_lock = {'locked': None}
         
         # Overall status
         overall_status = 'ok' if (db_status and redis_status) else 'degraded'
@@ -93,10 +115,113 @@ class HealthCheckView(APIView):
             'database': db_status,
             'redis': redis_status,
             'lastFetch': last_fetch_time.isoformat() if last_fetch_time else None,
-            'lastFetchStatus': last_fetch_status
+            'lastFetchStatus': last_fetch_status,
+            'lastFetchMetrics': last_fetch_metrics,
+            'syncLock': sync_lock
         })
 
 
+def summary_cache_keys(pk, year, month):
+    """(versioned key, latest key) of a district summary response."""
+    period = f'{year}-{month}'
+    return (
+        versioned_key('summary', pk, period, state=district_state(pk)),
+        latest_key('summary', pk, period)
+    )
+
+
+def history_cache_keys(pk, from_year, from_month, to_year, to_month):
+    """(versioned key, latest key) of a district history response."""
+    window = (f'{from_year}-{from_month}', f'{to_year}-{to_month}')
+    return (
+        versioned_key('history', pk, *window, state=district_state(pk)),
+        latest_key('history', pk, *window)
+    )
+
+
+def summary_response(pk, year, month):
+    """
+    Build a district summary response from the database.
+    
+    Used by DistrictViewSet.summary and the post-sync cache warming
+    (mgnrega.tasks.warm_mgnrega_cache_task).
+    """
+    # Current month, previous month and state averages in one query
+    try:
+        row = Performance.objects.summary_row(int(pk), year, month)
+    except (TypeError, ValueError):
+        raise Http404
+    
+    if row is None:
+        if not District.objects.filter(pk=pk).exists():
+            raise Http404
+        return Response(
+            {
+                'error': {
+                    'code': 'NO_DATA_AVAILABLE',
+                    'message': f'No performance data for {year}-{month:02d}',
+                    'details': {
+                        'district_id': pk,
+                        'year': year,
+                        'month': month
+                    }
+                }
+            },
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    # Serialize with status calculations
+    serializer = PerformanceSummarySerializer(row)
+    
+    return Response(serializer.data)
+
+
+def history_response(pk, from_year, from_month, to_year, to_month):
+    """
+    Build a district history response from the database.
+    
+    Used by DistrictViewSet.history and the post-sync cache warming.
+    """
+    district = get_object_or_404(District, pk=pk)
+    
+    # Build query for date range
+    performances = Performance.objects.filter(
+        districtId=district
+    ).filter(
+        Q(year__gt=from_year) | Q(year=from_year, month__gte=from_month)
+    ).filter(
+        Q(year__lt=to_year) | Q(year=to_year, month__lte=to_month)
+    ).order_by('year', 'month')
+    
+    # Format data for time series
+    data_points = []
+    for perf in performances:
+        data_points.append({
+            'year': perf.year,
+            'month': perf.month,
+            'period': perf.period_display,
+            'personDays': perf.personDays,
+            'householdsWorked': perf.householdsWorked,
+            'totalWages': float(perf.totalWages),
+            'materialExpenditure': float(perf.materialExpenditure)
+        })
+    
+    response_data = {
+        'district': {
+            'id': district.id,
+            'name': district.name,
+            'state': district.state
+        },
+        'period': {
+            'from': f'{from_year}-{from_month:02d}',
+            'to': f'{to_year}-{to_month:02d}'
+        },
+        'data': data_points
+    }
+    
+    return Response(response_data)
+
+
 class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for District model.
@@ -121,19 +246,44 @@ class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
             return DistrictListSerializer
         return DistrictSerializer
     
+    def list(self, request, *args, **kwargs):
+        """
+        GET /api/districts/
+        
+        Cached per query string under the global data version.
+        """
+        fingerprint = query_fingerprint(request.query_params)
+        return cached_response(
+            versioned_key('districts', fingerprint),
+            lambda: super(DistrictViewSet, self).list(request, *args, **kwargs),
+            stale_key=latest_key('districts', fingerprint)
+        )
+    
     @action(detail=True, methods=['get'], url_path='summary')
     def summary(self, request, pk=None):
         """
         GET /api/districts/{id}/summary/?year=YYYY&month=MM
         
-        Returns current month performance summary with status indicators.
-        """
-        district = self.get_object()
+        Returns month performance summary with status indicators.
+        Without year and month, the district's latest period with data
+        is used (from the district map, no query).
         
-        # Get year and month from query params (default to current)
+        Uncached summaries are read with one SQL statement
+        (Performance.objects.summary_row); the district itself is only
+        looked up to tell a missing district from missing data. "No
+        data" responses are cached for MGNREGA_NEGATIVE_CACHE_TTL.
+        """
+        # Get year and month from query params (default to the latest
+        # period with data, or the current month if there is none)
         now = timezone.now()
-        year = int(request.query_params.get('year', now.year))
-        month = int(request.query_params.get('month', now.month))
+        latest = None
+        if 'year' not in request.query_params and 'month' not in request.query_params:
+            latest = district_latest_period(pk)
+            if latest is None and district_state(pk) is None:
+                raise Http404
+        default_year, default_month = latest or (now.year, now.month)
+        year = int(request.query_params.get('year', default_year))
+        month = int(request.query_params.get('month', default_month))
         
         # Validate month
         if month < 1 or month > 12:
@@ -148,45 +298,14 @@ class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Check cache first
-        cache_key = f'district:{pk}:summary:{year}-{month}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-        
-        # Get performance data
-        try:
-            performance = Performance.objects.select_related(
-                'districtId'
-            ).get(
-                districtId=district,
-                year=year,
-                month=month
-            )
-        except Performance.DoesNotExist:
-            return Response(
-                {
-                    'error': {
-                        'code': 'NO_DATA_AVAILABLE',
-                        'message': f'No performance data for {year}-{month:02d}',
-                        'details': {
-                            'district_id': pk,
-                            'year': year,
-                            'month': month
-                        }
-                    }
-                },
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Serialize with status calculations
-        serializer = PerformanceSummarySerializer(performance)
-        data = serializer.data
-        
-        # Cache for 1 hour
-        cache.set(cache_key, data, 3600)
-        
-        return Response(data)
+        # Cached; the key changes when the state's data does
+        key, stale_key = summary_cache_keys(pk, year, month)
+        return cached_response(
+            key,
+            lambda: summary_response(pk, year, month),
+            stale_key=stale_key,
+            negative_ttl=negative_cache_ttl()
+        )
     
     @action(detail=True, methods=['get'], url_path='history')
     def history(self, request, pk=None):
@@ -195,8 +314,6 @@ class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
         
         Returns historical performance data (time series).
         """
-        district = self.get_object()
-        
         # Parse date range from query params
         from_date = request.query_params.get('from')
         to_date = request.query_params.get('to')
@@ -235,42 +352,14 @@ class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Build query for date range
-        performances = Performance.objects.filter(
-            districtId=district
-        ).filter(
-            Q(year__gt=from_year) | Q(year=from_year, month__gte=from_month)
-        ).filter(
-            Q(year__lt=to_year) | Q(year=to_year, month__lte=to_month)
-        ).order_by('year', 'month')
-        
-        # Format data for time series
-        data_points = []
-        for perf in performances:
-            data_points.append({
-                'year': perf.year,
-                'month': perf.month,
-                'period': perf.period_display,
-                'personDays': perf.personDays,
-                'householdsWorked': perf.householdsWorked,
-                'totalWages': float(perf.totalWages),
-                'materialExpenditure': float(perf.materialExpenditure)
-            })
-        
-        response_data = {
-            'district': {
-                'id': district.id,
-                'name': district.name,
-                'state': district.state
-            },
-            'period': {
-                'from': from_date,
-                'to': to_date
-            },
-            'data': data_points
-        }
-        
-        return Response(response_data)
+        # Cached; the key changes when the state's data does
+        window = (pk, from_year, from_month, to_year, to_month)
+        key, stale_key = history_cache_keys(*window)
+        return cached_response(
+            key,
+            lambda: history_response(*window),
+            stale_key=stale_key
+        )
 
 
 class ComparisonView(APIView):
@@ -361,6 +450,22 @@ class ComparisonView(APIView):
         
         field_name = valid_metrics[metric]
         
+        # Cached; spans states, so keyed on the global version
+        parts = (
+            ','.join(map(str, sorted(set(district_ids)))),
+            metric,
+            f'{year}-{month}'
+        )
+        return cached_response(
+            versioned_key('compare', *parts),
+            lambda: self._comparison_response(
+                district_ids, metric, field_name, year, month
+            ),
+            stale_key=latest_key('compare', *parts)
+        )
+    
+    def _comparison_response(self, district_ids, metric, field_name, year, month):
+        """Build the comparison response from the database."""
         # Fetch comparison data
         performances = Performance.objects.filter(
             districtId__in=district_ids,
@@ -254,6 +254,27 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# CivicView: MGNREGA data sync (utils/mgnrega_fetcher.py)
+MGNREGA_PAGE_SIZE = 1000  # Records per API page
+MGNREGA_REQUEST_TIMEOUT = 30  # Seconds per page request
+MGNREGA_FETCH_CONCURRENCY = 4  # Pages fetched in parallel
+MGNREGA_SYNC_LOOKBACK_MONTHS = 2  # Months before the high-water mark re-fetched on incremental runs
+MGNREGA_WRITE_BACKEND = 'auto'  # 'orm', 'copy' (PostgreSQL COPY + merge) or 'auto'
+MGNREGA_SYNC_STALE_AFTER_MINUTES = 60  # IN_PROGRESS runs without a checkpoint for this long are marked failed
+MGNREGA_RETRY_BASE_DELAY = 60  # Seconds before the first retry of a failed sync (doubles per retry, jittered)
+MGNREGA_RETRY_MAX_DELAY = 900  # Upper bound on the retry delay in seconds
+MGNREGA_RETRY_MAX_ATTEMPTS = 5  # Retries of a failed sync before giving up
+MGNREGA_RESUME_MAX_AGE = 7 * 24 * 60 * 60  # Seconds an interrupted run stays resumable (one sync interval)
+MGNREGA_PAGE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'mgnrega_pages')  # Raw API page cache (None disables it)
+MGNREGA_PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Size cap of the page cache, LRU-evicted
+MGNREGA_SYNC_LOCK_TTL = 300  # Seconds a sync lock lease lives without a heartbeat
+MGNREGA_SYNC_LOCK_POLL_INTERVAL = 60  # Seconds before a queued sync task checks the lock again
+MGNREGA_SYNC_PARTITION_BY = None  # 'state' or 'year' to fan the scheduled sync out across workers
+MGNREGA_DISTRICT_MASTER = None  # District master file (CSV/JSON/NDJSON) synced into District before every fetch
+MGNREGA_CACHE_TTL = 60 * 60  # Seconds read endpoint responses stay cached (keys embed the data version, see utils/data_version.py)
+MGNREGA_CACHE_WARM_CONCURRENCY = 4  # Threads precomputing summaries/histories after a sync (utils/cache_warming.py)
+MGNREGA_NEGATIVE_CACHE_TTL = 60  # Seconds a summary "no data" response stays cached
+
 # REDIS Server
 CACHES = {
     "default": {
@@ -0,0 +1,163 @@
+"""
+Read Cache Warming
+------------------
+Precomputes, after a sync, the responses the dashboard asks for first,
+so visitors right after a data release are served from the cache
+instead of each paying for a cold read:
+
+- every district's summary for its latest period with data, which is
+  also what a summary request without a period resolves to
+- every district's default history window (the last
+  HISTORY_WINDOW_MONTHS months up to the current one, as requested by
+  the frontend's Historical view)
+
+The state-period aggregates those summaries read are built first, for
+any state-period the sync did not already rebuild.
+
+Responses are computed by the view builders themselves
+(mgnrega.views) and stored under the same versioned keys as the views
+use, on MGNREGA_CACHE_WARM_CONCURRENCY threads.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from mgnrega.models import District, StatePeriodAggregate
+from mgnrega.views import (
+    history_cache_keys,
+    history_response,
+    summary_cache_keys,
+    summary_response
+)
+from utils.read_cache import store_response
+from utils.state_aggregates import rebuild_state_aggregates
+
+logger = logging.getLogger(__name__)
+
+HISTORY_WINDOW_MONTHS = 12
+
+# (district id, latest year, latest month)
+DistrictPeriod = Tuple[int, int, int]
+
+
+def latest_periods(states: Optional[Iterable[str]] = None) -> List[DistrictPeriod]:
+    """
+    Latest period with performance data of every district that has
+    any (optionally only those of `states`), from
+    District.latestYear/latestMonth (refreshed by syncs).
+    """
+    districts = District.objects.filter(latestYear__isnull=False)
+    if states is not None:
+        districts = districts.filter(state__in=states)
+    return list(
+        districts.values_list('id', 'latestYear', 'latestMonth').order_by('id')
+    )
+
+
+def history_window(months: int = HISTORY_WINDOW_MONTHS) -> Tuple[int, int, int, int]:
+    """(from year, from month, to year, to month) of the default window."""
+    today = timezone.localdate()
+    start = today.year * 12 + today.month - months
+    return start // 12, start % 12 + 1, today.year, today.month
+
+
+def ensure_state_aggregates(periods: List[DistrictPeriod]) -> int:
+    """
+    Build the aggregates of the warmed state-periods that have none.
+
+    Returns:
+        Number of aggregates written
+    """
+    states = dict(District.objects.values_list('id', 'state'))
+    wanted = {
+        (states[district_id], year, month)
+        for district_id, year, month in periods
+        if district_id in states
+    }
+    existing = set(
+        StatePeriodAggregate.objects.filter(
+            year__in={year for _, year, _ in wanted},
+            month__in={month for _, _, month in wanted}
+        ).values_list('state', 'year', 'month')
+    )
+    missing = wanted - existing
+    return rebuild_state_aggregates(missing) if missing else 0
+
+
+def _warm(periods: List[DistrictPeriod], window: Tuple[int, int, int, int]) -> int:
+    """Store the summary and history of `periods`' districts (one thread)."""
+    warmed = 0
+    try:
+        for district_id, year, month in periods:
+            key, stale_key = summary_cache_keys(district_id, year, month)
+            warmed += store_response(
+                key,
+                lambda: summary_response(district_id, year, month),
+                stale_key=stale_key
+            )
+
+            key, stale_key = history_cache_keys(district_id, *window)
+            warmed += store_response(
+                key,
+                lambda: history_response(district_id, *window),
+                stale_key=stale_key
+            )
+    finally:
+        # Worker threads get their own connection; don't leak it
+        connection.close()
+    return warmed
+
+
+def warm_read_cache(
+    concurrency: int = None,
+    states: Optional[Iterable[str]] = None
+) -> Dict:
+    """
+    Warm the read cache with every district's summary and history.
+
+    Run after the sync's data versions are bumped, so the responses are
+    stored under the keys readers now compute. Only the districts of
+    the bumped states need warming: the other keys did not change.
+
+    Args:
+        concurrency: Worker threads (default: MGNREGA_CACHE_WARM_CONCURRENCY)
+        states: Only warm the districts of these states (default: all)
+
+    Returns:
+        Dict with districts, aggregates built, keys warmed and seconds
+    """
+    started = time.monotonic()
+    concurrency = max(1, concurrency or getattr(
+        settings, 'MGNREGA_CACHE_WARM_CONCURRENCY', 4
+    ))
+
+    periods = latest_periods(states)
+    aggregates = ensure_state_aggregates(periods)
+    window = history_window()
+
+    # One contiguous slice of districts per thread
+    size = -(-len(periods) // concurrency) or 1
+    slices = [periods[i:i + size] for i in range(0, len(periods), size)]
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix='mgnrega-warm'
+    ) as executor:
+        warmed = sum(executor.map(lambda chunk: _warm(chunk, window), slices))
+
+    seconds = round(time.monotonic() - started, 2)
+    logger.info(
+        f"Warmed {warmed} cache keys for {len(periods)} districts "
+        f"in {seconds}s"
+    )
+    return {
+        'districts': len(periods),
+        'aggregates': aggregates,
+        'warmed': warmed,
+        'seconds': seconds,
+    }
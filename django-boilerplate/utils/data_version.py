@@ -0,0 +1,200 @@
+"""
+Data Versions for Read Caching
+------------------------------
+Versioned cache keys for the MGNREGA read endpoints.
+
+Every sync bumps a global data version, and one per state it wrote,
+once its rows are committed. Cached responses embed the version they
+were built from in their key:
+
+- endpoints about one district (summary, history) use its state's
+  version, so a sync of another state leaves them cached
+- endpoints spanning districts (district list, compare) use the global
+  version
+
+A bump makes new data visible immediately: readers compute a key that
+does not exist yet, and entries under old versions are never read
+again and expire with their TTL. No key scanning, no cache flush.
+
+The per-process district map used to pick a district's state version
+also carries each district's latest period with data (District
+.latestYear/.latestMonth, refreshed by syncs), so a summary request
+without a period is resolved without a query.
+
+Versions start from a millisecond timestamp, so a version key lost to
+eviction or a Redis restart never restarts at a number whose entries
+may still be cached.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.text import slugify
+
+from mgnrega.models import District
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_VERSION_KEY = 'mgnrega:version'
+STATE_VERSION_KEY = 'mgnrega:version:state:{}'
+
+# District id -> (state, latest year, latest month), per process:
+# reloaded after MAX_AGE seconds, on an unknown id once the map is
+# MISS_RELOAD_AGE seconds old, or for latest periods after a sync
+DISTRICT_STATES_MAX_AGE = 300
+DISTRICT_STATES_MISS_RELOAD_AGE = 10
+_district_states: Dict[int, Tuple[str, Optional[int], Optional[int]]] = {}
+_district_states_loaded: Optional[float] = None
+_district_states_version: Optional[int] = None
+
+
+def cache_ttl() -> int:
+    """Seconds a versioned response stays cached."""
+    return getattr(settings, 'MGNREGA_CACHE_TTL', 3600)
+
+
+def negative_cache_ttl() -> int:
+    """Seconds a "no data" response stays cached."""
+    return getattr(settings, 'MGNREGA_NEGATIVE_CACHE_TTL', 60)
+
+
+def _state_key(state: str) -> str:
+    return STATE_VERSION_KEY.format(slugify(state))
+
+
+def _initial_version() -> int:
+    return int(time.time() * 1000)
+
+
+def _version(key: str) -> int:
+    """Read a version key, initialising it when missing."""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_data_version(states: Iterable[str] = ()):
+    """
+    Publish new data: bump the global version and those of `states`.
+
+    Call after the data is committed, so a reader that sees the new
+    version also sees the new rows.
+
+    Args:
+        states: States whose data changed
+    """
+    keys = [GLOBAL_VERSION_KEY, *sorted({_state_key(state) for state in states})]
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Never read yet (or evicted): any fresh version will do
+            cache.add(key, _initial_version(), timeout=None)
+    logger.info(f"Bumped data version ({len(keys) - 1} states)")
+
+
+def _load_district_states():
+    """Load the district map; one query for every district."""
+    global _district_states, _district_states_loaded, _district_states_version
+
+    _district_states_version = _version(GLOBAL_VERSION_KEY)
+    _district_states = {
+        district_id: (state, year, month)
+        for district_id, state, year, month in District.objects.values_list(
+            'id', 'state', 'latestYear', 'latestMonth'
+        )
+    }
+    _district_states_loaded = time.monotonic()
+
+
+def _district(district_id) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    try:
+        district_id = int(district_id)
+    except (TypeError, ValueError):
+        return None
+
+    age = (
+        float('inf') if _district_states_loaded is None
+        else time.monotonic() - _district_states_loaded
+    )
+    unknown = district_id not in _district_states
+    if age > DISTRICT_STATES_MAX_AGE or (unknown and age > DISTRICT_STATES_MISS_RELOAD_AGE):
+        _load_district_states()
+    return _district_states.get(district_id)
+
+
+def district_state(district_id) -> Optional[str]:
+    """
+    State of a district, from a per-process map of all districts.
+
+    The map costs one query for every district. It is reloaded when it
+    is DISTRICT_STATES_MAX_AGE seconds old, or misses a district (e.g.
+    one just created by sync_districts) and is a few seconds old, so
+    requests for unknown ids cannot force a reload each.
+
+    Returns:
+        State name, or None for an unknown district
+    """
+    district = _district(district_id)
+    return district[0] if district else None
+
+
+def district_latest_period(district_id) -> Optional[Tuple[int, int]]:
+    """
+    Newest (year, month) with performance data of a district.
+
+    Read from the district map, which is also reloaded when the global
+    data version moved since it was loaded, so the period is never
+    older than the last published sync.
+
+    Returns:
+        (year, month), or None for an unknown district or one without
+        data
+    """
+    if _district_states_version != _version(GLOBAL_VERSION_KEY):
+        _load_district_states()
+    district = _district(district_id)
+    if not district or district[1] is None:
+        return None
+    return district[1], district[2]
+
+
+def versioned_key(name: str, *parts, state: Optional[str] = None) -> str:
+    """
+    Cache key embedding the current data version.
+
+    Args:
+        name: Endpoint name (e.g. 'summary')
+        *parts: Values identifying the response (ids, periods, ...)
+        state: Use this state's version instead of the global one
+
+    Returns:
+        Key like 'mgnrega:summary:12:2024-3:v1730000000000'
+    """
+    version_key = _state_key(state) if state else GLOBAL_VERSION_KEY
+    version = _version(version_key)
+    return ':'.join(['mgnrega', name, *map(str, parts), f'v{version}'])
+
+
+def latest_key(name: str, *parts) -> str:
+    """
+    Version-less key holding the last value cached for a response, to
+    serve while the current version is recomputed (utils.read_cache).
+    """
+    return ':'.join(['mgnrega', name, *map(str, parts), 'latest'])
+
+
+def query_fingerprint(query_params) -> str:
+    """Short stable hash of request query parameters, for cache keys."""
+    canonical = '&'.join(
+        f"{key}={value}"
+        for key in sorted(query_params)
+        for value in query_params.getlist(key)
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
@@ -0,0 +1,264 @@
+"""
+District Master Sync
+--------------------
+Brings the District table in line with an official district master
+(codes, names, states, population, lat/lon) after a census or a
+redistricting.
+
+The master is streamed from a CSV, JSON or NDJSON file (optionally
+gzipped, see utils.mgnrega_file_reader) and diffed against District in
+a single pass:
+
+- existing districts are loaded with one query, as comparable tuples
+- new codes are bulk-created, changed rows bulk-updated, in batches
+- unchanged rows cost nothing, so an unchanged master makes no writes
+- codes missing from the master are reported, never deleted: their
+  performance history still references them
+- the state aggregates of districts moved to another state are rebuilt
+  for both states, and the data versions of changed states bumped, so
+  cached responses pick up renamed, moved or new districts
+
+Set settings.MGNREGA_DISTRICT_MASTER to sync before every fetch.
+"""
+
+import logging
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from mgnrega.models import District
+from utils.data_version import bump_data_version
+from utils.mgnrega_file_reader import iter_file_records
+from utils.state_aggregates import moved_state_periods, rebuild_state_aggregates
+
+logger = logging.getLogger(__name__)
+
+# Compared and written fields, in tuple order
+SYNCED_FIELDS = ('name', 'state', 'population', 'lat', 'lon')
+
+# Accepted column names for each field (official masters and
+# data.gov.in use different headers)
+FIELD_ALIASES = {
+    'code': ('code', 'district_code', 'districtCode'),
+    'name': ('name', 'district_name', 'districtName'),
+    'state': ('state', 'state_name', 'stateName'),
+    'population': ('population', 'total_population'),
+    'lat': ('lat', 'latitude'),
+    'lon': ('lon', 'lng', 'longitude'),
+}
+
+COORDINATE_PLACES = Decimal('0.0000001')
+MAX_ERROR_SAMPLES = 20
+
+
+def normalize_district(record: Dict) -> Dict:
+    """
+    Map a master record onto District fields.
+
+    Values are coerced to what the database stores (trimmed strings,
+    int population, 7-place coordinates), so they compare equal to an
+    unchanged District.
+
+    Args:
+        record: Raw master record
+
+    Returns:
+        Dict with code and SYNCED_FIELDS
+
+    Raises:
+        ValueError if a required field is missing or a value is invalid
+    """
+    district = {}
+    for field, aliases in FIELD_ALIASES.items():
+        value = next(
+            (record[alias] for alias in aliases if record.get(alias) not in (None, '')),
+            None
+        )
+        district[field] = value.strip() if isinstance(value, str) else value
+
+    for field in ('code', 'name', 'state'):
+        if not district[field]:
+            raise ValueError(f"Missing {field}")
+        district[field] = str(district[field])
+
+    if district['population'] is not None:
+        try:
+            district['population'] = int(Decimal(str(district['population'])))
+        except (InvalidOperation, ValueError):
+            raise ValueError(f"Invalid population: {district['population']}")
+        if district['population'] < 0:
+            raise ValueError(f"Negative population: {district['population']}")
+
+    for field, bound in (('lat', 90), ('lon', 180)):
+        if district[field] is None:
+            continue
+        try:
+            value = Decimal(str(district[field])).quantize(COORDINATE_PLACES)
+        except InvalidOperation:
+            raise ValueError(f"Invalid {field}: {district[field]}")
+        if not -bound <= value <= bound:
+            raise ValueError(f"{field} out of range: {value}")
+        district[field] = value
+
+    return district
+
+
+def sync_districts(
+    records: Iterable[Dict],
+    dry_run: bool = False,
+    batch_size: int = 1000
+) -> Dict:
+    """
+    Diff a district master against District and apply the changes.
+
+    Args:
+        records: Master records (streamed; consumed once)
+        dry_run: Compute the diff without writing
+        batch_size: Rows per bulk_create / bulk_update statement
+
+    Returns:
+        Dict with created, updated, unchanged and invalid counts,
+        removed (codes in District but not in the master), changed
+        (code -> changed field names, for updated rows) and errors (a
+        sample of invalid records)
+    """
+    ids = {}
+    existing = {}
+    for code, district_id, *values in District.objects.values_list(
+        'code', 'id', *SYNCED_FIELDS
+    ):
+        ids[code] = district_id
+        existing[code] = tuple(values)
+    seen = set()
+    changed_states = set()
+    # District id -> previous state, for districts moved to another state
+    moved = {}
+    to_create: List[District] = []
+    to_update: List[District] = []
+    result = {
+        'created': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'invalid': 0,
+        'removed': [],
+        'changed': {},
+        'errors': [],
+    }
+
+    def flush():
+        if dry_run or not (to_create or to_update):
+            to_create.clear()
+            to_update.clear()
+            return
+        with transaction.atomic():
+            if to_create:
+                District.objects.bulk_create(to_create, batch_size=batch_size)
+            if to_update:
+                # bulk_update skips auto_now, so updatedAt is set explicitly
+                now = timezone.now()
+                for district in to_update:
+                    district.updatedAt = now
+                District.objects.bulk_update(
+                    to_update,
+                    [*SYNCED_FIELDS, 'updatedAt'],
+                    batch_size=batch_size
+                )
+        to_create.clear()
+        to_update.clear()
+
+    for line, record in enumerate(records, 1):
+        try:
+            district = normalize_district(record)
+            if district['code'] in seen:
+                raise ValueError(f"Duplicate code {district['code']}")
+        except ValueError as e:
+            result['invalid'] += 1
+            if len(result['errors']) < MAX_ERROR_SAMPLES:
+                result['errors'].append({'record': line, 'error': str(e)})
+            continue
+
+        code = district['code']
+        seen.add(code)
+        values = tuple(district[field] for field in SYNCED_FIELDS)
+        current = existing.get(code)
+
+        if current is None:
+            to_create.append(District(code=code, **dict(zip(SYNCED_FIELDS, values))))
+            changed_states.add(district['state'])
+            result['created'] += 1
+        elif current != values:
+            # A district moved to another state changes both
+            previous_state = current[SYNCED_FIELDS.index('state')]
+            changed_states.update((district['state'], previous_state))
+            if previous_state != district['state']:
+                moved[ids[code]] = previous_state
+            to_update.append(District(
+                id=ids[code],
+                code=code,
+                **dict(zip(SYNCED_FIELDS, values))
+            ))
+            result['changed'][code] = [
+                field for field, old, new in zip(SYNCED_FIELDS, current, values)
+                if old != new
+            ]
+            result['updated'] += 1
+        else:
+            result['unchanged'] += 1
+
+        if len(to_create) + len(to_update) >= batch_size:
+            flush()
+
+    flush()
+    result['removed'] = sorted(existing.keys() - seen)
+    if not dry_run and moved:
+        rebuild_state_aggregates(moved_state_periods(moved))
+    if not dry_run and (result['created'] or result['updated']):
+        bump_data_version(changed_states)
+
+    logger.info(
+        f"District master sync{' (dry run)' if dry_run else ''}: "
+        f"{result['created']} created, {result['updated']} updated, "
+        f"{result['unchanged']} unchanged, {result['invalid']} invalid, "
+        f"{len(result['removed'])} not in master"
+    )
+    return result
+
+
+def sync_districts_file(
+    path: str,
+    file_format: Optional[str] = None,
+    **kwargs
+) -> Dict:
+    """
+    Sync District from a master file (see sync_districts).
+
+    Args:
+        path: CSV, JSON or NDJSON file, optionally gzipped
+        file_format: 'csv', 'json' or 'ndjson' (inferred when omitted)
+        **kwargs: sync_districts arguments
+    """
+    return sync_districts(iter_file_records(path, file_format), **kwargs)
+
+
+def sync_district_master() -> Optional[Dict]:
+    """
+    Sync District from settings.MGNREGA_DISTRICT_MASTER, if configured.
+
+    Called before every fetch; a master that cannot be read is logged
+    and skipped so it never blocks the data sync.
+
+    Returns:
+        sync_districts result, or None when not configured or failed
+    """
+    path = getattr(settings, 'MGNREGA_DISTRICT_MASTER', None)
+    if not path:
+        return None
+
+    try:
+        return sync_districts_file(path)
+    except (OSError, ValueError) as e:
+        logger.error(f"District master sync from {path} failed: {e}")
+        return None
@@ -0,0 +1,171 @@
+"""
+Bounded Error Report
+--------------------
+Constant-memory accounting of rejected records during a sync.
+
+Instead of keeping every failure, a report holds:
+- the total number of rejected records
+- a counter per error type, capped at MAX_TYPES distinct types. A
+  RecordError carries its type (e.g. "Invalid month 13 (must be 1-12)"
+  counts as "Invalid month"); for other messages it is the part before
+  the first ': '
+- a uniform random sample of SAMPLE_SIZE failures (reservoir sampling)
+
+Memory therefore stays flat however many records upstream gets wrong.
+The full rejected records are kept in the FailedRecord table.
+"""
+
+import random
+from typing import Dict, List, Optional
+
+SAMPLE_SIZE = 10
+MAX_TYPES = 50
+MAX_TYPE_LENGTH = 200
+OTHER_TYPE = 'Other'
+
+
+class RecordError(str):
+    """
+    An error message that also carries its error type.
+
+    It is still the plain message wherever it is stored or compared, so
+    messages can read naturally while the report groups them by type.
+
+    Usage:
+        RecordError('Invalid month', f'Invalid month {month} (must be 1-12)')
+    """
+
+    def __new__(cls, kind: str, message: str):
+        error = super().__new__(cls, message)
+        error.kind = kind
+        return error
+
+
+def error_type(message: str) -> str:
+    """
+    Type of an error message: a RecordError's own type, otherwise the
+    part before ': '.
+    """
+    kind = getattr(message, 'kind', None) or str(message).split(': ', 1)[0]
+    return kind[:MAX_TYPE_LENGTH]
+
+
+class ErrorReport:
+    """
+    Bounded summary of the errors seen during a run.
+
+    Usage:
+        report = ErrorReport()
+        report.add(record, [RecordError('Invalid month', 'Invalid month 13 (must be 1-12)')])
+        report.summary()
+    """
+
+    def __init__(
+        self,
+        sample_size: int = SAMPLE_SIZE,
+        max_types: int = MAX_TYPES
+    ):
+        self.sample_size = sample_size
+        self.max_types = max_types
+        self.total = 0
+        self.by_type: Dict[str, int] = {}
+        self.samples: List[Dict] = []
+
+    @classmethod
+    def from_summary(cls, summary: Optional[Dict]) -> 'ErrorReport':
+        """Rebuild a report from summary() output (e.g. on resume)."""
+        report = cls()
+        if summary:
+            report.total = summary.get('total', 0)
+            report.by_type = dict(summary.get('byType', {}))
+            report.samples = list(summary.get('samples', []))
+        return report
+
+    def add(self, record: Optional[Dict], errors: List[str]):
+        """
+        Account for one rejected record.
+
+        Args:
+            record: Raw record (None when not attributable to one record)
+            errors: Error messages for the record
+        """
+        self.total += 1
+
+        for message in errors:
+            self._count(error_type(message), 1)
+
+        # Reservoir sampling: every failure is kept with equal probability
+        sample = {'record': record, 'errors': errors}
+        if len(self.samples) < self.sample_size:
+            self.samples.append(sample)
+        else:
+            slot = random.randrange(self.total)
+            if slot < self.sample_size:
+                self.samples[slot] = sample
+
+    def add_many(self, count: int, message: str):
+        """
+        Account for `count` records rejected with the same error, e.g. a
+        failed chunk write, without sampling each of them.
+        """
+        if count <= 0:
+            return
+        self.total += count
+        self._count(error_type(message), count)
+
+        sample = {'record': None, 'errors': [message]}
+        if len(self.samples) < self.sample_size:
+            self.samples.append(sample)
+        elif random.random() < min(1.0, self.sample_size * count / self.total):
+            self.samples[random.randrange(self.sample_size)] = sample
+
+    def merge(self, other: 'ErrorReport'):
+        """
+        Fold another report into this one (e.g. partition runs).
+
+        Samples are drawn from both reservoirs in proportion to the
+        number of errors each one represents.
+        """
+        for kind, count in other.by_type.items():
+            self._count(kind, count)
+
+        mine, theirs = self.total, other.total
+        self.total += other.total
+        if not other.samples:
+            return
+        if not self.samples:
+            self.samples = list(other.samples[:self.sample_size])
+            return
+
+        pool = [(sample, mine / len(self.samples)) for sample in self.samples]
+        pool += [(sample, theirs / len(other.samples)) for sample in other.samples]
+        keep = []
+        while pool and len(keep) < self.sample_size:
+            pick = random.uniform(0, sum(weight for _, weight in pool))
+            for index, (sample, weight) in enumerate(pool):
+                pick -= weight
+                if pick <= 0:
+                    break
+            keep.append(pool.pop(index)[0])
+        self.samples = keep
+
+    def top_types(self, limit: int = 5) -> List:
+        """Most frequent error types as (type, count) pairs."""
+        return sorted(
+            self.by_type.items(),
+            key=lambda item: item[1],
+            reverse=True
+        )[:limit]
+
+    def summary(self) -> Dict:
+        """JSON-serialisable summary (stored on APIStatus.errorSummary)."""
+        return {
+            'total': self.total,
+            'byType': dict(self.top_types(self.max_types + 1)),
+            'samples': self.samples,
+        }
+
+    def _count(self, kind: str, count: int):
+        if kind not in self.by_type and len(self.by_type) >= self.max_types:
+            kind = OTHER_TYPE
+        self.by_type[kind] = self.by_type.get(kind, 0) + count
@@ -0,0 +1,152 @@
+"""
+PostgreSQL COPY Loader for Performance
+--------------------------------------
+Bulk-loads Performance rows for large backfills.
+
+Rows are streamed into a session-local temporary staging table with
+COPY FROM STDIN, then merged into `performance` with one set-based
+INSERT ... ON CONFLICT DO UPDATE that only touches rows whose metric
+fingerprint changed.
+
+Only available on PostgreSQL; callers fall back to the batched ORM path
+elsewhere (see MGNREGADataFetcher._resolve_backend).
+"""
+
+import csv
+import io
+import logging
+from typing import List, Tuple
+
+from django.db import connection
+from django.utils import timezone
+
+from mgnrega.models import Performance
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = 'performance_staging'
+
+# Model fields staged and merged, in COPY column order
+STAGED_FIELDS = (
+    'districtId',
+    'year',
+    'month',
+    'personDays',
+    'householdsWorked',
+    'totalWages',
+    'materialExpenditure',
+    'fingerprint',
+)
+
+
+def copy_supported() -> bool:
+    """Return True when the default database can run COPY FROM STDIN."""
+    return connection.vendor == 'postgresql'
+
+
+def _column(field_name: str) -> str:
+    return Performance._meta.get_field(field_name).column
+
+
+def _ensure_staging_table(cursor):
+    """
+    Create the staging table for this connection if needed and empty it.
+
+    Temporary tables are private to the session and never WAL-logged.
+    """
+    table = Performance._meta.db_table
+    columns = ', '.join(_column(field) for field in STAGED_FIELDS)
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} AS "
+        f"SELECT {columns} FROM {table} WITH NO DATA"
+    )
+    cursor.execute(f"TRUNCATE {STAGING_TABLE}")
+
+
+def _copy_rows(cursor, rows: List[Performance]):
+    """Stream rows into the staging table with COPY FROM STDIN."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow((
+            row.districtId_id,
+            row.year,
+            row.month,
+            row.personDays,
+            row.householdsWorked,
+            row.totalWages,
+            row.materialExpenditure,
+            row.fingerprint,
+        ))
+    buffer.seek(0)
+
+    columns = ', '.join(_column(field) for field in STAGED_FIELDS)
+    sql = f"COPY {STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)"
+
+    raw_cursor = cursor.cursor
+    if hasattr(raw_cursor, 'copy_expert'):
+        # psycopg2
+        raw_cursor.copy_expert(sql, buffer)
+    else:
+        # psycopg 3
+        with raw_cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def copy_merge_performance(rows: List[Performance]) -> Tuple[int, int]:
+    """
+    Stage rows with COPY and merge them into `performance`.
+
+    Must run inside a transaction. Rows must be unique on
+    (districtId, year, month) and carry their fingerprint.
+
+    Args:
+        rows: Unsaved Performance instances
+
+    Returns:
+        Tuple of (created, updated) counts; rows whose fingerprint
+        matched the stored one are left untouched
+    """
+    if not rows:
+        return 0, 0
+
+    table = Performance._meta.db_table
+    staged = [_column(field) for field in STAGED_FIELDS]
+    key = [_column(field) for field in ('districtId', 'year', 'month')]
+    changed = [column for column in staged if column not in key]
+    created_at = _column('createdAt')
+    updated_at = _column('updatedAt')
+    fingerprint = _column('fingerprint')
+
+    updates = ', '.join(
+        f"{column} = EXCLUDED.{column}"
+        for column in (*changed, updated_at)
+    )
+
+    merge_sql = (
+        f"WITH merged AS ("
+        f"INSERT INTO {table} AS target "
+        f"({created_at}, {updated_at}, {', '.join(staged)}) "
+        f"SELECT %s, %s, {', '.join(staged)} FROM {STAGING_TABLE} "
+        f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates} "
+        f"WHERE target.{fingerprint} IS DISTINCT FROM EXCLUDED.{fingerprint} "
+        f"RETURNING (xmax = 0) AS inserted"
+        f") "
+        f"SELECT "
+        f"COUNT(*) FILTER (WHERE inserted), "
+        f"COUNT(*) FILTER (WHERE NOT inserted) "
+        f"FROM merged"
+    )
+
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        _ensure_staging_table(cursor)
+        _copy_rows(cursor, rows)
+        cursor.execute(merge_sql, [now, now])
+        created, updated = cursor.fetchone()
+
+    logger.debug(
+        f"COPY merge of {len(rows)} rows: {created} created, "
+        f"{updated} updated"
+    )
+    return created, updated
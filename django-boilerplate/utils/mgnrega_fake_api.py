@@ -0,0 +1,343 @@
+"""
+Fake data.gov.in Server
+-----------------------
+Local stand-in for the data.gov.in datastore API, serving synthetic
+MGNREGA records (utils.synthetic_data) for benchmarks and offline runs.
+The real API is rate-limited and unreachable from CI.
+
+Answers GET <any path>/<resource_id>?offset=&limit=&filters[field]=value
+with the same response shape as the real resource:
+
+    {"total": 159840, "count": 1000, "offset": 0, "limit": 1000,
+     "updated_date": "...", "records": [...]}
+
+Configurable:
+- dataset size: districts x years (national scale is 741 x 18)
+- max_page_size: `limit` is clamped to it, like the real API
+- latency (+ random jitter) added to every request
+- error_rate: share of requests answered 503 with a Retry-After header
+
+Records are generated per request, so memory does not grow with the
+dataset. Supports filters on year, month, state_name and district_code,
+and ETag / If-None-Match (304).
+
+Run standalone:
+    python -m utils.mgnrega_fake_api --districts 741 --years 18 --port 8765
+
+No Django dependency: the benchmark runs it in a child process
+(FakeDataGovProcess) so it does not compete with the fetcher for the GIL.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import random
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from utils.synthetic_data import (
+    NATIONAL_DISTRICTS,
+    NATIONAL_YEARS,
+    synthetic_districts,
+    synthetic_periods,
+    synthetic_record,
+)
+
+RESOURCE_ID = 'MGNREGA_RESOURCE_ID'
+DEFAULT_MAX_PAGE_SIZE = 1000
+RETRY_AFTER = 1
+
+
+class FakeDataGovServer:
+    """
+    Threaded HTTP server serving a synthetic MGNREGA resource.
+
+    Usage:
+        with FakeDataGovServer(districts=741, years=18) as url:
+            fetcher.API_BASE_URL = url
+            ...
+    """
+
+    def __init__(
+        self,
+        districts: int = NATIONAL_DISTRICTS,
+        years: int = NATIONAL_YEARS,
+        start_year: Optional[int] = None,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        prefix: str = 'SYN',
+        resource_id: str = RESOURCE_ID,
+        updated: Optional[str] = None,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """
+        Args:
+            districts: Number of synthetic districts
+            years: Number of calendar years of monthly records
+            start_year: First year (defaults to `years` years back from
+                the current year)
+            max_page_size: Upper bound on `limit`
+            latency: Seconds added to every request
+            jitter: Extra random seconds (0..jitter) per request
+            error_rate: Share of requests answered with a 503 (0-1)
+            seed: Random seed of the data and of the injected errors
+            prefix: District code prefix (see synthetic_districts)
+            resource_id: Resource id served (last path segment)
+            updated: Resource `updated_date` stamp (defaults to now)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        if start_year is None:
+            start_year = datetime.now().year - years + 1
+        self.districts = synthetic_districts(districts, seed, prefix)
+        self.periods = synthetic_periods(start_year, years)
+        self.max_page_size = max_page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self.resource_id = resource_id
+        self.updated = updated or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.dataset = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the fetcher's API_BASE_URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/datastore/resource"
+
+    @property
+    def total(self) -> int:
+        """Number of records in the unfiltered resource."""
+        return len(self.periods) * len(self.districts)
+
+    def start(self) -> str:
+        """Serve from a daemon thread; returns the base URL."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name='fake-data-gov',
+            daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        """Answer one GET request."""
+        parsed = urlparse(request.path)
+        if parsed.path.rstrip('/').rsplit('/', 1)[-1] != self.resource_id:
+            return self._send(request, 404, {'error': 'Unknown resource'})
+
+        delay = self.latency
+        with self._rng_lock:
+            if self.jitter:
+                delay += self._rng.uniform(0, self.jitter)
+            fail = self.error_rate and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self._send(
+                request,
+                503,
+                {'error': 'Service temporarily unavailable'},
+                {'Retry-After': str(RETRY_AFTER)}
+            )
+
+        query = parse_qs(parsed.query)
+        try:
+            offset = max(0, int(query.get('offset', ['0'])[0]))
+            limit = int(query.get('limit', ['10'])[0])
+        except ValueError:
+            return self._send(request, 400, {'error': 'Invalid offset or limit'})
+        limit = max(0, min(limit, self.max_page_size))
+        filters = {
+            key[len('filters['):-1]: values[0]
+            for key, values in query.items()
+            if key.startswith('filters[') and key.endswith(']')
+        }
+
+        etag = '"{}"'.format(hashlib.sha1(
+            f"{self.updated}:{sorted(query.items())}".encode('utf-8')
+        ).hexdigest())
+        if request.headers.get('If-None-Match') == etag:
+            return self._send(request, 304, None, {'ETag': etag})
+
+        periods = [
+            (year, month) for year, month in self.periods
+            if str(year) == filters.get('year', str(year))
+            if str(month) == filters.get('month', str(month))
+        ]
+        districts = [
+            district for district in self.districts
+            if district['state'] == filters.get('state_name', district['state'])
+            if district['code'] == filters.get('district_code', district['code'])
+        ]
+
+        # Record i is district i % D of period i // D: no materialisation
+        total = len(periods) * len(districts)
+        records = []
+        for index in range(offset, min(offset + limit, total)):
+            year, month = periods[index // len(districts)]
+            records.append(synthetic_record(
+                districts[index % len(districts)], year, month, self.seed
+            ))
+
+        self._send(request, 200, {
+            'total': total,
+            'count': len(records),
+            'offset': offset,
+            'limit': limit,
+            'updated_date': self.updated,
+            'records': records,
+        }, {'ETag': etag})
+
+    def _send(
+        self,
+        request: BaseHTTPRequestHandler,
+        status: int,
+        payload: Optional[Dict],
+        headers: Optional[Dict] = None
+    ):
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        request.send_response(status)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        if payload is not None:
+            request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so the fetcher's pooled session reuses connections
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.dataset.handle(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve(options: Dict, conn):
+    server = FakeDataGovServer(**options)
+    conn.send(server.url)
+    conn.close()
+    server.serve_forever()
+
+
+class FakeDataGovProcess:
+    """
+    Run a FakeDataGovServer in a child process.
+
+    Usage:
+        with FakeDataGovProcess(districts=741, latency=0.05) as url:
+            ...
+    """
+
+    START_TIMEOUT = 30
+
+    def __init__(self, **options):
+        """
+        Args:
+            **options: FakeDataGovServer arguments
+        """
+        self.options = options
+        self.process = None
+
+    def __enter__(self) -> str:
+        context = multiprocessing.get_context('spawn')
+        receiver, sender = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_serve,
+            args=(self.options, sender),
+            name='fake-data-gov',
+            daemon=True
+        )
+        self.process.start()
+        sender.close()
+        if not receiver.poll(self.START_TIMEOUT):
+            self.process.terminate()
+            raise RuntimeError('Fake data.gov.in server did not start')
+        return receiver.recv()
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        self.process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve synthetic MGNREGA records like data.gov.in'
+    )
+    parser.add_argument('--districts', type=int, default=NATIONAL_DISTRICTS)
+    parser.add_argument('--years', type=int, default=NATIONAL_YEARS)
+    parser.add_argument('--start-year', type=int)
+    parser.add_argument('--max-page-size', type=int, default=DEFAULT_MAX_PAGE_SIZE)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Seconds added to every request')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Extra random seconds per request')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Share of requests answered with a 503 (0-1)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--prefix', default='SYN')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = FakeDataGovServer(
+        districts=args.districts,
+        years=args.years,
+        start_year=args.start_year,
+        max_page_size=args.max_page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        prefix=args.prefix,
+        host=args.host,
+        port=args.port
+    )
+    print(
+        f"Serving {server.total} synthetic records at "
+        f"{server.url}/{server.resource_id}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -5,27 +5,132 @@ Fetches and validates MGNREGA data from data.gov.in API.
 
 This service:
 - Connects to the external MGNREGA API
+- Streams the paginated resource, fetching pages concurrently
+- Sends conditional requests and keeps raw pages in an on-disk cache
+- Syncs incrementally from a per-source high-water mark
+- Splits a sync into state or year partitions for parallel workers
+- Ingests offline NDJSON/CSV/JSON dumps through the same pipeline
+- Writes via batched ORM upserts or PostgreSQL COPY + merge
+- Checkpoints every committed batch so interrupted runs can resume
+- Keeps rejected records in a dead-letter table for reprocessing
 - Validates data schema and ranges
-- Handles errors with retry logic
+- Records per-stage timings and throughput of every run
+- Rebuilds the state-period aggregates the run touched and bumps the
+  data versions that cached responses are keyed on
+- Fails fast on page errors; retries are scheduled by the caller
+  (see retry_backoff and mgnrega.tasks)
 - Logs all operations for debugging
 - Updates APIStatus for monitoring
 
 Following prompt_rules.md and master prompt requirements.
 """
 
+import json
+import math
+import os
+import random
 import requests
 import logging
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 from django.db import transaction
+from django.db.models import Q, Sum
 from django.utils import timezone
 
-from mgnrega.models import District, Performance, APIStatus
+from mgnrega.models import (
+    District,
+    Performance,
+    APIStatus,
+    SyncState,
+    FailedRecord
+)
+from utils.mgnrega_copy_loader import copy_merge_performance, copy_supported
+from utils.mgnrega_file_reader import iter_batches, iter_file_records
+from utils.error_report import ErrorReport, RecordError
+from utils.data_version import bump_data_version
+from utils.page_cache import PageCache
+from utils.state_aggregates import refresh_state_aggregates
+from utils.sync_metrics import SyncMetrics
 
 logger = logging.getLogger(__name__)
 
 
+class Page(NamedTuple):
+    """
+    A single page of the paginated API resource.
+    
+    A not_modified page (304 for a page whose records are already
+    committed) carries no records, only their count.
+    """
+    records: List[Dict]
+    total: Optional[int]
+    updated: Optional[str]
+    count: int = 0
+    key: Optional[str] = None
+    not_modified: bool = False
+
+
+class PageFetchError(Exception):
+    """
+    A page request failed.
+    
+    Raised without sleeping or retrying in-process: the run checkpoints
+    up to the last committed batch and the caller decides whether to
+    schedule a resume (see retry_backoff).
+    
+    Attributes:
+        retryable: False for client errors that will fail again
+            (4xx other than 408/429)
+        retry_after: Seconds requested by the server's Retry-After
+            header, if any
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = True,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def retry_backoff(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Delay before retry number `attempt` (0-based) of a failed sync.
+    
+    This is the single retry policy for the sync: exponential backoff
+    from MGNREGA_RETRY_BASE_DELAY, capped at MGNREGA_RETRY_MAX_DELAY,
+    with "equal jitter" (half fixed, half random) so workers retrying
+    the same outage spread out instead of hitting the API together.
+    A server-provided Retry-After is honoured as a lower bound.
+    
+    Args:
+        attempt: Number of retries already made
+        retry_after: Optional Retry-After seconds from the server
+        
+    Returns:
+        Countdown in seconds
+    """
+    base = getattr(settings, 'MGNREGA_RETRY_BASE_DELAY', 60)
+    cap = getattr(settings, 'MGNREGA_RETRY_MAX_DELAY', 900)
+    
+    ceiling = min(cap, base * (2 ** attempt))
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    
+    if retry_after:
+        delay = max(delay, retry_after)
+    return delay
+
+
 class MGNREGADataFetcher:
     """
     Fetches and processes MGNREGA district performance data.
@@ -39,172 +144,1304 @@ class MGNREGADataFetcher:
     API_RESOURCE_ID = "MGNREGA_RESOURCE_ID"  # To be updated
     API_KEY = None  # Set if required
     
-    # Retry configuration
-    MAX_RETRIES = 3
-    RETRY_DELAYS = [60, 120, 300]  # Exponential backoff in seconds
+    # Pagination configuration (overridable via settings)
+    DEFAULT_PAGE_SIZE = 1000
+    DEFAULT_TIMEOUT = 30
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    
+    # Incremental sync configuration
+    SOURCE = 'data.gov.in/mgnrega'
+    DEFAULT_LOOKBACK_MONTHS = 2
+    DEFAULT_RESUME_MAX_AGE = 7 * 24 * 60 * 60  # One weekly sync interval
     
     # Validation constants
     MIN_YEAR = 2006  # MGNREGA started in 2006
     VALID_MONTHS = range(1, 13)
+    REQUIRED_FIELDS = (
+        'district_code',
+        'year',
+        'month',
+        'person_days',
+        'households_worked',
+        'total_wages'
+    )
+    NUMERIC_FIELDS = (
+        'person_days',
+        'households_worked',
+        'total_wages',
+        'material_expenditure'
+    )
+    # Stored in integer columns: must be whole numbers
+    INTEGER_FIELDS = (
+        'person_days',
+        'households_worked'
+    )
+    
+    # Bulk write configuration
+    CHUNK_SIZE = 1000
+    METRIC_FIELDS = (
+        'personDays',
+        'householdsWorked',
+        'totalWages',
+        'materialExpenditure'
+    )
+    DECIMAL_PLACES = Decimal('0.01')
+    BACKEND_ORM = 'orm'
+    BACKEND_COPY = 'copy'
+    BACKEND_AUTO = 'auto'
+    BACKENDS = (BACKEND_ORM, BACKEND_COPY, BACKEND_AUTO)
+    
+    # Partitioned sync configuration
+    PARTITION_STATE = 'state'
+    PARTITION_YEAR = 'year'
+    PARTITIONS = (PARTITION_STATE, PARTITION_YEAR)
+    STATE_FILTER_FIELD = 'state_name'
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        page_size: Optional[int] = None,
+        start_offset: int = 0,
+        concurrency: Optional[int] = None,
+        full: bool = False,
+        lookback_months: Optional[int] = None,
+        backend: Optional[str] = None,
+        resume: bool = False,
+        streams: Optional[List[Dict]] = None,
+        partition: Optional[str] = None,
+        parent: Optional[APIStatus] = None
+    ):
         """
         Initialize the fetcher.
         
         Args:
             api_key: Optional API key for data.gov.in
+            page_size: Records requested per API page
+                (defaults to settings.MGNREGA_PAGE_SIZE)
+            start_offset: Record offset to start fetching from
+            concurrency: Pages fetched in parallel
+                (defaults to settings.MGNREGA_FETCH_CONCURRENCY)
+            full: Force a complete resync instead of an incremental one
+            lookback_months: Months before the high-water mark that are
+                re-fetched because upstream may still revise them
+                (defaults to settings.MGNREGA_SYNC_LOOKBACK_MONTHS)
+            backend: Write backend, 'orm', 'copy' or 'auto'
+                (defaults to settings.MGNREGA_WRITE_BACKEND)
+            resume: Continue the source's last interrupted run from its
+                checkpoint instead of starting from zero
+            streams: API filter dicts to fetch instead of planning them
+                (used by partition runs)
+            partition: Partition key (e.g. 'state=Bihar'); partition
+                runs are tracked under their own source and leave the
+                high-water mark to the parent run
+            parent: Parent APIStatus of a partitioned sync
         """
         self.api_key = api_key or self.API_KEY
+        self.page_size = page_size or getattr(
+            settings, 'MGNREGA_PAGE_SIZE', self.DEFAULT_PAGE_SIZE
+        )
+        self.timeout = getattr(
+            settings, 'MGNREGA_REQUEST_TIMEOUT', self.DEFAULT_TIMEOUT
+        )
+        self.concurrency = max(1, concurrency or getattr(
+            settings, 'MGNREGA_FETCH_CONCURRENCY', self.DEFAULT_CONCURRENCY
+        ))
+        self.offset = start_offset
+        self.full = full
+        self.resume = resume
+        self.streams = streams
+        self.stream_index = 0
+        self.partition = partition
+        self.parent = parent
+        self.source = (
+            f"{self.SOURCE}:{partition}" if partition else self.SOURCE
+        )
+        self.lookback_months = lookback_months
+        if self.lookback_months is None:
+            self.lookback_months = getattr(
+                settings,
+                'MGNREGA_SYNC_LOOKBACK_MONTHS',
+                self.DEFAULT_LOOKBACK_MONTHS
+            )
+        self.backend = self._resolve_backend(
+            backend or getattr(
+                settings, 'MGNREGA_WRITE_BACKEND', self.BACKEND_AUTO
+            )
+        )
+        
+        # One connection pool shared by all fetch threads
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.concurrency
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Raw page cache with HTTP validators (disabled when no directory)
+        cache_dir = getattr(settings, 'MGNREGA_PAGE_CACHE_DIR', None)
+        self.page_cache = PageCache(
+            cache_dir,
+            getattr(
+                settings,
+                'MGNREGA_PAGE_CACHE_MAX_BYTES',
+                self.DEFAULT_PAGE_CACHE_MAX_BYTES
+            )
+        ) if cache_dir else None
         self.api_status = None
+        self.sync_state = None
+        self.district_ids = {}
+        self.latest_period = None
+        self.upstream_updated = None
+        self.upstream_unchanged = False
+        self.allow_empty = False
+        self.error_report = ErrorReport()
+        self.metrics = SyncMetrics()
         
     def fetch_and_sync(self) -> Dict:
         """
         Main method to fetch data and sync to database.
         
+        Pages are validated and upserted as they arrive, so peak memory
+        is bounded by a single page rather than the whole dataset.
+        
+        Partition runs also return the latest period and upstream stamp
+        they saw, for the parent run to advance the high-water mark.
+        
         Returns:
             Dict with status, counts, and messages
         """
-        # Create APIStatus record
+        result = self._run(
+            source=self.source,
+            batches=self._iter_api_batches,
+            empty_message="No data received from API",
+            on_success=None if self.partition else self._update_sync_state
+        )
+        if self.partition:
+            result['latest_period'] = self.latest_period
+            result['upstream_updated'] = self.upstream_updated
+        return result
+    
+    def plan_partitions(self, partition_by: str) -> Tuple[APIStatus, List[Dict]]:
+        """
+        Start a partitioned sync: create the parent run and split the
+        planned streams into independent partitions.
+        
+        State partitions add a state filter to every stream. Year
+        partitions fetch one calendar year each on a full sync, or group
+        the incremental per-period streams by year.
+        
+        Args:
+            partition_by: 'state' or 'year'
+            
+        Returns:
+            Tuple of (parent APIStatus, list of partition dicts with
+            'key' and 'streams')
+        """
+        if partition_by not in self.PARTITIONS:
+            raise ValueError(
+                f"Unknown partition key {partition_by!r}; "
+                f"expected one of: {', '.join(self.PARTITIONS)}"
+            )
+        
+        mark_stale_runs(self.SOURCE)
+        self.sync_state, _ = SyncState.objects.get_or_create(
+            source=self.SOURCE
+        )
+        streams = self._plan_streams()
+        
+        if partition_by == self.PARTITION_STATE:
+            states = District.objects.order_by('state').values_list(
+                'state', flat=True
+            ).distinct()
+            partitions = [
+                {
+                    'key': f"state={state}",
+                    'streams': [
+                        {**stream, self.STATE_FILTER_FIELD: state}
+                        for stream in streams
+                    ]
+                }
+                for state in states
+            ]
+        elif self.full:
+            partitions = [
+                {'key': f"year={year}", 'streams': [{'year': year}]}
+                for year in range(self.MIN_YEAR, timezone.now().year + 1)
+            ]
+        else:
+            by_year = defaultdict(list)
+            for stream in streams:
+                by_year[stream['year']].append(stream)
+            partitions = [
+                {'key': f"year={year}", 'streams': year_streams}
+                for year, year_streams in sorted(by_year.items())
+            ]
+        
         self.api_status = APIStatus.objects.create(
-            source='data.gov.in/mgnrega',
+            source=self.SOURCE,
             status=APIStatus.StatusChoices.IN_PROGRESS,
-            message='Starting data fetch...'
+            message=(
+                f"Dispatched {len(partitions)} {partition_by} partition(s) "
+                f"({'full' if self.full else 'incremental'})"
+            )
         )
         
-        try:
-            logger.info("Starting MGNREGA data fetch")
+        logger.info(
+            f"Partitioned sync run {self.api_status.id}: "
+            f"{len(partitions)} {partition_by} partition(s)"
+        )
+        return self.api_status, partitions
+    
+    def finalize_partitions(self, parent_id: int, results: List[Dict]) -> Dict:
+        """
+        Aggregate the partition runs of a partitioned sync into its
+        parent run.
+        
+        Counts are summed from the child APIStatus rows, so partitions
+        that were resumed or failed part-way are still accounted for.
+        The high-water mark only advances when every partition succeeded,
+        otherwise the next incremental run would skip what was missed.
+        
+        Args:
+            parent_id: Parent APIStatus id
+            results: fetch_and_sync results of the partition runs
             
-            # Fetch raw data from API
-            raw_data = self._fetch_from_api()
+        Returns:
+            Aggregated result dict
+        """
+        self.api_status = APIStatus.objects.get(pk=parent_id)
+        self.sync_state, _ = SyncState.objects.get_or_create(
+            source=self.SOURCE
+        )
+        children = self.api_status.children.all()
+        
+        totals = children.aggregate(
+            processed=Sum('recordsProcessed'),
+            failed=Sum('recordsFailed'),
+            created=Sum('recordsCreated'),
+            updated=Sum('recordsUpdated'),
+            unchanged=Sum('recordsUnchanged')
+        )
+        result = {key: value or 0 for key, value in totals.items()}
+        
+        for child in children:
+            self.error_report.merge(
+                ErrorReport.from_summary(child.errorSummary)
+            )
+            self.metrics.merge(SyncMetrics.from_summary(child.syncMetrics))
+        self._report_errors(result)
+        
+        # Partitions ran in parallel: the parent's wall time is its own
+        self.metrics.wall_seconds = (
+            timezone.now() - self.api_status.createdAt
+        ).total_seconds()
+        
+        for child_result in results:
+            if child_result.get('latest_period'):
+                period = tuple(child_result['latest_period'])
+                if self.latest_period is None or period > self.latest_period:
+                    self.latest_period = period
+            if child_result.get('upstream_updated'):
+                self.upstream_updated = child_result['upstream_updated']
+        
+        failed_partitions = [
+            child.source for child in children
+            if child.status not in (
+                APIStatus.StatusChoices.SUCCESS,
+                APIStatus.StatusChoices.PARTIAL
+            )
+        ]
+        
+        # Partitions publish their own changes
+        result['states'] = sorted({
+            state
+            for child_result in results
+            for state in child_result.get('states', ())
+        })
+        
+        if not failed_partitions:
+            self._update_status_success(result)
+            self._update_sync_state()
+            result['status'] = self.api_status.status
+            return result
+        
+        succeeded = children.count() - len(failed_partitions)
+        self.api_status.status = (
+            APIStatus.StatusChoices.PARTIAL
+            if succeeded
+            else APIStatus.StatusChoices.FAILURE
+        )
+        self.api_status.lastFetched = timezone.now()
+        self.api_status.recordsProcessed = result['processed']
+        self.api_status.recordsFailed = result['failed']
+        self.api_status.errorSummary = self.error_report.summary()
+        self.api_status.syncMetrics = self.metrics.summary()
+        self.api_status.message = (
+            f"{len(failed_partitions)} of {children.count()} partition(s) "
+            f"did not complete; high-water mark not advanced. Failed "
+            f"partitions: {', '.join(failed_partitions)}"
+        )
+        self.api_status.save()
+        
+        logger.warning(self.api_status.message)
+        result['status'] = self.api_status.status
+        result['metrics'] = self.api_status.syncMetrics
+        return result
+    
+    def ingest_file(self, path: str, file_format: Optional[str] = None) -> Dict:
+        """
+        Ingest a local dump file through the same validation and bulk
+        upsert pipeline as the API path.
+        
+        The file is stream-parsed (gzip-aware) and processed in batches
+        of page_size records, so memory stays constant regardless of the
+        file size.
+        
+        Args:
+            path: Path to an NDJSON, CSV or JSON dump (optionally .gz)
+            file_format: 'ndjson', 'csv' or 'json'
+                (inferred from the file extension when omitted)
             
-            if not raw_data:
-                return self._handle_failure(
-                    "No data received from API"
-                )
+        Returns:
+            Dict with status, counts, and messages
+        """
+        def batches():
+            logger.info(
+                f"Starting MGNREGA file ingestion from {path} "
+                f"(batch size {self.page_size}, offset {self.offset}, "
+                f"{self.backend} writes)"
+            )
+            records = iter_file_records(path, file_format)
+            if self.offset:
+                records = islice(records, self.offset, None)
+            for batch in iter_batches(records, self.page_size):
+                self.offset += len(batch)
+                yield batch
+        
+        return self._run(
+            source=f"file/{os.path.basename(path)}",
+            batches=batches,
+            empty_message=f"No records found in {path}"
+        )
+    
+    def _run(
+        self,
+        source: str,
+        batches: Callable[[], Iterator[List[Dict]]],
+        empty_message: str,
+        on_success: Optional[Callable[[], None]] = None
+    ) -> Dict:
+        """
+        Drive a sync run: validate and upsert every batch from a source.
+        
+        Each batch is committed together with a checkpoint on the run's
+        APIStatus, so an interrupted run can be resumed from the last
+        committed batch.
+        
+        Args:
+            source: APIStatus source identifier for this run
+            batches: Callable returning an iterator of record batches
+            empty_message: Failure message when no records are received
+            on_success: Optional hook run after a successful run
             
-            # Process and validate data
-            result = self._process_data(raw_data)
+        Returns:
+            Dict with status, counts, and messages
+        """
+        mark_stale_runs(source)
+        
+        if self.resume:
+            self.api_status = self._resume_run(source)
+        resumed = self.api_status is not None
+        
+        if self.api_status is None:
+            # Create APIStatus record
+            self.api_status = APIStatus.objects.create(
+                source=source,
+                status=APIStatus.StatusChoices.IN_PROGRESS,
+                message='Starting data fetch...',
+                parent=self.parent
+            )
+        
+        # Resumed runs carry on from the errors, counts and metrics
+        # already committed
+        self.error_report = ErrorReport.from_summary(
+            self.api_status.errorSummary
+        )
+        self.metrics = SyncMetrics.from_summary(self.api_status.syncMetrics)
+        if resumed:
+            self.metrics.count('retries')
+        
+        try:
+            result = {
+                'processed': self.api_status.recordsProcessed,
+                'failed': self.api_status.recordsFailed,
+                'created': self.api_status.recordsCreated,
+                'updated': self.api_status.recordsUpdated,
+                'unchanged': self.api_status.recordsUnchanged
+            }
+            received = result['processed'] + result['failed']
+            
+            with self.metrics.track_queries():
+                # Resolve district codes once for the whole sync
+                self.district_ids = self._load_district_ids()
+                
+                # Stream batches straight into validation and upsert
+                for records in self.metrics.timed(batches(), 'fetch'):
+                    received += len(records)
+                    self.metrics.count('records', len(records))
+                    with transaction.atomic():
+                        self._merge_result(
+                            result, self._process_data(records)
+                        )
+                        self._save_checkpoint(result)
+            
+            if not received and not self.allow_empty:
+                return self._handle_failure(empty_message)
             
             # Update APIStatus with results
+            self._report_errors(result)
+            result['states'] = sorted(self._publish_changes())
             self._update_status_success(result)
+            if on_success:
+                on_success()
             
             logger.info(
                 f"Data sync completed: {result['processed']} processed, "
-                f"{result['failed']} failed"
+                f"{result['failed']} failed (offset {self.offset})"
             )
             
             return result
             
+        except PageFetchError as e:
+            logger.error(f"Data fetch interrupted: {e}")
+            return self._handle_failure(
+                str(e),
+                retryable=e.retryable,
+                retry_after=e.retry_after
+            )
+            
         except Exception as e:
             logger.exception(f"Fatal error during data fetch: {e}")
             return self._handle_failure(str(e))
     
-    def _fetch_from_api(self) -> List[Dict]:
+    def _iter_api_batches(self) -> Iterator[List[Dict]]:
         """
-        Fetch data from data.gov.in API with retry logic.
+        Iterate over every page of every stream planned for this run.
         
-        Returns:
-            List of raw data records
+        A resumed run reuses the stream plan stored in its checkpoint
+        and continues from the saved stream and offset.
+        
+        Yields:
+            List of raw records for each page
+        """
+        self.sync_state, _ = SyncState.objects.get_or_create(
+            source=self.SOURCE
+        )
+        if self.streams is None:
+            self.streams = self._plan_streams()
+        
+        # An empty incremental window (or partition) just means nothing
+        # new yet
+        self.allow_empty = not self.full or self.partition is not None
+        
+        logger.info(
+            f"Starting MGNREGA data fetch "
+            f"({'full' if self.full else 'incremental'}, "
+            f"{len(self.streams)} stream(s), stream {self.stream_index}, "
+            f"page size {self.page_size}, offset {self.offset}, "
+            f"concurrency {self.concurrency}, {self.backend} writes)"
+        )
+        
+        while self.stream_index < len(self.streams):
+            yield from self._iter_pages(self.streams[self.stream_index])
+            if self.upstream_unchanged:
+                break
+            self.stream_index += 1
+            self.offset = 0
+    
+    def _checkpoint(self) -> Dict:
+        """
+        Return the position reached by the run after the last batch.
+        """
+        return {
+            'offset': self.offset,
+            'streamIndex': self.stream_index,
+            'streams': self.streams,
+            'full': self.full,
+            'latestPeriod': (
+                list(self.latest_period) if self.latest_period else None
+            ),
+        }
+    
+    def _save_checkpoint(self, result: Dict):
+        """
+        Persist the run's checkpoint and running counts.
+        
+        Called inside the batch's transaction, so the checkpoint always
+        matches what has been committed. Also serves as the run's
+        heartbeat (bumps updatedAt) for stale-run detection.
+        
+        Args:
+            result: Running result dict
+        """
+        with self.metrics.stage('checkpoint'):
+            self.api_status.checkpoint = self._checkpoint()
+            self.api_status.recordsProcessed = result['processed']
+            self.api_status.recordsFailed = result['failed']
+            self.api_status.errorSummary = self.error_report.summary()
+            self.api_status.syncMetrics = self.metrics.summary()
+            self.api_status.save(update_fields=[
+                'checkpoint',
+                'recordsProcessed',
+                'recordsFailed',
+                'errorSummary',
+                'syncMetrics',
+                'updatedAt'
+            ])
+    
+    def _resume_run(self, source: str) -> Optional[APIStatus]:
+        """
+        Reopen the source's last run if it died with a checkpoint.
+        
+        Only recent, retryable failures are resumed: a run that failed
+        for good, or longer ago than settings.MGNREGA_RESUME_MAX_AGE
+        (one sync interval), would replay outdated period windows. An
+        incremental checkpoint never stands in for a requested full run.
+        
+        Args:
+            source: APIStatus source identifier
             
-        Raises:
-            Exception if all retries exhausted
+        Returns:
+            The reopened APIStatus, or None when there is nothing to resume
         """
-        url = f"{self.API_BASE_URL}/{self.API_RESOURCE_ID}"
+        previous = APIStatus.objects.filter(
+            source=source
+        ).order_by('-createdAt').first()
+        max_age = getattr(
+            settings, 'MGNREGA_RESUME_MAX_AGE', self.DEFAULT_RESUME_MAX_AGE
+        )
         
-        headers = {}
-        if self.api_key:
-            headers['api-key'] = self.api_key
+        if previous is None or previous.status != APIStatus.StatusChoices.FAILURE:
+            reason = 'no interrupted run'
+        elif not previous.checkpoint:
+            reason = f"run {previous.id} has no checkpoint"
+        elif not previous.checkpoint.get('retryable', True):
+            reason = f"run {previous.id} failed permanently"
+        elif timezone.now() - previous.updatedAt > timedelta(seconds=max_age):
+            reason = f"run {previous.id} is older than {max_age}s"
+        elif self.full and not previous.checkpoint.get('full'):
+            reason = f"run {previous.id} was incremental, full run requested"
+        else:
+            reason = None
         
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                logger.info(
-                    f"Fetching data from API (attempt {attempt + 1}/"
-                    f"{self.MAX_RETRIES})"
-                )
+        if reason:
+            logger.info(
+                f"Not resuming for {source} ({reason}); starting a new run"
+            )
+            return None
+        
+        checkpoint = previous.checkpoint
+        self.offset = checkpoint.get('offset', 0)
+        self.stream_index = checkpoint.get('streamIndex', 0)
+        self.streams = checkpoint.get('streams')
+        self.full = self.full or checkpoint.get('full', False)
+        if checkpoint.get('latestPeriod'):
+            self.latest_period = tuple(checkpoint['latestPeriod'])
+        
+        logger.info(
+            f"Resuming run {previous.id} for {source} from stream "
+            f"{self.stream_index}, offset {self.offset}"
+        )
+        
+        previous.status = APIStatus.StatusChoices.IN_PROGRESS
+        previous.message = (
+            f"Resumed from checkpoint (stream {self.stream_index}, "
+            f"offset {self.offset})"
+        )
+        # A partition resumed by a later partitioned sync moves to it
+        previous.parent = self.parent or previous.parent
+        previous.save(
+            update_fields=['status', 'message', 'parent', 'updatedAt']
+        )
+        return previous
+    
+    def _plan_streams(self) -> List[Dict]:
+        """
+        Decide which slices of the resource this run has to fetch.
+        
+        A full sync (or the first sync of a source) fetches the whole
+        resource as one unfiltered stream. An incremental sync fetches
+        one filtered stream per period from `lookback_months` before the
+        high-water mark up to the current month.
+        
+        Returns:
+            List of API filter dicts, one per stream
+        """
+        state = self.sync_state
+        
+        if self.full or state.lastYear is None or state.lastMonth is None:
+            self.full = True
+            return [{}]
+        
+        # Work in absolute month numbers to step across year boundaries
+        start = state.lastYear * 12 + (state.lastMonth - 1)
+        start -= self.lookback_months
+        now = timezone.now()
+        end = max(now.year * 12 + (now.month - 1), start)
+        
+        logger.info(
+            f"Incremental sync from high-water mark "
+            f"{state.lastYear}-{state.lastMonth:02d} "
+            f"(look-back {self.lookback_months} months)"
+        )
+        
+        return [
+            {'year': period // 12, 'month': period % 12 + 1}
+            for period in range(start, end + 1)
+        ]
+    
+    def _update_sync_state(self):
+        """
+        Advance the source's high-water mark after a completed run.
+        
+        The mark only moves forward, so a run that saw older periods
+        (e.g. the look-back window) never rewinds it.
+        """
+        state = self.sync_state
+        
+        if self.latest_period is not None:
+            current = (state.lastYear or 0, state.lastMonth or 0)
+            if self.latest_period > current:
+                state.lastYear, state.lastMonth = self.latest_period
+        
+        if self.upstream_updated:
+            state.upstreamUpdated = self.upstream_updated
+        
+        state.lastSyncedAt = timezone.now()
+        state.save()
+    
+    def _merge_result(self, result: Dict, page_result: Dict):
+        """
+        Fold a page's processing result into the running totals.
+        
+        Args:
+            result: Running result dict (mutated in place)
+            page_result: Result returned by _process_data for one page
+        """
+        for key in ('processed', 'failed', 'created', 'updated', 'unchanged'):
+            result[key] += page_result[key]
+    
+    def _report_errors(self, result: Dict):
+        """
+        Add the run's error report to a result dict.
+        
+        Sets 'errors' (a random sample of failures, each with 'record'
+        and 'errors') and 'errorsByType' (rejected records per error
+        type).
+        
+        Args:
+            result: Result dict (mutated in place)
+        """
+        result['errors'] = self.error_report.samples
+        result['errorsByType'] = dict(self.error_report.top_types(
+            self.error_report.max_types + 1
+        ))
+    
+    def _iter_pages(self, filters: Dict) -> Iterator[List[Dict]]:
+        """
+        Iterate over one paginated stream of the API resource.
+        
+        Up to self.concurrency pages are fetched in parallel on a bounded
+        thread pool. Pages are yielded in offset order, and a new fetch
+        is only submitted when the consumer asks for the next page, so
+        fetching can never run more than `concurrency` pages ahead of
+        the DB writer.
+        
+        Advances self.offset by the records each page actually returned
+        and stops on an empty page, or once the reported total is
+        reached. A page of another size than requested (e.g. the API
+        clamping `limit`) resets the stride of the pages requested ahead
+        to that size. On an incremental run, stops as soon as upstream reports the same
+        `updated` stamp as the last successful sync. Pages that are not
+        modified since they were last committed are skipped without
+        validation or writes.
+        
+        Args:
+            filters: API field filters selecting the stream
+            
+        Yields:
+            List of raw records for each page
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix='mgnrega-fetch'
+        )
+        window = deque()
+        next_offset = self.offset
+        step = self.page_size
+        total = None
+        
+        try:
+            while True:
+                # Fetch the first page alone to learn the total, then keep
+                # at most `concurrency` pages in flight or buffered
+                limit = self.concurrency if next_offset > self.offset else 1
+                while len(window) < limit:
+                    if total is not None and next_offset >= total:
+                        break
+                    window.append(
+                        executor.submit(
+                            self._fetch_page, next_offset, filters
+                        )
+                    )
+                    next_offset += step
                 
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=30
-                )
-                response.raise_for_status()
+                if not window:
+                    break
                 
-                data = response.json()
-                records = data.get('records', [])
+                page = window.popleft().result()
+                if page.total is not None:
+                    total = page.total
                 
-                logger.info(f"Received {len(records)} records from API")
-                return records
+                if page.updated:
+                    unchanged = page.updated == self.sync_state.upstreamUpdated
+                    if unchanged and not self.full:
+                        logger.info(
+                            f"Upstream unchanged since last sync "
+                            f"(updated {page.updated}), nothing to fetch"
+                        )
+                        self.upstream_unchanged = True
+                        break
+                    self.upstream_updated = page.updated
                 
-            except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"API request failed (attempt {attempt + 1}): {e}"
-                )
+                count = page.count
+                if not count:
+                    break
+                
+                # Advance first so a checkpoint taken while the page is
+                # processed points past it
+                self.offset += count
                 
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAYS[attempt]
-                    logger.info(f"Retrying in {delay} seconds...")
-                    import time
-                    time.sleep(delay)
+                if page.not_modified:
+                    logger.info(
+                        f"Skipped unmodified page: {count} records, offset "
+                        f"{self.offset}" + (f"/{total}" if total else "")
+                    )
                 else:
-                    raise Exception(
-                        f"API request failed after {self.MAX_RETRIES} "
-                        f"attempts: {e}"
+                    yield page.records
+                    
+                    # The consumer resumes us only after committing
+                    if page.key:
+                        self.page_cache.mark_committed(page.key)
+                    
+                    logger.info(
+                        f"Processed page: {count} records, offset "
+                        f"{self.offset}" + (f"/{total}" if total else "")
                     )
+                
+                if total is not None and self.offset >= total:
+                    break
+                
+                if count != step:
+                    # Pages requested ahead start at the wrong offsets:
+                    # drop them and continue at the server's page size
+                    step = count
+                    for future in window:
+                        future.cancel()
+                    window.clear()
+                    next_offset = self.offset
+        finally:
+            # Drop speculative fetches past the end of the resource
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _fetch_page(self, offset: int, filters: Dict) -> Page:
+        """
+        Fetch a single page from data.gov.in API.
         
-        return []
+        Makes one attempt and never sleeps, so a failing API does not
+        hold the worker; retries are scheduled by the caller.
+        
+        With the page cache enabled, incremental runs send the page's
+        stored ETag / Last-Modified. A 304 is answered from the cache:
+        skipped if the page was committed, replayed from the cached body
+        if its downstream stage never completed.
+        
+        Args:
+            offset: Record offset of the page
+            filters: API field filters selecting the stream
+            
+        Returns:
+            Page with records, total count and upstream `updated` stamp
+            
+        Raises:
+            PageFetchError if the request fails
+        """
+        url = f"{self.API_BASE_URL}/{self.API_RESOURCE_ID}"
+        
+        headers = {}
+        if self.api_key:
+            headers['api-key'] = self.api_key
+        
+        params = {
+            'format': 'json',
+            'offset': offset,
+            'limit': self.page_size,
+        }
+        for field, value in filters.items():
+            params[f'filters[{field}]'] = value
+        
+        key = meta = None
+        if self.page_cache:
+            key = self.page_cache.key(url, params)
+            meta = self.page_cache.get(key)
+        
+        # A full sync re-validates everything, so it never relies on 304s
+        conditional = {}
+        if meta and not self.full:
+            if meta.get('etag'):
+                conditional['If-None-Match'] = meta['etag']
+            if meta.get('lastModified'):
+                conditional['If-Modified-Since'] = meta['lastModified']
+        
+        logger.info(f"Fetching page at offset {offset}")
+        
+        try:
+            response = self._get(url, {**headers, **conditional}, params)
+            
+            if response.status_code == 304:
+                page = self._cached_page(key, meta)
+                if page is not None:
+                    return page
+                # The uncommitted body was evicted; download it again
+                response = self._get(url, headers, params)
+            
+            data = response.json()
+            
+        except requests.exceptions.RequestException as e:
+            response = getattr(e, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+            
+            # Timeouts, connection errors, 5xx, 408 and 429 are transient
+            retryable = status_code in (None, 408, 429) or status_code >= 500
+            retry_after = None
+            if response is not None:
+                try:
+                    retry_after = float(response.headers.get('Retry-After'))
+                except (TypeError, ValueError):
+                    pass
+            
+            logger.warning(f"API request failed at offset {offset}: {e}")
+            raise PageFetchError(
+                f"API request failed at offset {offset} "
+                f"(filters {filters or 'none'}): {e}",
+                retryable=retryable,
+                retry_after=retry_after
+            ) from e
+        
+        page = self._parse_page(data, key)
+        self.metrics.count('pagesDownloaded')
+        self.metrics.count('bytesDownloaded', len(response.content))
+        
+        if self.page_cache:
+            self.page_cache.put(key, response.content, {
+                'url': response.url,
+                'etag': response.headers.get('ETag'),
+                'lastModified': response.headers.get('Last-Modified'),
+                'count': page.count,
+                'total': page.total,
+                'updated': page.updated,
+            })
+        
+        logger.info(
+            f"Received {page.count} records from API "
+            f"(offset {offset}, filters {filters or 'none'})"
+        )
+        return page
+    
+    def _get(self, url: str, headers: Dict, params: Dict) -> requests.Response:
+        """
+        Send one GET request on the shared session.
+        
+        Raises:
+            requests.exceptions.RequestException on failure or an error
+            status (a 304 is returned as is)
+        """
+        response = self.session.get(
+            url,
+            headers=headers,
+            params=params,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response
+    
+    def _parse_page(self, data: Dict, key: Optional[str]) -> Page:
+        """Build a Page from a decoded API response."""
+        records = data.get('records', [])
+        total = data.get('total')
+        return Page(
+            records=records,
+            total=int(total) if total is not None else None,
+            updated=data.get('updated_date') or data.get('updated'),
+            count=len(records),
+            key=key
+        )
+    
+    def _cached_page(self, key: str, meta: Dict) -> Optional[Page]:
+        """
+        Answer a 304 from the page cache.
+        
+        Args:
+            key: Page cache key
+            meta: Cached page metadata
+            
+        Returns:
+            A not_modified Page if the page was committed, the replayed
+            page if it was not, or None if its body was evicted
+        """
+        # The cached `updated` stamp is the one seen when the page was
+        # downloaded, not upstream's current one, so it is dropped
+        if meta.get('committed'):
+            logger.info(f"Page not modified, skipping: {meta.get('url')}")
+            self.metrics.count('pagesNotModified')
+            return Page(
+                records=[],
+                total=meta.get('total'),
+                updated=None,
+                count=meta.get('count', 0),
+                key=key,
+                not_modified=True
+            )
+        
+        body = self.page_cache.load(key)
+        if body is None:
+            return None
+        
+        logger.info(f"Page not modified, replaying from cache: {meta.get('url')}")
+        self.metrics.count('pagesFromCache')
+        return self._parse_page(json.loads(body), key)._replace(updated=None)
     
     def _process_data(self, raw_data: List[Dict]) -> Dict:
         """
-        Process and validate raw data, then upsert to database.
+        Process and validate raw data, then bulk upsert to database.
+        
+        Valid records are written in chunks of CHUNK_SIZE, each chunk
+        with a single conflict-aware bulk insert/update. Records that
+        fail validation, or whose chunk fails to write, are stored in
+        the FailedRecord dead-letter table and counted in the run's
+        bounded error report.
         
         Args:
             raw_data: List of raw records from API
             
         Returns:
-            Dict with processed/failed counts and error details
+            Dict with processed/failed/created/updated/unchanged counts
         """
         processed = 0
         failed = 0
-        errors = []
+        valid_records = []
+        dead_letters = []
         
-        for record in raw_data:
-            try:
-                # Validate record
-                is_valid, validation_errors = self._validate_record(record)
-                
-                if not is_valid:
-                    failed += 1
-                    errors.append({
-                        'record': record,
-                        'errors': validation_errors
-                    })
-                    logger.debug(
-                        f"Invalid record: {validation_errors}"
+        # Validate the whole payload in one pass, no DB queries
+        batch_errors = self._validate_batch(raw_data)
+        
+        for record, validation_errors in zip(raw_data, batch_errors):
+            if validation_errors:
+                failed += 1
+                self.error_report.add(record, validation_errors)
+                dead_letters.append(self._dead_letter(
+                    record,
+                    validation_errors,
+                    FailedRecord.StageChoices.VALIDATION
+                ))
+                logger.debug(
+                    f"Invalid record: {validation_errors}"
+                )
+                continue
+            
+            valid_records.append(record)
+        
+        created = 0
+        updated = 0
+        unchanged = 0
+        
+        with self.metrics.stage('write'):
+            for start in range(0, len(valid_records), self.CHUNK_SIZE):
+                chunk = valid_records[start:start + self.CHUNK_SIZE]
+                try:
+                    stats = self._upsert_chunk(chunk)
+                except Exception as e:
+                    message = f"Chunk write failed: {e}"
+                    failed += len(chunk)
+                    self.error_report.add_many(len(chunk), message)
+                    dead_letters.extend(
+                        self._dead_letter(
+                            record,
+                            [message],
+                            FailedRecord.StageChoices.WRITE
+                        )
+                        for record in chunk
+                    )
+                    logger.error(
+                        f"Error writing chunk at record {start}: {e}",
+                        exc_info=True
                     )
                     continue
                 
-                # Transform and save
-                self._upsert_performance(record)
-                processed += 1
-                
-            except Exception as e:
-                failed += 1
-                errors.append({
-                    'record': record,
-                    'errors': [str(e)]
-                })
-                logger.error(
-                    f"Error processing record: {e}",
-                    exc_info=True
-                )
+                processed += len(chunk)
+                created += stats['created']
+                updated += stats['updated']
+                unchanged += stats['unchanged']
+            
+            self._store_dead_letters(dead_letters)
         
         return {
             'processed': processed,
             'failed': failed,
-            'errors': errors[:10]  # Keep first 10 errors for review
+            'created': created,
+            'updated': updated,
+            'unchanged': unchanged
+        }
+    
+    def _dead_letter(
+        self,
+        record: Dict,
+        errors: List[str],
+        stage: str
+    ) -> FailedRecord:
+        """
+        Build an unsaved FailedRecord for a rejected record.
+        
+        Args:
+            record: Raw record
+            errors: Error messages
+            stage: FailedRecord.StageChoices value
+            
+        Returns:
+            Unsaved FailedRecord
+        """
+        district_code = record.get('district_code') if isinstance(record, dict) else None
+        return FailedRecord(
+            apiStatusId=self.api_status,
+            payload=record,
+            payloadHash=FailedRecord.compute_payload_hash(record),
+            districtCode=str(district_code)[:20] if district_code else None,
+            stage=stage,
+            errors=errors
+        )
+    
+    def _store_dead_letters(self, dead_letters: List[FailedRecord]):
+        """
+        Bulk insert rejected records into the dead-letter table.
+        
+        A payload already in the table (rejected by an earlier run) is
+        updated in place and reopened as pending.
+        
+        Args:
+            dead_letters: Unsaved FailedRecord instances
+        """
+        if not dead_letters:
+            return
+        
+        # One row per payload; the last error for a duplicate wins
+        unique = {row.payloadHash: row for row in dead_letters}
+        
+        FailedRecord.objects.bulk_create(
+            unique.values(),
+            batch_size=self.CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=['payloadHash'],
+            update_fields=[
+                'apiStatusId',
+                'stage',
+                'errors',
+                'status',
+                'updatedAt'
+            ]
+        )
+    
+    def reprocess_failed_records(
+        self,
+        queryset=None,
+        batch_size: int = 500
+    ) -> Dict:
+        """
+        Re-validate and upsert dead-lettered records.
+        
+        Meant to be run after district codes or validation rules have
+        been fixed. Records are read in primary-key order, batch by
+        batch; each batch is validated, bulk upserted and its
+        FailedRecord rows updated in one transaction. Records that now
+        pass are marked resolved, the others keep their new errors.
+        
+        Args:
+            queryset: FailedRecord queryset to reprocess
+                (defaults to all pending records)
+            batch_size: Records per batch (at most CHUNK_SIZE)
+            
+        Returns:
+            Dict with status, counts, and messages
+        """
+        if queryset is None:
+            queryset = FailedRecord.objects.filter(
+                status=FailedRecord.StatusChoices.PENDING
+            )
+        batch_size = max(1, min(batch_size, self.CHUNK_SIZE))
+        
+        self.api_status = APIStatus.objects.create(
+            source='reprocess/failed_records',
+            status=APIStatus.StatusChoices.IN_PROGRESS,
+            message='Reprocessing failed records...'
+        )
+        
+        try:
+            self.district_ids = self._load_district_ids()
+            result = {
+                'processed': 0,
+                'failed': 0,
+                'created': 0,
+                'updated': 0,
+                'unchanged': 0
+            }
+            last_id = 0
+            
+            with self.metrics.track_queries():
+                while True:
+                    # Keyset pagination: rows resolved in earlier batches
+                    # never shift the window
+                    with self.metrics.stage('fetch'):
+                        batch = list(
+                            queryset.filter(
+                                id__gt=last_id
+                            ).order_by('id')[:batch_size]
+                        )
+                    if not batch:
+                        break
+                    last_id = batch[-1].id
+                    self.metrics.count('records', len(batch))
+                    
+                    with transaction.atomic():
+                        self._merge_result(
+                            result, self._reprocess_batch(batch)
+                        )
+            
+            self._report_errors(result)
+            result['states'] = sorted(self._publish_changes())
+            self._update_status_success(result)
+            logger.info(
+                f"Reprocessed failed records: {result['processed']} "
+                f"resolved, {result['failed']} still failing"
+            )
+            return result
+            
+        except Exception as e:
+            logger.exception(f"Fatal error while reprocessing: {e}")
+            return self._handle_failure(str(e))
+    
+    def _reprocess_batch(self, batch: List[FailedRecord]) -> Dict:
+        """
+        Re-validate and upsert one batch of dead-lettered records.
+        
+        Args:
+            batch: FailedRecord rows
+            
+        Returns:
+            Dict with processed/failed/created/updated/unchanged counts
+        """
+        now = timezone.now()
+        batch_errors = self._validate_batch([row.payload for row in batch])
+        valid_rows = [
+            row for row, errors in zip(batch, batch_errors) if not errors
+        ]
+        
+        stats = {'created': 0, 'updated': 0, 'unchanged': 0}
+        write_error = None
+        if valid_rows:
+            try:
+                with self.metrics.stage('write'):
+                    stats = self._upsert_chunk(
+                        [row.payload for row in valid_rows]
+                    )
+            except Exception as e:
+                write_error = f"Chunk write failed: {e}"
+                logger.error(f"Error writing reprocessed records: {e}")
+        
+        processed = 0
+        for row, validation_errors in zip(batch, batch_errors):
+            row.attempts += 1
+            row.updatedAt = now
+            row.apiStatusId = self.api_status
+            
+            if not validation_errors and write_error is None:
+                row.status = FailedRecord.StatusChoices.RESOLVED
+                row.resolvedAt = now
+                row.errors = []
+                processed += 1
+                continue
+            
+            if validation_errors:
+                row.stage = FailedRecord.StageChoices.VALIDATION
+                row.errors = validation_errors
+            else:
+                row.stage = FailedRecord.StageChoices.WRITE
+                row.errors = [write_error]
+            self.error_report.add(row.payload, row.errors)
+        
+        with self.metrics.stage('write'):
+            FailedRecord.objects.bulk_update(
+                batch,
+                [
+                    'attempts',
+                    'updatedAt',
+                    'apiStatusId',
+                    'status',
+                    'resolvedAt',
+                    'stage',
+                    'errors'
+                ]
+            )
+        
+        return {
+            'processed': processed,
+            'failed': len(batch) - processed,
+            **stats
         }
     
+    def _validate_batch(self, records: List[Dict]) -> List[List[str]]:
+        """
+        Validate a chunk of records in a single pass.
+        
+        District codes are checked against the code map loaded once per
+        sync, so no queries are issued per record.
+        
+        Args:
+            records: Raw record dicts
+            
+        Returns:
+            List of error lists aligned with records (empty when valid).
+            Messages are RecordErrors, carrying their error type for
+            the run's ErrorReport.
+        """
+        batch_errors = []
+        
+        with self.metrics.stage('validate'):
+            for record in records:
+                try:
+                    _, validation_errors = self._validate_record(record)
+                except Exception as e:
+                    logger.error(
+                        f"Error validating record: {e}",
+                        exc_info=True
+                    )
+                    validation_errors = [
+                        RecordError('Validation error', f"Validation error: {e}")
+                    ]
+                batch_errors.append(validation_errors)
+        
+        return batch_errors
+    
     def _validate_record(
         self,
         record: Dict
@@ -221,18 +1458,12 @@ class MGNREGADataFetcher:
         errors = []
         
         # Check required fields
-        required_fields = [
-            'district_code',
-            'year',
-            'month',
-            'person_days',
-            'households_worked',
-            'total_wages'
-        ]
-        
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             if field not in record or record[field] is None:
-                errors.append(f"Missing required field: {field}")
+                errors.append(RecordError(
+                    'Missing required field',
+                    f"Missing required field: {field}"
+                ))
         
         if errors:
             return False, errors
@@ -242,97 +1473,308 @@ class MGNREGADataFetcher:
         try:
             year = int(year)
             if year < self.MIN_YEAR:
-                errors.append(
+                errors.append(RecordError(
+                    'Invalid year',
                     f"Invalid year {year} (must be >= {self.MIN_YEAR})"
-                )
+                ))
         except (ValueError, TypeError):
-            errors.append(f"Invalid year format: {year}")
+            errors.append(RecordError(
+                'Invalid year format',
+                f"Invalid year format: {year}"
+            ))
         
         # Validate month
         month = record.get('month')
         try:
             month = int(month)
             if month not in self.VALID_MONTHS:
-                errors.append(
+                errors.append(RecordError(
+                    'Invalid month',
                     f"Invalid month {month} (must be 1-12)"
-                )
+                ))
         except (ValueError, TypeError):
-            errors.append(f"Invalid month format: {month}")
+            errors.append(RecordError(
+                'Invalid month format',
+                f"Invalid month format: {month}"
+            ))
         
         # Validate numeric fields are non-negative
-        numeric_fields = [
-            'person_days',
-            'households_worked',
-            'total_wages',
-            'material_expenditure'
-        ]
-        
-        for field in numeric_fields:
+        for field in self.NUMERIC_FIELDS:
             value = record.get(field, 0)
             try:
                 value = float(value)
+                if not math.isfinite(value):
+                    raise ValueError(value)
                 if value < 0:
-                    errors.append(
+                    errors.append(RecordError(
+                        f"{field} cannot be negative",
                         f"{field} cannot be negative: {value}"
-                    )
+                    ))
+                elif field in self.INTEGER_FIELDS and not value.is_integer():
+                    errors.append(RecordError(
+                        f"{field} must be a whole number",
+                        f"{field} must be a whole number: {value}"
+                    ))
             except (ValueError, TypeError):
-                errors.append(
+                errors.append(RecordError(
+                    f"Invalid {field} format",
                     f"Invalid {field} format: {value}"
-                )
+                ))
         
-        # Validate district code exists
+        # Validate district code against the preloaded code map
         district_code = record.get('district_code')
-        if not District.objects.filter(code=district_code).exists():
-            errors.append(
+        if district_code not in self.district_ids:
+            errors.append(RecordError(
+                'District code not found in database',
                 f"District code {district_code} not found in database"
-            )
+            ))
         
         return len(errors) == 0, errors
     
-    @transaction.atomic
-    def _upsert_performance(self, record: Dict):
+    def _resolve_backend(self, backend: str) -> str:
+        """
+        Pick the write backend actually used for this run.
+        
+        'auto' uses COPY on PostgreSQL outside DEBUG, and the batched
+        ORM path otherwise. An explicit 'copy' falls back to the ORM path
+        when the database does not support it (e.g. SQLite).
+        
+        Args:
+            backend: Requested backend ('orm', 'copy' or 'auto')
+            
+        Returns:
+            'orm' or 'copy'
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown write backend {backend}; "
+                f"expected one of: {', '.join(self.BACKENDS)}"
+            )
+        
+        if backend == self.BACKEND_AUTO:
+            if copy_supported() and not settings.DEBUG:
+                return self.BACKEND_COPY
+            return self.BACKEND_ORM
+        
+        if backend == self.BACKEND_COPY and not copy_supported():
+            logger.warning(
+                "COPY backend requires PostgreSQL; "
+                "falling back to batched ORM writes"
+            )
+            return self.BACKEND_ORM
+        
+        return backend
+    
+    def _load_district_ids(self) -> Dict[str, int]:
+        """
+        Resolve all district codes to primary keys in one query.
+        
+        Returns:
+            Dict mapping district code to District id
+        """
+        return dict(District.objects.values_list('code', 'id'))
+    
+    def _build_performance(self, record: Dict) -> Performance:
         """
-        Insert or update performance record in database.
+        Build an unsaved Performance instance from a validated record.
+        
+        Decimal values are quantized to the column precision and the
+        metric fingerprint is filled in, since bulk writes bypass save().
         
         Args:
             record: Validated record dict
         """
-        district = District.objects.get(code=record['district_code'])
-        
-        year = int(record['year'])
-        month = int(record['month'])
-        
-        # Get or create performance record
-        performance, created = Performance.objects.update_or_create(
-            districtId=district,
-            year=year,
-            month=month,
-            defaults={
-                'personDays': int(record.get('person_days', 0)),
-                'householdsWorked': int(
-                    record.get('households_worked', 0)
-                ),
-                'totalWages': Decimal(
-                    str(record.get('total_wages', 0))
-                ),
-                'materialExpenditure': Decimal(
-                    str(record.get('material_expenditure', 0))
-                ),
-            }
+        performance = Performance(
+            districtId_id=self.district_ids[record['district_code']],
+            year=int(record['year']),
+            month=int(record['month']),
+            personDays=int(Decimal(str(record.get('person_days', 0)))),
+            householdsWorked=int(Decimal(str(record.get('households_worked', 0)))),
+            totalWages=Decimal(
+                str(record.get('total_wages', 0))
+            ).quantize(self.DECIMAL_PLACES, rounding=ROUND_HALF_UP),
+            materialExpenditure=Decimal(
+                str(record.get('material_expenditure', 0))
+            ).quantize(self.DECIMAL_PLACES, rounding=ROUND_HALF_UP),
         )
+        performance.fingerprint = Performance.compute_fingerprint(
+            performance.personDays,
+            performance.householdsWorked,
+            performance.totalWages,
+            performance.materialExpenditure
+        )
+        return performance
+    
+    def _upsert_chunk(self, records: List[Dict]) -> Dict:
+        """
+        Insert or update a chunk of validated records in bulk.
+        
+        The chunk is written through the selected backend (batched ORM
+        upsert, or COPY into a staging table plus one set-based merge on
+        PostgreSQL). Either way only new and changed rows are written,
+        so unchanged rows keep their updatedAt and cause no table or
+        index churn.
+        
+        Args:
+            records: Validated record dicts
+            
+        Returns:
+            Dict with created/updated/unchanged counts for the chunk
+        """
+        # Later records win when a chunk repeats the same key
+        rows = {}
+        for record in records:
+            performance = self._build_performance(record)
+            key = (
+                performance.districtId_id,
+                performance.year,
+                performance.month
+            )
+            rows[key] = performance
+        
+        with transaction.atomic():
+            if self.backend == self.BACKEND_COPY:
+                created, updated = copy_merge_performance(
+                    list(rows.values())
+                )
+            else:
+                created, updated = self._write_rows_orm(rows)
+            
+            stats = {
+                'created': created,
+                'updated': updated,
+                'unchanged': len(records) - created - updated,
+            }
+            self._record_chunk_stats(stats)
+        
+        # Only periods actually stored move the sync's high-water mark
+        period = max((year, month) for _, year, month in rows)
+        if self.latest_period is None or period > self.latest_period:
+            self.latest_period = period
         
-        action = 'Created' if created else 'Updated'
         logger.debug(
-            f"{action} performance record: "
-            f"{district.name} {year}-{month:02d}"
+            f"Upserted chunk ({self.backend}): {stats['created']} created, "
+            f"{stats['updated']} updated, {stats['unchanged']} unchanged"
         )
+        return stats
+    
+    def _write_rows_orm(self, rows: Dict[Tuple, Performance]) -> Tuple[int, int]:
+        """
+        Write new and changed rows with a batched ORM upsert.
+        
+        Stored fingerprints for the chunk's (district, year, month) keys
+        are read in one query and compared with the incoming ones; only
+        rows that differ go into a single INSERT ... ON CONFLICT DO
+        UPDATE on the unique key.
+        
+        Args:
+            rows: Unsaved Performance instances keyed by unique key
+            
+        Returns:
+            Tuple of (created, updated) counts
+        """
+        # One OR-clause per period keeps the lookup exact and indexed
+        district_ids_by_period = defaultdict(list)
+        for district_id, year, month in rows:
+            district_ids_by_period[(year, month)].append(district_id)
+        
+        period_filter = Q()
+        for (year, month), district_ids in district_ids_by_period.items():
+            period_filter |= Q(
+                year=year,
+                month=month,
+                districtId_id__in=district_ids
+            )
+        
+        existing = {
+            (district_id, year, month): fingerprint
+            for district_id, year, month, fingerprint in (
+                Performance.objects.filter(period_filter).values_list(
+                    'districtId_id', 'year', 'month', 'fingerprint'
+                )
+            )
+        }
+        
+        to_write = []
+        created = 0
+        updated = 0
+        for key, performance in rows.items():
+            if key not in existing:
+                created += 1
+            elif existing[key] != performance.fingerprint:
+                updated += 1
+            else:
+                continue
+            to_write.append(performance)
+        
+        if to_write:
+            Performance.objects.bulk_create(
+                to_write,
+                update_conflicts=True,
+                unique_fields=['districtId', 'year', 'month'],
+                update_fields=[
+                    *self.METRIC_FIELDS,
+                    'fingerprint',
+                    'updatedAt'
+                ],
+            )
+        
+        return created, updated
+    
+    def _record_chunk_stats(self, stats: Dict):
+        """
+        Record per-chunk write counts on the running APIStatus.
+        
+        Args:
+            stats: Dict with created/updated/unchanged counts
+        """
+        self.api_status.recordsCreated += stats['created']
+        self.api_status.recordsUpdated += stats['updated']
+        self.api_status.recordsUnchanged += stats['unchanged']
+        self.api_status.chunkStats.append({
+            'chunk': len(self.api_status.chunkStats) + 1,
+            **stats
+        })
+        self.api_status.save(update_fields=[
+            'recordsCreated',
+            'recordsUpdated',
+            'recordsUnchanged',
+            'chunkStats',
+            'updatedAt'
+        ])
+    
+    def _publish_changes(self) -> Set[str]:
+        """
+        Rebuild derived data for the rows this run wrote and publish it.
+        
+        Rows are found by updatedAt since the run's APIStatus was
+        created, so a resumed run also covers its earlier attempts. The
+        state-period aggregates of those rows and the latest periods of
+        their states' districts are rebuilt, then the data versions of
+        those states are bumped so cached responses built from older
+        data stop being served.
+        
+        Returns:
+            States whose data versions were bumped (none when the run
+            wrote nothing)
+        """
+        with self.metrics.track_queries(), self.metrics.stage('aggregate'):
+            state_periods = refresh_state_aggregates(self.api_status.createdAt)
+            states = {state for state, _, _ in state_periods}
+            if states:
+                District.objects.filter(state__in=states).refresh_latest_periods()
+        if states:
+            bump_data_version(states)
+        return states
     
     def _update_status_success(self, result: Dict):
         """
         Update APIStatus with successful completion.
         
+        Also adds the run's metrics to the result as 'metrics'.
+        
         Args:
-            result: Processing result dict
+            result: Processing result dict (mutated in place)
         """
         self.api_status.status = (
             APIStatus.StatusChoices.SUCCESS
@@ -343,45 +1785,127 @@ class MGNREGADataFetcher:
         self.api_status.recordsProcessed = result['processed']
         self.api_status.recordsFailed = result['failed']
         
+        self.api_status.errorSummary = self.error_report.summary()
+        self.api_status.syncMetrics = self.metrics.summary()
+        result['metrics'] = self.api_status.syncMetrics
+        
         if result['failed'] > 0:
             error_summary = '\n'.join([
-                f"Record errors: {err['errors']}"
-                for err in result['errors'][:5]
+                f"{count} x {kind}"
+                for kind, count in self.error_report.top_types(5)
             ])
             self.api_status.message = (
                 f"Partially completed. {result['failed']} records failed "
-                f"validation.\n\nSample errors:\n{error_summary}"
+                f"and were kept in Failed Records for reprocessing."
+                f"\n\nMost frequent errors:\n{error_summary}"
             )
         else:
             self.api_status.message = (
-                f"Successfully processed {result['processed']} records"
+                f"Successfully processed {result['processed']} records "
+                f"({result['created']} created, {result['updated']} "
+                f"updated, {result['unchanged']} unchanged and skipped)"
             )
         
         self.api_status.save()
     
-    def _handle_failure(self, error_message: str) -> Dict:
+    def _handle_failure(
+        self,
+        error_message: str,
+        retryable: bool = False,
+        retry_after: Optional[float] = None
+    ) -> Dict:
         """
         Handle complete fetch failure.
         
+        The run keeps its checkpoint, so a retry scheduled with
+        resume=True continues from the last committed batch. The
+        checkpoint of a non-retryable failure is marked as such and is
+        never resumed.
+        
         Args:
             error_message: Error description
+            retryable: Whether retrying later may succeed
+            retry_after: Server-requested delay before retrying
             
         Returns:
-            Failure result dict
+            Failure result dict, with the counts committed before the
+            failure
         """
+        # Keep the counts of the batches committed before the failure; a
+        # batch rolled back by it may have left its counts in memory
+        self.api_status.refresh_from_db(fields=[
+            'recordsProcessed',
+            'recordsFailed',
+            'recordsCreated',
+            'recordsUpdated',
+            'recordsUnchanged'
+        ])
         self.api_status.status = APIStatus.StatusChoices.FAILURE
         self.api_status.message = error_message
+        self.api_status.errorSummary = self.error_report.summary()
+        self.api_status.syncMetrics = self.metrics.summary()
+        if self.api_status.checkpoint:
+            # A run that failed for good is not resumed later
+            self.api_status.checkpoint = {
+                **self.api_status.checkpoint,
+                'retryable': retryable
+            }
         self.api_status.save()
         
         return {
-            'processed': 0,
-            'failed': 0,
+            'processed': self.api_status.recordsProcessed,
+            'failed': self.api_status.recordsFailed,
+            'created': self.api_status.recordsCreated,
+            'updated': self.api_status.recordsUpdated,
+            'unchanged': self.api_status.recordsUnchanged,
             'errors': [],
+            'metrics': self.api_status.syncMetrics,
             'status': 'failure',
-            'message': error_message
+            'message': error_message,
+            'retryable': retryable,
+            'retry_after': retry_after
         }
 
 
+def mark_stale_runs(source: Optional[str] = None) -> int:
+    """
+    Mark IN_PROGRESS runs that stopped making progress as failed.
+    
+    A live run bumps its APIStatus.updatedAt with every checkpoint, so a
+    run with no update for MGNREGA_SYNC_STALE_AFTER_MINUTES has died
+    (worker OOM, deploy, ...). Its checkpoint is kept so it can be
+    resumed. A partitioned parent run counts as live while any of its
+    partitions is making progress.
+    
+    Args:
+        source: Only check runs of this source (all sources if None)
+        
+    Returns:
+        Number of runs marked as failed
+    """
+    stale_after = getattr(settings, 'MGNREGA_SYNC_STALE_AFTER_MINUTES', 60)
+    cutoff = timezone.now() - timedelta(minutes=stale_after)
+    
+    stale = APIStatus.objects.filter(
+        status=APIStatus.StatusChoices.IN_PROGRESS,
+        updatedAt__lt=cutoff
+    ).exclude(children__updatedAt__gte=cutoff)
+    if source:
+        stale = stale.filter(source=source)
+    
+    count = stale.update(
+        status=APIStatus.StatusChoices.FAILURE,
+        message=(
+            f"Run stopped without finishing (no progress for "
+            f"{stale_after} minutes); resumable from its checkpoint"
+        ),
+        updatedAt=timezone.now()
+    )
+    if count:
+        logger.warning(f"Marked {count} stale sync run(s) as failed")
+    return count
+
+
 def create_sample_districts():
     """
     Helper function to create sample districts for testing.
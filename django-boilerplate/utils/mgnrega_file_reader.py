@@ -0,0 +1,231 @@
+"""
+MGNREGA Dump File Reader
+------------------------
+Stream-parses bulk MGNREGA dumps for offline ingestion.
+
+Supported formats:
+- ndjson: one JSON record per line
+- csv: header row followed by one record per row
+- json: a top-level array of records, or a data.gov.in style object
+  with a "records" array
+
+Files may be gzip-compressed (detected from the magic bytes). Records
+are yielded one at a time, so memory use does not grow with file size.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('ndjson', 'csv', 'json')
+
+GZIP_MAGIC = b'\x1f\x8b'
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def detect_format(path: str) -> str:
+    """
+    Infer the dump format from the file extension (ignoring .gz).
+
+    Raises:
+        ValueError if the extension is not recognised
+    """
+    name = path.lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith('.json'):
+        return 'json'
+
+    raise ValueError(
+        f"Cannot infer format of {path}; pass one of: {', '.join(FORMATS)}"
+    )
+
+
+def open_dump(path: str) -> io.TextIOBase:
+    """
+    Open a dump file as UTF-8 text, transparently decompressing gzip.
+    """
+    with open(path, 'rb') as probe:
+        magic = probe.read(2)
+
+    raw = gzip.open(path, 'rb') if magic == GZIP_MAGIC else open(path, 'rb')
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
+
+
+def iter_file_records(
+    path: str,
+    file_format: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Stream records from a dump file.
+
+    Args:
+        path: Path to the dump file
+        file_format: 'ndjson', 'csv' or 'json' (inferred when omitted)
+
+    Yields:
+        Raw record dicts
+    """
+    file_format = file_format or detect_format(path)
+    if file_format not in FORMATS:
+        raise ValueError(
+            f"Unsupported format {file_format}; "
+            f"expected one of: {', '.join(FORMATS)}"
+        )
+
+    readers = {
+        'ndjson': _iter_ndjson,
+        'csv': _iter_csv,
+        'json': _iter_json,
+    }
+
+    with open_dump(path) as stream:
+        yield from readers[file_format](stream)
+
+
+def iter_batches(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """
+    Group a record stream into lists of at most `size` records.
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _iter_ndjson(stream: io.TextIOBase) -> Iterator[Dict]:
+    """Yield one record per non-blank line."""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}")
+
+
+def _iter_csv(stream: io.TextIOBase) -> Iterator[Dict]:
+    """
+    Yield one record per CSV row.
+
+    Empty cells are dropped so optional fields fall back to their
+    defaults instead of failing numeric validation.
+    """
+    for row in csv.DictReader(stream):
+        yield {
+            field: value
+            for field, value in row.items()
+            if field and value not in ('', None)
+        }
+
+
+class _JSONStream:
+    """
+    Incremental JSON reader over a text stream.
+
+    Keeps only a small window of the input in memory and decodes one
+    value at a time with json.JSONDecoder.raw_decode.
+    """
+
+    def __init__(self, stream: io.TextIOBase):
+        self.stream = stream
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk into the buffer; False at end of input."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        """Consume the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number running up to the buffer edge may be truncated
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json(stream: io.TextIOBase) -> Iterator[Dict]:
+    """
+    Yield records from a JSON array, or from the "records" array of a
+    data.gov.in style response object.
+
+    Other top-level keys preceding "records" are decoded and discarded;
+    they are small metadata in data.gov.in responses.
+    """
+    reader = _JSONStream(stream)
+
+    if reader.peek() == '{':
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                logger.warning("JSON dump has no 'records' array")
+                return
+            key = reader.value()
+            reader.expect(':')
+            if key == 'records':
+                break
+            reader.value()
+            if reader.peek() == ',':
+                reader.expect(',')
+
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+
+    while True:
+        yield reader.value()
+        if reader.peek() == ',':
+            reader.expect(',')
+            continue
+        reader.expect(']')
+        return
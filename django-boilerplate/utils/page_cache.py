@@ -0,0 +1,187 @@
+"""
+Raw API Page Cache
+------------------
+On-disk cache of raw data.gov.in API pages for the MGNREGA fetcher.
+
+Each page is stored as two files named after a hash of its request:
+- <key>.gz: the gzip-compressed response body
+- <key>.json: metadata - URL, ETag / Last-Modified validators, record
+  count, total, upstream `updated` stamp, and whether the page's batch
+  was committed to the database
+
+The validators drive conditional requests (If-None-Match /
+If-Modified-Since). A 304 for a committed page means nothing changed
+and the page can be skipped; a 304 for an uncommitted page (its
+downstream stage failed) is replayed from the cached body instead of
+being downloaded again.
+
+The cache is capped at `max_bytes`; least recently used pages (by file
+mtime, refreshed on every hit) are evicted first.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+BODY_SUFFIX = '.gz'
+META_SUFFIX = '.json'
+
+
+class PageCache:
+    """
+    Compressed, size-capped LRU cache of raw API pages.
+
+    Safe to share between fetch threads: every page has its own files,
+    written atomically, and eviction is serialised by a lock.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Size cap for the cached files
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None  # Running estimate, recomputed on eviction
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Dict) -> str:
+        """Stable cache key of a page request."""
+        request = json.dumps([url, sorted(params.items())], default=str)
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the metadata of a cached page, or None."""
+        try:
+            with open(self._path(key, META_SUFFIX), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self, key: str) -> Optional[bytes]:
+        """
+        Return the decompressed body of a cached page, or None if it was
+        evicted. Marks the page as recently used.
+        """
+        path = self._path(key, BODY_SUFFIX)
+        try:
+            with gzip.open(path, 'rb') as f:
+                body = f.read()
+        except (OSError, EOFError):
+            return None
+        self._touch(key)
+        return body
+
+    def put(self, key: str, body: bytes, meta: Dict):
+        """
+        Store a downloaded page, replacing any previous version.
+
+        Args:
+            key: Cache key from PageCache.key
+            body: Raw response body
+            meta: Page metadata; 'committed' is reset to False
+        """
+        meta = {
+            **meta,
+            'committed': False,
+            'storedAt': timezone.now().isoformat(),
+        }
+        written = self._write(
+            self._path(key, BODY_SUFFIX), gzip.compress(body, 6)
+        )
+        written += self._write(
+            self._path(key, META_SUFFIX),
+            json.dumps(meta).encode('utf-8')
+        )
+
+        with self._lock:
+            if self._size is not None:
+                self._size += written
+            if self._size is None or self._size > self.max_bytes:
+                self._evict()
+
+    def mark_committed(self, key: str):
+        """Record that the page's records were written to the database."""
+        meta = self.get(key)
+        if meta is None or meta.get('committed'):
+            return
+        meta['committed'] = True
+        self._write(
+            self._path(key, META_SUFFIX),
+            json.dumps(meta).encode('utf-8')
+        )
+
+    def _write(self, path: str, data: bytes) -> int:
+        """
+        Write a file atomically (readers never see a partial file).
+
+        Returns:
+            Number of bytes written
+        """
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    def _touch(self, key: str):
+        for suffix in (BODY_SUFFIX, META_SUFFIX):
+            try:
+                os.utime(self._path(key, suffix))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """
+        Measure the cache directory and delete least recently used pages
+        until it is under max_bytes. Caller holds self._lock.
+
+        The directory is only scanned when the running size estimate
+        crosses the cap, not on every put.
+        """
+        pages = {}
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                key = entry.name.rsplit('.', 1)[0]
+                size, used = pages.get(key, (0, 0))
+                pages[key] = (size + stat.st_size, max(used, stat.st_mtime))
+                total += stat.st_size
+
+        evicted = 0
+        for key, (size, _) in sorted(pages.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            for suffix in (BODY_SUFFIX, META_SUFFIX):
+                try:
+                    os.remove(self._path(key, suffix))
+                except OSError:
+                    pass
+            total -= size
+            evicted += 1
+
+        self._size = total
+        if evicted:
+            logger.info(
+                f"Evicted {evicted} cached page(s); cache now {total} bytes"
+            )
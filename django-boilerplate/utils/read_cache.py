@@ -0,0 +1,190 @@
+"""
+Read Cache with Stampede Protection
+-----------------------------------
+Caches the responses of the MGNREGA read endpoints so that a hot key
+expiring, or every key changing after a sync (utils.data_version),
+does not send every concurrent request to the database at once.
+
+- Single flight: on a miss, one request takes a short lock (cache.add,
+  SET NX on Redis) and recomputes; the others serve the stale value if
+  there is one, or briefly wait for the fresh one. If the lock cannot be
+  taken at all (cache backend down), the request just recomputes.
+- Stale-while-revalidate: entries outlive their TTL by a grace period,
+  and the last value of a versioned key is kept under an unversioned
+  "latest" key, so there is usually something to serve while one
+  request recomputes.
+- Probabilistic early expiry (XFetch): a request may recompute before
+  the TTL is up, more likely the closer the expiry and the slower the
+  recompute, so hot keys are usually refreshed before they expire.
+- Negative caching: with a negative TTL, 404 responses (e.g. no data
+  for the period yet) are cached briefly too, so repeated misses do not
+  each go to the database. They are never kept as stale values.
+
+Usage:
+    return cached_response(key, lambda: Response(build()))
+
+store_response() fills a key unconditionally, for warming the cache
+ahead of the first request after a sync.
+"""
+
+import logging
+import math
+import random
+import time
+import uuid
+from typing import Callable, Optional
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from utils.data_version import cache_ttl
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = 'mgnrega:recompute:'
+LOCK_TTL = 10         # Longest a recompute may hold its key's lock (seconds)
+WAIT_SECONDS = 2.0    # Longest a request waits for another's recompute
+POLL_SECONDS = 0.05
+XFETCH_BETA = 1.0     # > 1 refreshes earlier, < 1 later
+
+
+def _early_refresh(entry: dict) -> bool:
+    """
+    XFetch: True when this request should recompute ahead of expiry.
+
+    -log(U) is exponentially distributed, so the earlier than
+    `expiresAt` a refresh fires is proportional to the recompute time.
+    """
+    jitter = -entry['delta'] * XFETCH_BETA * math.log(1.0 - random.random())
+    return time.time() + jitter >= entry['expiresAt']
+
+
+def _store(key: str, stale_key: Optional[str], response: Response, delta: float, ttl: int):
+    entry = {
+        'value': response.data,
+        'status': response.status_code,
+        'expiresAt': time.time() + ttl,
+        'delta': delta,
+    }
+    # Expired entries stay readable for another TTL as stale values
+    cache.set(key, entry, ttl * 2)
+    if stale_key and response.status_code == 200:
+        cache.set(stale_key, entry, ttl * 2)
+
+
+def _response(entry: dict) -> Response:
+    return Response(entry['value'], status=entry.get('status', 200))
+
+
+def _acquire(lock_name: str) -> Optional[str]:
+    """
+    Take the recompute lock; returns its token, None if held, or ''
+    if the lock is unavailable (recompute without it).
+    """
+    token = uuid.uuid4().hex
+    try:
+        return token if cache.add(lock_name, token, LOCK_TTL) else None
+    except Exception as e:
+        logger.warning(f"Recompute lock unavailable, computing unlocked: {e}")
+        return ''
+
+
+def _release(lock_name: str, token: str):
+    """Drop the recompute lock if it is still ours."""
+    try:
+        if cache.get(lock_name) == token:
+            cache.delete(lock_name)
+    except Exception as e:
+        # It expires after LOCK_TTL anyway
+        logger.warning(f"Could not release recompute lock {lock_name}: {e}")
+
+
+def cached_response(
+    key: str,
+    compute: Callable[[], Response],
+    stale_key: Optional[str] = None,
+    ttl: Optional[int] = None,
+    negative_ttl: Optional[int] = None
+) -> Response:
+    """
+    Serve a cached response, recomputing it at most once at a time.
+
+    200 responses are cached, and 404 responses when `negative_ttl` is
+    given; other error responses are returned as is.
+
+    Args:
+        key: Cache key (usually from utils.data_version.versioned_key)
+        compute: Builds the response on a miss
+        stale_key: Key keeping the last value across versions, served
+            while the current version is recomputed
+        ttl: Seconds the value is fresh (default: MGNREGA_CACHE_TTL)
+        negative_ttl: Seconds a 404 response is cached (default: not
+            cached; see utils.data_version.negative_cache_ttl)
+
+    Returns:
+        Response
+    """
+    ttl = ttl or cache_ttl()
+    entry = cache.get(key)
+    if entry is not None and not _early_refresh(entry):
+        return _response(entry)
+
+    lock_name = LOCK_PREFIX + key
+    token = _acquire(lock_name)
+    if token is None:
+        # Someone else is recomputing: serve what we have, or wait
+        stale = entry if entry is not None else (
+            cache.get(stale_key) if stale_key else None
+        )
+        if stale is not None:
+            return _response(stale)
+
+        deadline = time.monotonic() + WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(POLL_SECONDS)
+            entry = cache.get(key)
+            if entry is not None:
+                return _response(entry)
+        logger.warning(f"Timed out waiting for recompute of {key}")
+
+    try:
+        started = time.monotonic()
+        response = compute()
+        delta = time.monotonic() - started
+        if response.status_code == 200:
+            _store(key, stale_key, response, delta, ttl)
+        elif response.status_code == 404 and negative_ttl:
+            _store(key, None, response, delta, negative_ttl)
+        return response
+    finally:
+        if token:
+            _release(lock_name, token)
+
+
+def store_response(
+    key: str,
+    compute: Callable[[], Response],
+    stale_key: Optional[str] = None,
+    ttl: Optional[int] = None
+) -> bool:
+    """
+    Compute a response and cache it, whether or not it is cached already.
+
+    Used to warm the cache after a sync (mgnrega.tasks); takes no lock,
+    as the warming task is the only writer of keys nobody has read yet.
+
+    Args:
+        key: Cache key, as for cached_response
+        compute: Builds the response
+        stale_key: Key keeping the last value across versions
+        ttl: Seconds the value is fresh (default: MGNREGA_CACHE_TTL)
+
+    Returns:
+        True if the response was cached (only 200 responses are)
+    """
+    started = time.monotonic()
+    response = compute()
+    if response.status_code != 200:
+        return False
+    _store(key, stale_key, response, time.monotonic() - started, ttl or cache_ttl())
+    return True
@@ -0,0 +1,246 @@
+"""
+State-Period Aggregates
+-----------------------
+Maintains StatePeriodAggregate: per state, year and month, the average,
+sum, min, max and percentiles of every Performance metric over the
+state's districts.
+
+Summary requests read the state averages with one indexed lookup
+instead of aggregating all of a state's districts per request. After a
+sync, only the state-periods whose rows were created or updated are
+rebuilt: those are found from Performance.updatedAt, which unchanged
+rows keep on both write backends.
+
+Percentiles are computed in Python (linear interpolation, like
+PostgreSQL's percentile_cont) so the same code runs on SQLite; a
+state-period is at most a few hundred values.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+
+from mgnrega.models import Performance, StatePeriodAggregate
+
+logger = logging.getLogger(__name__)
+
+# Performance metric -> StatePeriodAggregate average field
+AVERAGE_FIELDS = {
+    'personDays': 'avgPersonDays',
+    'householdsWorked': 'avgHouseholdsWorked',
+    'totalWages': 'avgTotalWages',
+    'materialExpenditure': 'avgMaterialExpenditure',
+}
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Periods read per query while rebuilding, bounding memory use
+PERIODS_PER_QUERY = 24
+
+StatePeriod = Tuple[str, int, int]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile of sorted `values`.
+
+    Args:
+        values: Non-empty, sorted values
+        pct: Percentile (0-100)
+    """
+    position = (len(values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(values: List[float]) -> Dict:
+    """
+    Return sum, avg, min, max and PERCENTILES of non-empty `values`.
+    """
+    values.sort()
+    total = sum(values)
+    summary = {
+        'sum': round(total, 2),
+        'avg': round(total / len(values), 2),
+        'min': values[0],
+        'max': values[-1],
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}'] = round(percentile(values, pct), 2)
+    return summary
+
+
+def touched_state_periods(since: datetime) -> Set[StatePeriod]:
+    """
+    State-periods with Performance rows created or updated since `since`.
+    """
+    return set(
+        Performance.objects.filter(updatedAt__gte=since).values_list(
+            'districtId__state', 'year', 'month'
+        ).distinct()
+    )
+
+
+def all_state_periods(state: Optional[str] = None) -> Set[StatePeriod]:
+    """Every state-period with Performance rows (optionally one state)."""
+    queryset = Performance.objects.all()
+    if state:
+        queryset = queryset.filter(districtId__state=state)
+    return set(
+        queryset.values_list('districtId__state', 'year', 'month').distinct()
+    )
+
+
+def moved_state_periods(previous_states: Dict[int, str]) -> Set[StatePeriod]:
+    """
+    State-periods of districts moved to another state, under both states.
+
+    Args:
+        previous_states: District id -> state before the move (the
+            District rows already hold the new state)
+    """
+    state_periods = set()
+    for district_id, state, year, month in (
+        Performance.objects.filter(districtId__in=previous_states).values_list(
+            'districtId', 'districtId__state', 'year', 'month'
+        ).distinct()
+    ):
+        state_periods.add((state, year, month))
+        state_periods.add((previous_states[district_id], year, month))
+    return state_periods
+
+
+def rebuild_state_aggregates(state_periods: Iterable[StatePeriod]) -> int:
+    """
+    Recompute the aggregates of the given state-periods.
+
+    Rows are read PERIODS_PER_QUERY periods at a time and the aggregates
+    bulk upserted; state-periods left without performance data lose
+    their aggregate.
+
+    Args:
+        state_periods: (state, year, month) tuples
+
+    Returns:
+        Number of aggregates written
+    """
+    states_by_period = defaultdict(set)
+    for state, year, month in state_periods:
+        states_by_period[(year, month)].add(state)
+    periods = sorted(states_by_period)
+
+    written = 0
+    metrics = tuple(AVERAGE_FIELDS)
+    for start in range(0, len(periods), PERIODS_PER_QUERY):
+        chunk = periods[start:start + PERIODS_PER_QUERY]
+
+        period_filter = Q()
+        for year, month in chunk:
+            period_filter |= Q(
+                year=year,
+                month=month,
+                districtId__state__in=states_by_period[(year, month)]
+            )
+
+        values = defaultdict(lambda: defaultdict(list))
+        for state, year, month, *row in (
+            Performance.objects.filter(period_filter).values_list(
+                'districtId__state', 'year', 'month', *metrics
+            ).iterator(chunk_size=5000)
+        ):
+            group = values[(state, year, month)]
+            for metric, value in zip(metrics, row):
+                group[metric].append(float(value))
+
+        aggregates = [
+            _build_aggregate(key, group) for key, group in values.items()
+        ]
+        emptied = Q()
+        for year, month in chunk:
+            for state in states_by_period[(year, month)]:
+                if (state, year, month) not in values:
+                    emptied |= Q(state=state, year=year, month=month)
+
+        with transaction.atomic():
+            if aggregates:
+                StatePeriodAggregate.objects.bulk_create(
+                    aggregates,
+                    update_conflicts=True,
+                    unique_fields=['state', 'year', 'month'],
+                    update_fields=[
+                        'districtCount',
+                        *AVERAGE_FIELDS.values(),
+                        'distribution',
+                        'updatedAt'
+                    ]
+                )
+            if emptied:
+                StatePeriodAggregate.objects.filter(emptied).delete()
+        written += len(aggregates)
+
+    return written
+
+
+def refresh_state_aggregates(since: datetime) -> Set[StatePeriod]:
+    """
+    Rebuild the aggregates of state-periods written since `since`.
+
+    Args:
+        since: Start of the sync run
+
+    Returns:
+        The state-periods rebuilt
+    """
+    state_periods = touched_state_periods(since)
+    if state_periods:
+        written = rebuild_state_aggregates(state_periods)
+        logger.info(f"Rebuilt {written} state-period aggregates")
+    return state_periods
+
+
+def get_state_averages(state: str, year: int, month: int) -> Dict:
+    """
+    State averages of each metric for one period.
+
+    Reads StatePeriodAggregate by its unique key; a missing aggregate
+    (e.g. data loaded before aggregates existed) is built on first use.
+
+    Returns:
+        Dict mapping metric name to the state average (None when the
+        state has no data for the period)
+    """
+    lookup = {'state': state, 'year': year, 'month': month}
+    averages = StatePeriodAggregate.objects.filter(**lookup).values(
+        *AVERAGE_FIELDS.values()
+    ).first()
+
+    if averages is None:
+        rebuild_state_aggregates([(state, year, month)])
+        averages = StatePeriodAggregate.objects.filter(**lookup).values(
+            *AVERAGE_FIELDS.values()
+        ).first() or {}
+
+    return {
+        metric: averages.get(field)
+        for metric, field in AVERAGE_FIELDS.items()
+    }
+
+
+def _build_aggregate(key: StatePeriod, group: Dict[str, List[float]]) -> StatePeriodAggregate:
+    state, year, month = key
+    distribution = {metric: summarize(group[metric]) for metric in AVERAGE_FIELDS}
+    return StatePeriodAggregate(
+        state=state,
+        year=year,
+        month=month,
+        districtCount=len(group['personDays']),
+        distribution=distribution,
+        **{
+            field: distribution[metric]['avg']
+            for metric, field in AVERAGE_FIELDS.items()
+        }
+    )
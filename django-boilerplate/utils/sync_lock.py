@@ -0,0 +1,228 @@
+"""
+Sync Lease Lock
+---------------
+Redis-backed lease lock that keeps MGNREGA sync runs from overlapping.
+
+The lock is a single Redis key set with SET NX PX. Its value (the
+"lease") identifies the holder - a random token plus owner, host, pid
+and acquisition time - and is only extended or deleted by whoever holds
+that exact lease (compare-and-set in Lua). While held, a heartbeat
+thread keeps extending the TTL; if the holder dies, the lease expires
+after MGNREGA_SYNC_LOCK_TTL seconds and the next run can start.
+
+A lease can be handed over between processes: a partitioned sync
+acquires it when dispatching, each partition task heartbeats it while
+running, and the chord callback releases it. Partitions waiting in the
+queue or for a retry are covered by extending the lease ahead of time;
+an extension never shortens the lease, so one partition's heartbeat
+does not cut short the time another one reserved for its retry.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOCK_NAME = 'mgnrega:sync'
+DEFAULT_TTL = 300
+
+# Extend (never shorten) / delete the key only if it still holds our lease
+EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    if redis.call('pttl', KEYS[1]) < tonumber(ARGV[2]) then
+        redis.call('pexpire', KEYS[1], ARGV[2])
+    end
+    return 1
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SyncLock:
+    """
+    Lease lock around a sync run.
+
+    Usage:
+        lock = SyncLock(owner='manage.py fetch_mgnrega_data')
+        if not lock.acquire():
+            print(lock.holder())
+            return
+        try:
+            ...
+        finally:
+            lock.release()
+    """
+
+    def __init__(
+        self,
+        name: str = SYNC_LOCK_NAME,
+        owner: Optional[str] = None,
+        lease: Optional[str] = None,
+        ttl: Optional[int] = None
+    ):
+        """
+        Args:
+            name: Lock name
+            owner: Human-readable owner shown to other invocations
+            lease: Lease of an already acquired lock to adopt
+            ttl: Lease TTL in seconds
+                (defaults to settings.MGNREGA_SYNC_LOCK_TTL)
+        """
+        self.key = f"lock:{name}"
+        self.owner = owner or 'unknown'
+        self.lease = lease
+        self.ttl = ttl or getattr(settings, 'MGNREGA_SYNC_LOCK_TTL', DEFAULT_TTL)
+        self.lost = False
+        self._redis = get_redis_connection('default')
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+    def acquire(
+        self,
+        blocking: bool = False,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0
+    ) -> bool:
+        """
+        Try to take the lock and start the heartbeat.
+
+        Args:
+            blocking: Wait for the current holder instead of giving up
+            timeout: Maximum seconds to wait when blocking (None = forever)
+            poll_interval: Seconds between attempts when blocking
+
+        Returns:
+            True if the lock was acquired
+        """
+        lease = json.dumps({
+            'token': uuid.uuid4().hex,
+            'owner': self.owner,
+            'host': socket.gethostname(),
+            'pid': os.getpid(),
+            'acquiredAt': timezone.now().isoformat(),
+        })
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if self._redis.set(self.key, lease, nx=True, px=self.ttl * 1000):
+                self.lease = lease
+                self.lost = False
+                self.start_heartbeat()
+                logger.info(f"Acquired sync lock {self.key} ({self.owner})")
+                return True
+
+            if not blocking:
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+
+    def extend(self, ttl: Optional[float] = None) -> bool:
+        """
+        Make the lease live at least `ttl` more seconds (default: the
+        lock's TTL); False if the lease is no longer ours.
+        """
+        if self.lease is None:
+            return False
+        return bool(self._redis.eval(
+            EXTEND_SCRIPT, 1, self.key, self.lease, int((ttl or self.ttl) * 1000)
+        ))
+
+    def release(self) -> bool:
+        """Stop the heartbeat and delete the lock if we still hold it."""
+        self.stop_heartbeat()
+        if self.lease is None:
+            return False
+
+        released = bool(self._redis.eval(RELEASE_SCRIPT, 1, self.key, self.lease))
+        if released:
+            logger.info(f"Released sync lock {self.key} ({self.owner})")
+        else:
+            logger.warning(f"Sync lock {self.key} expired before release")
+        self.lease = None
+        return released
+
+    def start_heartbeat(self):
+        """Extend the lease every ttl/3 seconds from a daemon thread."""
+        if self._heartbeat is not None:
+            return
+        self._stop.clear()
+        self._heartbeat = threading.Thread(
+            target=self._beat,
+            name=f"heartbeat:{self.key}",
+            daemon=True
+        )
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        """Stop extending the lease (it then expires after its TTL)."""
+        if self._heartbeat is None:
+            return
+        self._stop.set()
+        self._heartbeat.join()
+        self._heartbeat = None
+
+    def _beat(self):
+        while not self._stop.wait(self.ttl / 3):
+            try:
+                if not self.extend():
+                    self.lost = True
+                    logger.error(
+                        f"Lost sync lock {self.key}; another run may start"
+                    )
+                    return
+            except Exception as e:
+                # Keep trying: the lease survives short Redis blips
+                logger.warning(f"Sync lock heartbeat failed: {e}")
+
+    def holder(self) -> Optional[Dict]:
+        """
+        Describe the current holder of the lock.
+
+        Returns:
+            Dict with owner, host, pid, acquiredAt and expiresIn
+            (seconds), or None when the lock is free
+        """
+        pipe = self._redis.pipeline()
+        pipe.get(self.key)
+        pipe.pttl(self.key)
+        lease, pttl = pipe.execute()
+        if lease is None:
+            return None
+
+        try:
+            info = json.loads(lease)
+        except ValueError:
+            info = {}
+        info.pop('token', None)
+        info['expiresIn'] = round(pttl / 1000, 1) if pttl and pttl > 0 else None
+        return info
+
+
+def sync_lock_status() -> Dict:
+    """
+    Lock state for monitoring (see /api/health/).
+
+    Returns:
+        Dict with 'locked' and, when locked, the holder details
+    """
+    holder = SyncLock().holder()
+    if holder is None:
+        return {'locked': False}
+    return {'locked': True, **holder}
@@ -0,0 +1,177 @@
+"""
+Sync Run Metrics
+----------------
+Per-run timing and throughput metrics for MGNREGA sync runs, stored on
+APIStatus.syncMetrics so slow runs can be compared run over run.
+
+A run records:
+- wall time, and the time spent in each stage: fetch (waiting for the
+  next page or file batch), validate, write (bulk upserts and
+  dead-letters), checkpoint and aggregate (rebuilding state-period
+  aggregates)
+- records received and records per second
+- bytes and pages downloaded, pages skipped as not modified (304) and
+  pages replayed from the page cache
+- SQL statements issued on the run's database connection
+- peak resident memory of the process
+- retries (resumes of the run after a failure)
+
+A resumed run continues from the metrics of its earlier attempts, so
+the stored figures always cover the whole run.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional
+
+from django.db import connection
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+STAGES = ('fetch', 'validate', 'write', 'checkpoint', 'aggregate')
+COUNTERS = (
+    'records',
+    'bytesDownloaded',
+    'pagesDownloaded',
+    'pagesNotModified',
+    'pagesFromCache',
+    'dbStatements',
+    'retries',
+)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process in MB.
+
+    This is the process high-water mark, so in a long-lived worker it
+    can include earlier tasks. None where unsupported.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+class SyncMetrics:
+    """
+    Timing and throughput metrics of one sync run.
+
+    Counters may be incremented from fetch threads; stages are timed on
+    the thread driving the run.
+
+    Usage:
+        metrics = SyncMetrics()
+        with metrics.track_queries():
+            for batch in metrics.timed(batches(), 'fetch'):
+                with metrics.stage('validate'):
+                    ...
+        metrics.summary()
+    """
+
+    def __init__(self):
+        self.wall_seconds = 0.0
+        self.stages: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.counters: Dict[str, int] = {counter: 0 for counter in COUNTERS}
+        self.peak_rss_mb = None
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_summary(cls, summary: Optional[Dict]) -> 'SyncMetrics':
+        """Rebuild metrics from summary() output (e.g. on resume)."""
+        metrics = cls()
+        if summary:
+            metrics.wall_seconds = summary.get('wallSeconds', 0.0)
+            for stage, seconds in summary.get('stages', {}).items():
+                metrics.stages[stage] = seconds
+            for counter in COUNTERS:
+                metrics.counters[counter] = summary.get(counter, 0)
+            metrics.peak_rss_mb = summary.get('peakRssMb')
+        return metrics
+
+    def count(self, counter: str, amount: int = 1):
+        """Increment a counter (thread-safe)."""
+        with self._lock:
+            self.counters[counter] += amount
+
+    @contextmanager
+    def stage(self, name: str):
+        """Add the wall time of the block to a stage."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.stages[name] += time.monotonic() - started
+
+    def timed(self, iterable: Iterable, name: str) -> Iterator:
+        """
+        Iterate over `iterable`, adding the time spent producing each
+        item to a stage. Time spent by the consumer is not counted.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    @contextmanager
+    def track_queries(self):
+        """Count SQL statements issued on this thread's connection."""
+        def counter(execute, sql, params, many, context):
+            self.count('dbStatements')
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(counter):
+            yield
+
+    def merge(self, other: 'SyncMetrics'):
+        """
+        Fold another run's metrics into this one (e.g. partition runs).
+
+        Stage times and counters are summed; wall time is not, since
+        partitions run in parallel. Peak memory is the highest of the
+        two.
+        """
+        for stage, seconds in other.stages.items():
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        for counter, value in other.counters.items():
+            self.count(counter, value)
+        if other.peak_rss_mb is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0, other.peak_rss_mb)
+
+    def elapsed(self) -> float:
+        """Wall seconds of the run so far, including earlier attempts."""
+        return self.wall_seconds + time.monotonic() - self._started
+
+    def summary(self) -> Dict:
+        """JSON-serialisable summary (stored on APIStatus.syncMetrics)."""
+        elapsed = self.elapsed()
+        rss = peak_rss_mb()
+        if rss is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0, rss)
+
+        return {
+            'wallSeconds': round(elapsed, 3),
+            'stages': {
+                stage: round(seconds, 3)
+                for stage, seconds in self.stages.items()
+            },
+            'recordsPerSecond': (
+                round(self.counters['records'] / elapsed, 1)
+                if elapsed > 0 else None
+            ),
+            **self.counters,
+            'peakRssMb': self.peak_rss_mb,
+        }
@@ -0,0 +1,227 @@
+"""
+Synthetic MGNREGA Data
+----------------------
+Deterministic synthetic districts and monthly performance records, shaped
+like the data.gov.in MGNREGA resource, for benchmarks and local testing.
+
+Districts are spread over the states in proportion to their real
+number of districts (741 in total at national scale). Records follow
+each state's performance pattern and the MGNREGA season, with rare
+outlier months (spikes and collapses) like the real data has.
+
+Records are generated on demand from (seed, district code, year, month),
+so any record can be produced without materialising the dataset and
+the same seed always yields the same values. A national-scale dataset
+(741 districts x 18 years) is about 160k records.
+
+This module has no Django dependency, so the fake data.gov.in server
+(utils.mgnrega_fake_api) can run standalone.
+"""
+
+import hashlib
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# (state, code prefix, performance pattern, number of districts)
+STATES = (
+    ('Andhra Pradesh', 'AP', 'good', 26),
+    ('Arunachal Pradesh', 'AR', 'average', 26),
+    ('Assam', 'AS', 'average', 35),
+    ('Bihar', 'BR', 'poor', 38),
+    ('Chhattisgarh', 'CG', 'average', 33),
+    ('Goa', 'GA', 'good', 2),
+    ('Gujarat', 'GJ', 'excellent', 33),
+    ('Haryana', 'HR', 'good', 22),
+    ('Himachal Pradesh', 'HP', 'good', 12),
+    ('Jharkhand', 'JH', 'poor', 24),
+    ('Karnataka', 'KA', 'excellent', 31),
+    ('Kerala', 'KL', 'excellent', 14),
+    ('Madhya Pradesh', 'MP', 'average', 55),
+    ('Maharashtra', 'MH', 'good', 36),
+    ('Manipur', 'MN', 'average', 16),
+    ('Meghalaya', 'ML', 'average', 12),
+    ('Mizoram', 'MZ', 'average', 11),
+    ('Nagaland', 'NL', 'poor', 16),
+    ('Odisha', 'OD', 'average', 30),
+    ('Punjab', 'PB', 'good', 23),
+    ('Rajasthan', 'RJ', 'very_poor', 50),
+    ('Sikkim', 'SK', 'good', 6),
+    ('Tamil Nadu', 'TN', 'excellent', 38),
+    ('Telangana', 'TS', 'good', 33),
+    ('Tripura', 'TR', 'average', 8),
+    ('Uttar Pradesh', 'UP', 'poor', 75),
+    ('Uttarakhand', 'UK', 'average', 13),
+    ('West Bengal', 'WB', 'average', 23),
+)
+
+NATIONAL_DISTRICTS = sum(state[3] for state in STATES)
+NATIONAL_YEARS = 18
+FIRST_YEAR = 2006  # MGNREGA started in 2006
+
+# Size presets: district count, optional state subset and years of
+# history (None = FIRST_YEAR to the current month)
+SCALES = {
+    'small': {'districts': 40, 'states': None, 'years': 3},
+    'state': {'districts': 75, 'states': ('Uttar Pradesh',), 'years': None},
+    'national': {'districts': NATIONAL_DISTRICTS, 'states': None, 'years': None},
+    'stress': {'districts': NATIONAL_DISTRICTS * 5, 'states': None, 'years': None},
+}
+
+# Share of district-months that are outliers, and their metric factors
+OUTLIER_RATE = 0.01
+OUTLIER_SPIKE = (2.5, 4.0)  # e.g. drought relief works
+OUTLIER_DIP = (0.02, 0.3)   # e.g. fund freeze or late reporting
+
+# Share of potential work actually provided: (base, variance)
+PATTERNS = {
+    'excellent': (0.90, 0.08),
+    'good': (0.75, 0.10),
+    'average': (0.60, 0.12),
+    'poor': (0.45, 0.10),
+    'very_poor': (0.30, 0.08),
+}
+STATE_PATTERNS = {state[0]: state[2] for state in STATES}
+
+
+def synthetic_districts(
+    count: int,
+    seed: int = 0,
+    prefix: str = 'SYN',
+    states: Optional[Sequence[str]] = None
+) -> List[Dict]:
+    """
+    Generate `count` districts, spread over the states in proportion to
+    their real number of districts.
+
+    Args:
+        count: Number of districts
+        seed: Random seed (same seed, same districts)
+        prefix: Code prefix, so synthetic codes never clash with real
+            ones (codes look like 'SYN-BR-0042')
+        states: Only generate districts of these states
+
+    Returns:
+        List of dicts with name, code, state, population, lat and lon
+    """
+    pool = [state for state in STATES if not states or state[0] in states]
+    if not pool:
+        raise ValueError(f"No known state among {states}")
+    bounds = list(accumulate(state[3] for state in pool))
+
+    rng = random.Random(seed)
+    per_state = {}
+    districts = []
+    for index in range(count):
+        state, state_code, _, _ = pool[
+            bisect_right(bounds, index * bounds[-1] // count)
+        ]
+        per_state[state] = per_state.get(state, 0) + 1
+        districts.append({
+            'name': f"{state} District {per_state[state]}",
+            'code': f"{prefix}-{state_code}-{index:04d}",
+            'state': state,
+            'population': rng.randint(300_000, 5_000_000),
+            # Rough bounding box of India
+            'lat': round(rng.uniform(8.0, 34.0), 7),
+            'lon': round(rng.uniform(69.0, 97.0), 7),
+        })
+    return districts
+
+
+def synthetic_periods(
+    start_year: int,
+    years: int,
+    until: Optional[Tuple[int, int]] = None
+) -> List[Tuple[int, int]]:
+    """
+    All (year, month) periods of `years` calendar years, optionally
+    stopping at the `until` (year, month) period.
+    """
+    return [
+        (year, month)
+        for year in range(start_year, start_year + years)
+        for month in range(1, 13)
+        if until is None or (year, month) <= until
+    ]
+
+
+def synthetic_record(district: Dict, year: int, month: int, seed: int = 0) -> Dict:
+    """
+    Generate one monthly performance record in the API's format.
+
+    Values scale with population, follow the state's performance
+    pattern and the MGNREGA season (work peaks after the monsoon).
+    About OUTLIER_RATE of district-months are spikes or collapses.
+
+    Args:
+        district: District dict from synthetic_districts
+        year: Year
+        month: Month (1-12)
+        seed: Random seed
+
+    Returns:
+        Record dict as served by data.gov.in
+    """
+    draw = _draws(f"{seed}:{district['code']}:{year}:{month}")
+    base, variance = PATTERNS[
+        STATE_PATTERNS.get(district['state'], 'average')
+    ]
+
+    if month in (6, 7, 8, 9):
+        seasonal = 0.92  # Monsoon dip
+    elif month in (10, 11, 12, 1):
+        seasonal = 1.08  # Post-monsoon peak
+    else:
+        seasonal = 1.0
+
+    ratio = base * seasonal + variance * (2 * next(draw) - 1)
+    ratio = max(0.15, min(0.98, ratio))
+    scale = (district.get('population') or 1_000_000) / 1_000_000 * ratio
+
+    if next(draw) < OUTLIER_RATE:
+        low, high = OUTLIER_SPIKE if next(draw) < 0.5 else OUTLIER_DIP
+        scale *= low + (high - low) * next(draw)
+
+    return {
+        'district_code': district['code'],
+        'district_name': district['name'],
+        'state_name': district['state'],
+        'year': year,
+        'month': month,
+        'person_days': int(_between(next(draw), 35_000, 55_000) * scale),
+        'households_worked': int(_between(next(draw), 4_000, 6_000) * scale),
+        'total_wages': f"{_between(next(draw), 17_000_000, 28_000_000) * scale:.2f}",
+        'material_expenditure': f"{_between(next(draw), 8_000_000, 15_000_000) * scale:.2f}",
+    }
+
+
+def iter_synthetic_records(
+    districts: Sequence[Dict],
+    periods: Sequence[Tuple[int, int]],
+    seed: int = 0
+) -> Iterator[Dict]:
+    """
+    Yield a record for every period and district, in (year, month,
+    district) order like the upstream resource.
+    """
+    for year, month in periods:
+        for district in districts:
+            yield synthetic_record(district, year, month, seed)
+
+
+def _draws(key: str) -> Iterator[float]:
+    """
+    Uniform [0, 1) values derived from a hash of `key`.
+
+    Much cheaper than seeding a random.Random per record, and stable
+    across Python versions and platforms.
+    """
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=32).digest()
+    for start in range(0, len(digest), 4):
+        yield int.from_bytes(digest[start:start + 4], 'big') / 2 ** 32
+
+
+def _between(value: float, low: int, high: int) -> int:
+    return low + int(value * (high - low + 1))